@@ -1,3 +1,5 @@
+from typing import Any
+
 from shapely.geometry import (
     GeometryCollection,
     LineString,
@@ -8,30 +10,107 @@ from shapely.geometry import (
     Polygon,
 )
 
-from imxInsights.compare.changes import get_object_changes
+from imxInsights.compare.changes import (
+    Change,
+    get_object_changes,
+    get_unchanged_changes,
+)
 from imxInsights.compare.changeStatusEnum import ChangeStatusEnum
-from imxInsights.compare.geometryChange import GeometryChange
+from imxInsights.compare.custom_operators.diff_shapely import LineDiffTolerances
+from imxInsights.compare.geometryChange import (
+    GeometryChange,
+    GeometryChangeStatus,
+    classify_geometry_changes,
+)
 from imxInsights.domain.imxObject import ImxObject
 from imxInsights.utils.shapely.shapely_geojson import ShapelyGeoJsonFeature
 from imxInsights.utils.shapely.shapely_transform import ShapelyTransform
 
+ChangeRecord = tuple[dict[str, Change], GeometryChangeStatus]
+
+
+def get_property_changes(
+    t1_properties: dict[str, Any] | None,
+    t2_properties: dict[str, Any] | None,
+    line_diff_tolerances: LineDiffTolerances | None = None,
+) -> dict[str, Change]:
+    """Compare the flattened properties of two object versions.
+
+    Args:
+        t1_properties: The property dict of the first version, None if not present.
+        t2_properties: The property dict of the second version, None if not present.
+        line_diff_tolerances: The tolerances of the line coordinates differ. If None, the defaults are used.
+
+    Returns:
+        The changes by property key.
+    """
+    return get_object_changes(
+        *ChangedImxObject._add_missing_keys(
+            dict(t1_properties or {}), dict(t2_properties or {})
+        ),
+        line_diff_tolerances,
+    )
+
+
+def get_change_records(
+    pairs: list[tuple[dict | None, dict | None, Any, Any]],
+    line_diff_tolerances: LineDiffTolerances | None = None,
+) -> list[ChangeRecord]:
+    """Get the change record of every (t1 properties, t2 properties, t1 geometry, t2 geometry) pair.
+
+    Only plain dicts and shapely geometries are used, so records can be computed in other processes.
+    Geometry changes of all pairs are classified in one batch.
+    """
+    geometry_statuses = classify_geometry_changes(
+        [pair[2] for pair in pairs], [pair[3] for pair in pairs]
+    )
+    return [
+        (
+            get_property_changes(t1_properties, t2_properties, line_diff_tolerances),
+            geometry_status,
+        )
+        for (t1_properties, t2_properties, _, _), geometry_status in zip(
+            pairs, geometry_statuses
+        )
+    ]
+
 
 class ChangedImxObject:
-    def __init__(self, t1: ImxObject | None, t2: ImxObject | None):
+    def __init__(
+        self,
+        t1: ImxObject | None,
+        t2: ImxObject | None,
+        change_record: ChangeRecord | None = None,
+        geometry_status: GeometryChangeStatus | None = None,
+        line_diff_tolerances: LineDiffTolerances | None = None,
+    ):
         """Represents a changed IMX object by comparing two versions (t1 and t2).
 
         Args:
             t1: The first version of the IMX object.
             t2: The second version of the IMX object.
+            change_record: Changes computed before by get_change_records, the objects are not compared again.
+            geometry_status: Geometry change status classified before by classify_geometry_changes.
+            line_diff_tolerances: The tolerances of the line coordinates differ. If None, the defaults are used.
         """
         self.t1 = t1
         self.t2 = t2
         self.puic: str = self._get_puic()
 
-        t1_props, t2_props = self._prepare_properties()
-        self.changes = get_object_changes(t1_props, t2_props)
+        if change_record is not None:
+            self.changes, geometry_status = change_record
+        elif (
+            self.t1 is not None
+            and self.t2 is not None
+            and self.t1.content_fingerprint == self.t2.content_fingerprint
+        ):
+            # equal fingerprints means equal property dicts, there is nothing to diff
+            self.changes = get_unchanged_changes(self.t1.get_imx_property_dict())
+        else:
+            t1_props, t2_props = self._prepare_properties()
+            self.changes = get_object_changes(t1_props, t2_props, line_diff_tolerances)
         self.status = self._determine_object_overall_status()
-        self.geometry = self._initialize_geometry()
+        self.geometry = self._initialize_geometry(geometry_status)
 
     @property
     def tag(self) -> str:
@@ -77,10 +156,13 @@ class ChangedImxObject:
         else:
             return ChangeStatusEnum.CHANGED
 
-    def _initialize_geometry(self) -> GeometryChange | None:
+    def _initialize_geometry(
+        self, known_status: GeometryChangeStatus | None = None
+    ) -> GeometryChange | None:
         return GeometryChange(
             t1=self.t1.geometry if self.t1 else None,
             t2=self.t2.geometry if self.t2 else None,
+            known_status=known_status,
         )
 
     def get_change_dict(self, add_analyse: bool = False) -> dict[str, str]:
@@ -1,5 +1,6 @@
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from deepdiff import DeepDiff  # type: ignore
@@ -7,6 +8,7 @@ from deepdiff import DeepDiff  # type: ignore
 from imxInsights.compare.changeStatusEnum import ChangeStatusEnum
 from imxInsights.compare.custom_operators.diff_refs import UUIDListOperator
 from imxInsights.compare.custom_operators.diff_shapely import (
+    LineDiffTolerances,
     ShapelyLineDiffer,
     ShapelyPointDiffer,
 )
@@ -165,24 +167,204 @@ def process_deep_diff(dd: DeepDiff):
     return changes
 
 
+def get_unchanged_changes(dict1: dict[str, Any]) -> dict[str, Change]:
+    """
+    Returns unchanged `Change` records for all values of a dictionary.
+
+    Used for objects with equal content, the result is the same as comparing the dictionary to
+    itself without running a diff.
+
+    Args:
+        dict1: The dictionary of the unchanged object.
+
+    Returns:
+        A dictionary where keys represent the paths to the elements, and values are unchanged `Change` objects.
+    """
+    return {
+        key: Change(
+            status=ChangeStatusEnum.UNCHANGED,
+            t1=value,
+            t2=value,
+            diff_string=f"{value}",
+            analyse=None,
+        )
+        for key, value in flatten_dict(dict1).items()
+    }
+
+
+DEFAULT_LINE_DIFF_TOLERANCES = LineDiffTolerances()
+
+_UUID_LIST_OPERATOR = UUIDListOperator(regex_paths=[r"root\['.*Refs'\]$"])
+_POINT_DIFFER = ShapelyPointDiffer(
+    regex_paths=[r"root\['.*gml:Point.gml:coordinates'\]$"]
+)
+_POINT_COORDINATES_SUFFIX = "gml:Point.gml:coordinates"
+_LINE_COORDINATES_SUFFIX = "gml:LineString.gml:coordinates"
+
+
+@lru_cache
+def _get_line_differ(tolerances: LineDiffTolerances) -> ShapelyLineDiffer:
+    """Get the line differ of the given tolerances, a differ is created once per tolerances."""
+    return ShapelyLineDiffer(
+        regex_paths=[r"root\['.*gml:LineString.gml:coordinates'\]$"],
+        tolerances=tolerances,
+    )
+
+
+def _is_flat_dict(dictionary: dict[str, Any]) -> bool:
+    return not any(isinstance(value, dict | list) for value in dictionary.values())
+
+
+def _get_shapely_differ(
+    key: str, line_diff_tolerances: LineDiffTolerances
+) -> ShapelyPointDiffer | ShapelyLineDiffer | None:
+    if key.endswith(_POINT_COORDINATES_SUFFIX):
+        return _POINT_DIFFER
+    if key.endswith(_LINE_COORDINATES_SUFFIX):
+        return _get_line_differ(line_diff_tolerances)
+    return None
+
+
+def get_flat_dict_changes(
+    dict1: dict[str, Any],
+    dict2: dict[str, Any],
+    line_diff_tolerances: LineDiffTolerances | None = None,
+) -> dict[str, Change]:
+    """
+    Compares two flat dictionaries and returns the changes, the same as `get_object_changes`.
+
+    Walks the keys once and compares values directly, the custom operators are dispatched by key
+    suffix: UUID lists for keys ending on Refs and point and line coordinates for gml coordinates.
+    Changes are ordered as DeepDiff reports them, added, removed, type changes, changed and then
+    the unchanged values.
+
+    Args:
+        dict1: The first flat dictionary to compare.
+        dict2: The second flat dictionary to compare.
+        line_diff_tolerances: The tolerances of the line coordinates differ. If None, the defaults are used.
+
+    Returns:
+        A dictionary where keys represent the paths to changed elements,
+        and values are `Change` objects describing the type of change.
+    """
+    line_diff_tolerances = line_diff_tolerances or DEFAULT_LINE_DIFF_TOLERANCES
+    added: dict[str, Change] = {}
+    removed: dict[str, Change] = {}
+    type_changes: dict[str, Change] = {}
+    values_changed: dict[str, Change] = {}
+
+    for key, value in dict2.items():
+        if key not in dict1:
+            added[key] = Change(
+                status=ChangeStatusEnum.ADDED,
+                t1=None,
+                t2=value,
+                diff_string=f"++{value}",
+                analyse=None,
+            )
+
+    for key, t1 in dict1.items():
+        if key not in dict2:
+            removed[key] = Change(
+                status=ChangeStatusEnum.REMOVED,
+                t1=t1,
+                t2=None,
+                diff_string=f"--{t1}",
+                analyse=None,
+            )
+            continue
+
+        t2 = dict2[key]
+        if t1 is t2 or (type(t1) is type(t2) and t1 == t2):
+            continue
+
+        analyse = None
+        if key.endswith("Refs") and _UUID_LIST_OPERATOR.is_uuid_list_pair(t1, t2):
+            analyse = _UUID_LIST_OPERATOR.get_analyse(t1, t2)
+            if analyse is None:
+                continue
+        elif t1 is not None and t2 is not None:
+            shapely_differ = _get_shapely_differ(key, line_diff_tolerances)
+            if shapely_differ is not None:
+                analyse = shapely_differ.get_analyse(t1, t2)
+                if analyse is None:
+                    continue
+
+        if t1 is None:
+            type_changes[key] = Change(
+                status=ChangeStatusEnum.ADDED,
+                t1=None,
+                t2=t2,
+                diff_string=f"++{t2}",
+                analyse=None,
+            )
+        elif t2 is None:
+            type_changes[key] = Change(
+                status=ChangeStatusEnum.REMOVED,
+                t1=t1,
+                t2=None,
+                diff_string=f"--{t1}",
+                analyse=None,
+            )
+        elif analyse is None and type(t1) is not type(t2):
+            type_changes[key] = Change(
+                status=ChangeStatusEnum.TYPE_CHANGE,
+                t1=t1,
+                t2=t2,
+                diff_string=f"{t1} -> {t2}",
+                analyse=None,
+            )
+        else:
+            values_changed[key] = Change(
+                status=ChangeStatusEnum.CHANGED,
+                t1=t1,
+                t2=t2,
+                diff_string=f"{t1} -> {t2}",
+                analyse=analyse,
+            )
+
+    changes = added | removed | type_changes | values_changed
+
+    # we got the unchanged left
+    for key, change in get_unchanged_changes(dict1).items():
+        if key not in changes:
+            changes[key] = change
+
+    return changes
+
+
 def get_object_changes(
-    dict1: dict[str, Any], dict2: dict[str, Any]
+    dict1: dict[str, Any],
+    dict2: dict[str, Any],
+    line_diff_tolerances: LineDiffTolerances | None = None,
 ) -> dict[str, Change]:
     """
     Compares two dictionaries and returns a dictionary that shows differences,
     unchanged values, and changes between them.
 
-    Utilizes DeepDiff to perform the comparison and includes custom operators
-    to handle specific types like UUIDs and Shapely objects.
+    Flat dictionaries, like the imx property dicts, are compared by `get_flat_dict_changes`. Nested
+    dictionaries are compared by DeepDiff, both include custom operators to handle specific types
+    like UUIDs and Shapely objects.
 
     Args:
         dict1: The first dictionary to compare.
         dict2: The second dictionary to compare.
+        line_diff_tolerances: The tolerances of the line coordinates differ. If None, the defaults are used.
 
     Returns:
         A dictionary where keys represent the paths to changed elements,
         and values are `Change` objects describing the type of change.
     """
+    if _is_flat_dict(dict1) and _is_flat_dict(dict2):
+        return get_flat_dict_changes(dict1, dict2, line_diff_tolerances)
+    return _get_deep_diff_changes(dict1, dict2, line_diff_tolerances)
+
+
+def _get_deep_diff_changes(
+    dict1: dict[str, Any],
+    dict2: dict[str, Any],
+    line_diff_tolerances: LineDiffTolerances | None = None,
+) -> dict[str, Change]:
     # verbose should diff dicts in a list, make sure we set cutoff to 1
     dd = DeepDiff(
         dict1,
@@ -193,25 +375,16 @@ def get_object_changes(
         cutoff_intersection_for_pairs=1,
         report_repetition=True,
         custom_operators=[
-            UUIDListOperator(regex_paths=[r"root\['.*Refs'\]$"]),
-            ShapelyPointDiffer(regex_paths=[r"root\['.*gml:Point.gml:coordinates'\]$"]),
-            ShapelyLineDiffer(
-                regex_paths=[r"root\['.*gml:LineString.gml:coordinates'\]$"]
-            ),
+            _UUID_LIST_OPERATOR,
+            _POINT_DIFFER,
+            _get_line_differ(line_diff_tolerances or DEFAULT_LINE_DIFF_TOLERANCES),
         ],
     )
     changes = process_deep_diff(dd)
 
     # we got the unchanged left
-    flatten_dict_1 = flatten_dict(dict1)
-    for key, value in flatten_dict_1.items():
+    for key, change in get_unchanged_changes(dict1).items():
         if key not in changes:
-            changes[key] = Change(
-                status=ChangeStatusEnum.UNCHANGED,
-                t1=value,
-                t2=value,
-                diff_string=f"{value}",
-                analyse=None,
-            )
+            changes[key] = change
 
     return changes
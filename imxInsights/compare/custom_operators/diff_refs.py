@@ -39,25 +39,30 @@ class UUIDListOperator(BaseOperator):
         """
         return re.findall(UUIDv4_PATTERN, uuid_str)
 
-    def give_up_diffing(self, level: Any, diff_instance: Any) -> bool:
+    @staticmethod
+    def is_uuid_list_pair(t1: Any, t2: Any) -> bool:
         """
-        Compare two UUID strings (level.t1 and level.t2) and report:
-          - Order changes (same set of UUIDs, but different order)
-          - Genuine additions or removals of UUIDs.
+        Return True if both values are strings containing UUIDs, other values are diffed as usual.
+        """
+        return (
+            isinstance(t1, str)
+            and isinstance(t2, str)
+            and bool(UUIDv4_PATTERN.search(t1) and UUIDv4_PATTERN.search(t2))
+        )
 
-        Returns True if the difference has been reported.
+    def get_analyse(self, t1: str, t2: str) -> dict[str, Any] | None:
         """
-        # Ensure both items are strings containing UUIDs
-        if not (isinstance(level.t1, str) and isinstance(level.t2, str)):
-            return False
-        if not (UUIDv4_PATTERN.search(level.t1) and UUIDv4_PATTERN.search(level.t2)):
-            return False
-        elif level.t1 == level.t2:
-            return True
+        Compare two UUID strings and return the analyse of the difference.
 
+        Reports order changes (same set of UUIDs, but different order) and genuine additions or
+        removals of UUIDs.
+
+        Returns:
+            The analyse, or None if both strings contain the same UUIDs in the same order.
+        """
         # Extract UUIDs from both strings
-        old_uuids = self._split_uuids(level.t1)
-        new_uuids = self._split_uuids(level.t2)
+        old_uuids = self._split_uuids(t1)
+        new_uuids = self._split_uuids(t2)
 
         # Use sets to identify differences regardless of order
         old_set, new_set = set(old_uuids), set(new_uuids)
@@ -67,29 +72,19 @@ class UUIDListOperator(BaseOperator):
 
         # Case 1: The two lists have the same UUIDs, so any difference is just order.
         if not added and not removed:
-            if old_uuids != new_uuids:
-                diff_instance.custom_report_result("values_changed", level)
-
-                diff_instance.custom_report_result(
-                    "diff_analyse",
-                    level,
-                    {
-                        "type": "UUIDListOperator",
-                        "added": [],
-                        "removed": [],
-                        "unchanged": unchanged,
-                        "display": "order_changed",
-                        "status": "uuid_list_order_change",
-                    },
-                )
-            else:
+            if old_uuids == new_uuids:
                 # No differences at all
-                diff_instance.custom_report_result("values_unchanged", level, level.t1)
-            return True
+                return None
+            return {
+                "type": "UUIDListOperator",
+                "added": [],
+                "removed": [],
+                "unchanged": unchanged,
+                "display": "order_changed",
+                "status": "uuid_list_order_change",
+            }
 
         # Case 2: There are genuine additions and/or removals.
-        diff_instance.custom_report_result("values_changed", level)
-
         # Determine the status based on the differences
         if not removed:
             status = "uuid_list_only_added"
@@ -99,16 +94,31 @@ class UUIDListOperator(BaseOperator):
             status = "uuid_list_changed"
 
         display = " ".join(self._create_display(added, removed, unchanged))
-        diff_instance.custom_report_result(
-            "diff_analyse",
-            level,
-            {
-                "type": "UUIDListOperator",
-                "added": added,
-                "removed": removed,
-                "unchanged": unchanged,
-                "display": display,
-                "status": status,
-            },
-        )
+        return {
+            "type": "UUIDListOperator",
+            "added": added,
+            "removed": removed,
+            "unchanged": unchanged,
+            "display": display,
+            "status": status,
+        }
+
+    def give_up_diffing(self, level: Any, diff_instance: Any) -> bool:
+        """
+        Compare two UUID strings (level.t1 and level.t2) and report the difference.
+
+        Returns True if the difference has been reported.
+        """
+        # Ensure both items are strings containing UUIDs
+        if not self.is_uuid_list_pair(level.t1, level.t2):
+            return False
+        elif level.t1 == level.t2:
+            return True
+
+        analyse = self.get_analyse(level.t1, level.t2)
+        if analyse is None:
+            diff_instance.custom_report_result("values_unchanged", level, level.t1)
+        else:
+            diff_instance.custom_report_result("values_changed", level)
+            diff_instance.custom_report_result("diff_analyse", level, analyse)
         return True
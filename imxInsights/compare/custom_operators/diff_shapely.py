@@ -1,3 +1,8 @@
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import shapely
 from deepdiff import DeepDiff  # type: ignore
 from deepdiff.model import DiffLevel  # type: ignore
 from deepdiff.operator import BaseOperator  # type: ignore
@@ -5,6 +10,22 @@ from shapely import LineString, Point
 from shapely.geometry.base import BaseGeometry
 
 
+@dataclass(frozen=True)
+class LineDiffTolerances:
+    """
+    Tolerances used by the ShapelyLineDiffer, frozen so they can be part of a compare cache key.
+
+    Attributes:
+        almost_equal_tolerance: Coordinate tolerance for lines to be almost equal.
+        buffer_distance: Buffer distance of the lines for the intersection over union.
+        min_intersection_over_union: Lines with a lower intersection over union are changed.
+    """
+
+    almost_equal_tolerance: float = 1e-6
+    buffer_distance: float = 1.0
+    min_intersection_over_union: float = 0.98
+
+
 class ShapelyPointDiffer(BaseOperator):
     """
     Custom DeepDiff operator for comparing Shapely Point objects and
@@ -40,8 +61,25 @@ class ShapelyPointDiffer(BaseOperator):
         elif level.t1 == level.t2:
             return True
 
-        p1: Point = Point(level.t1.split(",")) if level.t1 else Point()
-        p2: Point = Point(level.t2.split(",")) if level.t2 else Point()
+        analyse = self.get_analyse(level.t1, level.t2)
+        if analyse is not None:
+            diff_instance.custom_report_result("values_changed", level)
+            diff_instance.custom_report_result("diff_analyse", level, analyse)
+        return True
+
+    def get_analyse(self, t1: str, t2: str) -> dict[str, Any] | None:
+        """
+        Compares two point coordinate strings and returns the analyse of the difference.
+
+        Args:
+            t1: The coordinates of the first point.
+            t2: The coordinates of the second point.
+
+        Returns:
+            The analyse, or None if the points are not changed.
+        """
+        p1: Point = Point(map(float, t1.split(","))) if t1 else Point()
+        p2: Point = Point(map(float, t2.split(","))) if t2 else Point()
         is_changed: bool = False
 
         # Check if XY coordinates are different
@@ -54,14 +92,11 @@ class ShapelyPointDiffer(BaseOperator):
         if self._is_z_different(z_distance):
             is_changed = True
 
-        # Report results if changes are detected
-        if is_changed:
-            almost_equal: bool = self._check_almost_equal(p1, p2)
-            self._report_differences(
-                diff_instance, level, almost_equal, xy_distance, z_distance
-            )
+        if not is_changed:
+            return None
 
-        return True
+        almost_equal: bool = self._check_almost_equal(p1, p2)
+        return self._get_differences(almost_equal, xy_distance, z_distance)
 
     def _calculate_xy_distance(self, p1: Point, p2: Point) -> float:
         """Calculate the planar XY distance between two points."""
@@ -91,36 +126,37 @@ class ShapelyPointDiffer(BaseOperator):
         """Check if the two points are almost equal."""
         return p1.equals_exact(p2, 1e-6)
 
-    def _report_differences(
+    def _get_differences(
         self,
-        diff_instance: DeepDiff,
-        level: DiffLevel,
         almost_equal: bool,
         xy_distance: float,
         z_distance: float | str,
-    ) -> None:
-        """Report the detected differences."""
-        diff_instance.custom_report_result("values_changed", level)
-        diff_instance.custom_report_result(
-            "diff_analyse",
-            level,
-            {
-                "type": "ShapelyPointDiffer",
-                "point_almost_equal": almost_equal,
-                "point_xy_distance": round(xy_distance, 3),
-                "point_z_distance": z_distance
-                if isinstance(z_distance, str)
-                else round(z_distance, 4),
-                "display": f"almost_equal: {almost_equal}\nplanar distance: {round(xy_distance, 3)}\nz_distance: {z_distance if isinstance(z_distance, str) else round(z_distance, 4)}",
-            },
-        )
+    ) -> dict[str, Any]:
+        """Get the analyse of the detected differences."""
+        return {
+            "type": "ShapelyPointDiffer",
+            "point_almost_equal": almost_equal,
+            "point_xy_distance": round(xy_distance, 3),
+            "point_z_distance": z_distance
+            if isinstance(z_distance, str)
+            else round(z_distance, 4),
+            "display": f"almost_equal: {almost_equal}\nplanar distance: {round(xy_distance, 3)}\nz_distance: {z_distance if isinstance(z_distance, str) else round(z_distance, 4)}",
+        }
 
 
 class ShapelyLineDiffer(BaseOperator):
-    """Deepdiff custom Shapely LineString differ."""
+    """
+    Deepdiff custom Shapely LineString differ.
 
-    def __init__(self, regex_paths: list[str]):
+    Lines are compared in tiers, the buffer intersection over union is only computed when the
+    vertex arrays and bounding boxes do not decide it.
+    """
+
+    def __init__(
+        self, regex_paths: list[str], tolerances: LineDiffTolerances | None = None
+    ):
         super().__init__(regex_paths)
+        self.tolerances = tolerances or LineDiffTolerances()
 
     def give_up_diffing(self, level: DiffLevel, diff_instance: DeepDiff) -> bool:
         """
@@ -149,18 +185,31 @@ class ShapelyLineDiffer(BaseOperator):
         elif level.t1 == level.t2:
             return True
 
+        analyse = self.get_analyse(level.t1, level.t2)
+        if analyse is not None:
+            diff_instance.custom_report_result("values_changed", level)
+            diff_instance.custom_report_result("diff_analyse", level, analyse)
+        return True
+
+    def get_analyse(self, t1: str, t2: str) -> dict[str, Any] | None:
+        """
+        Compare two line coordinate strings and return the analyse of the difference.
+
+        Args:
+            t1: The coordinates of the first line.
+            t2: The coordinates of the second line.
+
+        Returns:
+            The analyse, or None if the lines are not changed.
+        """
         l1: LineString = (
-            LineString(
-                [tuple(map(float, item.split(","))) for item in level.t1.split(" ")]
-            )
-            if level.t1
+            LineString([tuple(map(float, item.split(","))) for item in t1.split(" ")])
+            if t1
             else LineString()
         )
         l2: LineString = (
-            LineString(
-                [tuple(map(float, item.split(","))) for item in level.t2.split(" ")]
-            )
-            if level.t2
+            LineString([tuple(map(float, item.split(","))) for item in t2.split(" ")])
+            if t2
             else LineString()
         )
         is_changed: bool = False
@@ -171,8 +220,8 @@ class ShapelyLineDiffer(BaseOperator):
             is_changed = True
 
         # Perform buffer-based comparison
-        intersection_over_union: float = self._compare_buffer_intersections(l1, l2)
-        if intersection_over_union < 0.98:
+        intersection_over_union: float = self._get_intersection_over_union(l1, l2)
+        if intersection_over_union < self.tolerances.min_intersection_over_union:
             is_changed = True
 
         # Compare lengths and coordinates
@@ -190,30 +239,56 @@ class ShapelyLineDiffer(BaseOperator):
         if z_difference != "no z" or z_difference != "no change in z":
             is_changed = True
 
-        # Report differences if changes are detected
-        if is_changed:
-            self._report_differences(
-                diff_instance,
-                level,
-                almost_equal,
-                intersection_over_union,
-                length_difference,
-                coordinate_difference,
-                z_difference,
-            )
+        if not is_changed:
+            return None
 
-        return True
+        return self._get_differences(
+            almost_equal,
+            intersection_over_union,
+            length_difference,
+            coordinate_difference,
+            z_difference,
+        )
 
     def _check_almost_equal(self, l1: LineString, l2: LineString) -> bool:
         """Check if the two LineString geometries are almost equal."""
-        return l1.equals_exact(l2, 1e-6)
+        return l1.equals_exact(l2, self.tolerances.almost_equal_tolerance)
+
+    def _get_intersection_over_union(self, l1: LineString, l2: LineString) -> float:
+        """
+        Get the Intersection-over-Union (IoU) of the line buffers, cheap checks are done first.
+        """
+        if l1.is_empty or l2.is_empty:
+            return 0.0
+
+        # equal planar vertices, in the same or reversed order, give equal buffers
+        xy_1 = shapely.get_coordinates(l1)
+        xy_2 = shapely.get_coordinates(l2)
+        if xy_1.shape == xy_2.shape and (
+            np.array_equal(xy_1, xy_2) or np.array_equal(xy_1, xy_2[::-1])
+        ):
+            return 1.0
+
+        # buffers of lines with bounding boxes further apart than both buffers do not overlap
+        min_x_1, min_y_1, max_x_1, max_y_1 = l1.bounds
+        min_x_2, min_y_2, max_x_2, max_y_2 = l2.bounds
+        gap = 2 * self.tolerances.buffer_distance
+        if (
+            min_x_2 - max_x_1 > gap
+            or min_x_1 - max_x_2 > gap
+            or min_y_2 - max_y_1 > gap
+            or min_y_1 - max_y_2 > gap
+        ):
+            return 0.0
+
+        return self._compare_buffer_intersections(l1, l2)
 
     def _compare_buffer_intersections(self, l1: LineString, l2: LineString) -> float:
         """
         Compare the buffer intersections of two LineStrings and return the Intersection-over-Union (IoU).
         """
-        line_1_buffer: BaseGeometry = l1.buffer(1)
-        line_2_buffer: BaseGeometry = l2.buffer(1)
+        line_1_buffer: BaseGeometry = l1.buffer(self.tolerances.buffer_distance)
+        line_2_buffer: BaseGeometry = l2.buffer(self.tolerances.buffer_distance)
 
         union_area: float = line_1_buffer.union(line_2_buffer).area
         overlap_area: float = line_1_buffer.intersection(line_2_buffer).area
@@ -243,50 +318,43 @@ class ShapelyLineDiffer(BaseOperator):
     def _get_max_z_difference(self, l1: LineString, l2: LineString) -> float:
         """
         Calculate the maximum Z-coordinate difference between the two LineStrings.
-        """
-        max_distance = []
-        for point in l1.coords:
-            max_distance.append(self._calculate_z_distance(Point(point), l2))
-
-        for point in l2.coords:
-            max_distance.append(self._calculate_z_distance(Point(point), l1))
 
-        return max(abs(d) for d in max_distance) if max_distance else 0
+        Every vertex is projected on the other line, all vertices of a line are projected in one call.
+        """
+        z_distances = np.concatenate(
+            [self._get_z_distances(l1, l2), self._get_z_distances(l2, l1)]
+        )
+        return float(np.abs(z_distances).max()) if len(z_distances) else 0
 
-    def _calculate_z_distance(self, point: Point, line: LineString) -> float:
+    @staticmethod
+    def _get_z_distances(line: LineString, other: LineString) -> np.ndarray:
         """
-        Calculate the Z-coordinate difference between a point and the closest point on a LineString.
+        Calculate the Z-coordinate difference between the vertices of a line and the closest points on the other.
         """
-        measure = line.project(point)
-        interpolated_point = line.interpolate(measure)
-        return point.z - interpolated_point.z
+        points = shapely.points(shapely.get_coordinates(line, include_z=True))
+        measures = shapely.line_locate_point(other, points)
+        interpolated_points = shapely.line_interpolate_point(other, measures)
+        return shapely.get_z(points) - shapely.get_z(interpolated_points)
 
-    def _report_differences(
+    def _get_differences(
         self,
-        diff_instance: DeepDiff,
-        level: DiffLevel,
         almost_equal: bool,
         intersection_over_union: float,
         length_difference: float,
         coordinate_difference: int,
         z_difference: float | str,
-    ) -> None:
-        """Report the detected differences using DeepDiff."""
-        diff_instance.custom_report_result("values_changed", level)
-        diff_instance.custom_report_result(
-            "diff_analyse",
-            level,
-            {
-                "type": "ShapelyLineDiffer",
-                "line_almost_equal": almost_equal,
-                "intersection_over_union": round(intersection_over_union, 3),
-                "line_planer_length_difference": round(length_difference, 3),
-                "line_coordinate_difference": coordinate_difference,
-                "line_max_z_distance": round(z_difference, 3)
-                if isinstance(z_difference, float)
-                else z_difference
-                if isinstance(z_difference, str)
-                else round(z_difference, 3),
-                "display": f"almost_equal: {almost_equal}\nintersection over union: {round(intersection_over_union, 3)}\nplaner length difference: {round(length_difference, 3)}",
-            },
-        )
+    ) -> dict[str, Any]:
+        """Get the analyse of the detected differences."""
+        return {
+            "type": "ShapelyLineDiffer",
+            "line_almost_equal": almost_equal,
+            "intersection_over_union": round(intersection_over_union, 3),
+            "line_planer_length_difference": round(length_difference, 3),
+            "line_coordinate_difference": coordinate_difference,
+            "line_max_z_distance": round(z_difference, 3)
+            if isinstance(z_difference, float)
+            else z_difference
+            if isinstance(z_difference, str)
+            else round(z_difference, 3),
+            "display": f"almost_equal: {almost_equal}\nintersection over union: {round(intersection_over_union, 3)}\nplaner length difference: {round(length_difference, 3)}",
+        }
@@ -1,6 +1,9 @@
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import InitVar, dataclass, field
 from enum import Enum
 
+import numpy as np
+import shapely
 from shapely import (
     GeometryCollection,
     LineString,
@@ -30,6 +33,86 @@ class GeometryChangeStatus(Enum):
     Z_CHANGED = "Z_changed"
 
 
+def _as_geometry_array(geometries: Sequence[BaseGeometry | None]) -> np.ndarray:
+    array = np.empty(len(geometries), dtype=object)
+    array[:] = list(geometries)
+    return array
+
+
+def classify_geometry_changes(
+    t1_geometries: Sequence[BaseGeometry | None],
+    t2_geometries: Sequence[BaseGeometry | None],
+) -> list[GeometryChangeStatus]:
+    """
+    Classify the geometry change of every t1 and t2 geometry pair in one vectorized pass.
+
+    Geometries are compared exact in 2d, equal geometries are checked on added, removed and changed z values.
+
+    Args:
+        t1_geometries: The geometries of the first versions, None if not present.
+        t2_geometries: The geometries of the second versions, None if not present.
+
+    Returns:
+        The geometry change status of every pair.
+    """
+    t1 = _as_geometry_array(t1_geometries)
+    t2 = _as_geometry_array(t2_geometries)
+
+    t1_empty = shapely.is_missing(t1) | shapely.is_empty(t1)
+    t2_empty = shapely.is_missing(t2) | shapely.is_empty(t2)
+    t1_undefined = shapely.is_missing(t1) | (
+        t1_empty & (shapely.get_type_id(t1) == shapely.GeometryType.GEOMETRYCOLLECTION)
+    )
+    t2_undefined = shapely.is_missing(t2) | (
+        t2_empty & (shapely.get_type_id(t2) == shapely.GeometryType.GEOMETRYCOLLECTION)
+    )
+
+    undefined = t1_undefined & t2_undefined
+    removed = ~undefined & t2_empty
+    added = ~undefined & ~removed & t1_empty
+    compared = ~(undefined | removed | added)
+
+    equal = np.zeros(len(t1), dtype=bool)
+    equal[compared] = shapely.equals_exact(t1[compared], t2[compared], tolerance=0)
+    t1_has_z = shapely.has_z(t1)
+    t2_has_z = shapely.has_z(t2)
+    z_added = equal & ~t1_has_z & t2_has_z
+    z_removed = equal & t1_has_z & ~t2_has_z
+
+    z_changed = np.zeros(len(t1), dtype=bool)
+    check_z = np.flatnonzero(equal & t1_has_z & t2_has_z)
+    if len(check_z):
+        t1_coords, t1_index = shapely.get_coordinates(
+            t1[check_z], include_z=True, return_index=True
+        )
+        t2_coords, t2_index = shapely.get_coordinates(
+            t2[check_z], include_z=True, return_index=True
+        )
+        if np.array_equal(t1_index, t2_index):
+            different_z = np.zeros(len(check_z), dtype=bool)
+            np.logical_or.at(different_z, t1_index, t1_coords[:, 2] != t2_coords[:, 2])
+            z_changed[check_z] = different_z
+        else:
+            # exact equal geometries have equal coordinate counts, compare pair by pair to be safe
+            z_changed[check_z] = [
+                not np.array_equal(
+                    shapely.get_coordinates(t1[idx], include_z=True)[:, 2],
+                    shapely.get_coordinates(t2[idx], include_z=True)[:, 2],
+                )
+                for idx in check_z
+            ]
+
+    statuses = np.full(len(t1), GeometryChangeStatus.CHANGED, dtype=object)
+    statuses[equal] = GeometryChangeStatus.UNCHANGED
+    statuses[z_changed] = GeometryChangeStatus.Z_CHANGED
+    statuses[z_removed] = GeometryChangeStatus.Z_REMOVED
+    statuses[z_added] = GeometryChangeStatus.Z_ADDED
+    statuses[added] = GeometryChangeStatus.ADDED
+    statuses[removed] = GeometryChangeStatus.REMOVED
+    statuses[undefined] = GeometryChangeStatus.UNDEFINED
+    return statuses.tolist()
+
+
 @dataclass
 class GeometryChange:
     t1: (
@@ -52,75 +135,16 @@ class GeometryChange:
         | MultiPolygon
         | None
     ) = None
+    known_status: InitVar[GeometryChangeStatus | None] = None
     status: GeometryChangeStatus = field(init=False)
 
-    def __post_init__(self):
-        self.status = self._determine_status()
+    def __post_init__(self, known_status: GeometryChangeStatus | None):
+        self.status = (
+            known_status if known_status is not None else self._determine_status()
+        )
 
     def _determine_status(self) -> GeometryChangeStatus:
-        if (self.t1 is None or self.t1.wkt == "GEOMETRYCOLLECTION EMPTY") and (
-            self.t2 is None or self.t2.wkt == "GEOMETRYCOLLECTION EMPTY"
-        ):
-            return GeometryChangeStatus.UNDEFINED
-        elif not self.t2:
-            return GeometryChangeStatus.REMOVED
-        elif not self.t1:
-            return GeometryChangeStatus.ADDED
-        if self._is_equal_2d(self.t1, self.t2):
-            if not self.t1.has_z and self.t2.has_z:
-                return GeometryChangeStatus.Z_ADDED
-            elif not self.t2.has_z and self.t1.has_z:
-                return GeometryChangeStatus.Z_REMOVED
-
-            if self._has_different_z(self.t1, self.t2):
-                return GeometryChangeStatus.Z_CHANGED
-            else:
-                return GeometryChangeStatus.UNCHANGED
-        else:
-            return GeometryChangeStatus.CHANGED
-
-    @staticmethod
-    def _is_equal_2d(geom1: BaseGeometry, geom2: BaseGeometry) -> bool:
-        return geom1.equals_exact(geom2, tolerance=0)
-
-    @staticmethod
-    def _has_different_z(geom1: BaseGeometry, geom2: BaseGeometry) -> bool:
-        """Check if two geometries have different Z coordinates."""
-        if geom1.geom_type != geom2.geom_type:
-            return True
-
-        if isinstance(geom1, Polygon) and isinstance(geom2, Polygon):
-            coords1 = [geom1.exterior.coords] + [
-                interior.coords for interior in geom1.interiors
-            ]
-            coords2 = [geom2.exterior.coords] + [
-                interior.coords for interior in geom2.interiors
-            ]
-        else:
-            coords1 = [geom1.coords]
-            coords2 = [geom2.coords]
-
-        if len(coords1) != len(coords2):
-            return True
-
-        for ring1, ring2 in zip(coords1, coords2):
-            if len(ring1) != len(ring2):
-                return True
-            for coord1, coord2 in zip(ring1, ring2):
-                if len(coord1) > 2:
-                    z1 = coord1[2]
-                else:
-                    z1 = None
-
-                if len(coord2) > 2:
-                    z2 = coord2[2]
-                else:
-                    z2 = None
-
-                if z1 != z2:
-                    return True
-
-        return False
+        return classify_geometry_changes([self.t1], [self.t2])[0]
 
     def geometry_movement(self):
         # todo: add return type, ad default return value
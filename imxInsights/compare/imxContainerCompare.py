@@ -1,7 +1,18 @@
+import bisect
+import gzip
+import hashlib
+import importlib.metadata
+import json
+import math
 import re
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
+from typing import IO, Any, cast
 
 import pandas as pd
 import shapely
@@ -9,22 +20,41 @@ from deepdiff import DeepDiff
 from loguru import logger
 from pandas.io.formats.style import Styler
 
-from imxInsights.compare.changedImxObject import ChangedImxObject
-from imxInsights.compare.changes import Change, process_deep_diff
+from imxInsights.compare.changedImxObject import (
+    ChangedImxObject,
+    ChangeRecord,
+    get_change_records,
+)
+from imxInsights.compare.changes import (
+    Change,
+    get_unchanged_changes,
+    process_deep_diff,
+)
 from imxInsights.compare.changeStatusEnum import ChangeStatusEnum
+from imxInsights.compare.custom_operators.diff_shapely import LineDiffTolerances
+from imxInsights.compare.geometryChange import (
+    GeometryChangeStatus,
+    classify_geometry_changes,
+)
+from imxInsights.domain.imxObject import ImxObject
 from imxInsights.repo.imxMultiRepoProtocol import ImxMultiRepoProtocol
 from imxInsights.utils.flatten_unflatten import flatten_dict
-from imxInsights.utils.headerAnnotator import HeaderSpec
+from imxInsights.utils.headerAnnotator import HeaderAnnotator, HeaderSpec
 from imxInsights.utils.pandas_helpers import (
     df_columns_sort_start_end,
+    diff_cell_format,
     styler_highlight_change_status,
     styler_highlight_changes,
 )
 from imxInsights.utils.report_helpers import (
-    add_overview_df_to_diff_dict,
+    EXCEL_WRITER_OPTIONS,
     add_review_styles_to_excel,
     app_info_df,
     clean_diff_df,
+    get_or_add_worksheet,
+    get_overview_df,
+    prepare_sheets,
+    select_overview_columns,
     set_sheet_color_by_change_status,
     shorten_sheet_name,
     upper_keys_with_index,
@@ -34,8 +64,187 @@ from imxInsights.utils.shapely.shapely_geojson import (
     CrsEnum,
     ShapelyGeoJsonFeature,
     ShapelyGeoJsonFeatureCollection,
+    write_geojson_files,
 )
 
+# GUIDs with optional ++ or -- prefixes
+GUID_PATTERN = re.compile(r"(?:\+\+|--)?([0-9a-fA-F-]{36})")
+GUID_NOT_PRESENT_DISPLAY = "NotPresent|Unknown|t1:X|t2:X"
+
+# sharding fewer objects is slower than comparing them in process
+MIN_OBJECTS_PER_WORKER = 250
+
+# change records of changed object pairs kept by the compare cache of a multi repo
+COMPARE_CACHE_SIZE = 10_000
+
+# objects compared per batch while streaming changes
+ITER_CHANGES_CHUNK_SIZE = 1000
+
+# first line of a saved compare file
+COMPARE_FILE_FORMAT = "imxInsights-compare-jsonl"
+COMPARE_FILE_FORMAT_VERSION = 2
+
+
+def _has_equal_content(t1: ImxObject | None, t2: ImxObject | None) -> bool:
+    return (
+        t1 is not None
+        and t2 is not None
+        and t1.content_fingerprint == t2.content_fingerprint
+    )
+
+
+CompareCacheKey = tuple[str, str | None, str | None, Any, Any, LineDiffTolerances]
+
+
+def get_compare_cache_key(
+    puic: str,
+    t1: ImxObject | None,
+    t2: ImxObject | None,
+    line_diff_tolerances: LineDiffTolerances,
+) -> CompareCacheKey:
+    """
+    Get the key of an object pair in a compare cache, pairs with equal keys have equal change records.
+
+    Built geometries, like the geometry of a rail connection, are not part of the content fingerprint,
+    so the built geometries are part of the key.
+
+    Args:
+        puic: The puic of the object.
+        t1: The object in the first container, None if not present.
+        t2: The object in the second container, None if not present.
+        line_diff_tolerances: The tolerances of the line coordinates differ of the compare.
+
+    Returns:
+        The puic, the t1 and t2 content fingerprint, the t1 and t2 built geometry and the tolerances.
+    """
+    return (
+        puic,
+        t1.content_fingerprint if t1 else None,
+        t2.content_fingerprint if t2 else None,
+        t1.built_geometry if t1 else None,
+        t2.built_geometry if t2 else None,
+        line_diff_tolerances,
+    )
+
+
+class CompareCache:
+    """
+    Change records of object pairs by compare cache key, shared by compares so equal pairs are compared once.
+
+    Only pairs that are not unchanged are kept, unchanged pairs with equal content are rebuild from the
+    content fingerprint without a diff. The least recently used records are dropped above the max size.
+    """
+
+    def __init__(self, max_size: int = COMPARE_CACHE_SIZE):
+        """
+        Args:
+            max_size: The maximum number of kept change records, 0 keeps nothing.
+        """
+        self.max_size = max_size
+        self._records: OrderedDict[CompareCacheKey, ChangeRecord] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: CompareCacheKey) -> bool:
+        return key in self._records
+
+    def get(self, key: CompareCacheKey) -> ChangeRecord | None:
+        """Get the change record of a key, None if not kept."""
+        record = self._records.get(key)
+        if record is not None:
+            self._records.move_to_end(key)
+        return record
+
+    def add(self, key: CompareCacheKey, compared: ChangedImxObject) -> None:
+        """Keep the change record of a compared object, unchanged objects are not kept."""
+        if self.max_size <= 0 or compared.status == ChangeStatusEnum.UNCHANGED:
+            return
+        self._records[key] = (
+            compared.changes,
+            compared.geometry.status
+            if compared.geometry
+            else GeometryChangeStatus.UNDEFINED,
+        )
+        self._records.move_to_end(key)
+        while len(self._records) > self.max_size:
+            self._records.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all change records."""
+        self._records.clear()
+
+
+def _serialize_pair(
+    t1: ImxObject | None, t2: ImxObject | None
+) -> tuple[dict | None, dict | None, Any, Any]:
+    return (
+        t1.get_imx_property_dict() if t1 else None,
+        t2.get_imx_property_dict() if t2 else None,
+        t1.geometry if t1 else None,
+        t2.geometry if t2 else None,
+    )
+
+
+def _open_compare_file(file_path: Path, mode: str) -> IO[str]:
+    if file_path.suffix == ".gz":
+        return cast(IO[str], gzip.open(file_path, f"{mode}t", encoding="utf-8"))
+    return open(file_path, f"{mode}", encoding="utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    # numpy scalars of the shapely analyses
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")  # noqa: TRY003
+
+
+def _get_diff_df(change_dicts: list[dict[str, Any]]) -> pd.DataFrame:
+    df = pd.DataFrame(change_dicts)
+    if not df.empty:
+        df = clean_diff_df(df)
+
+        # TODO: remove path_to_root
+        df = df_columns_sort_start_end(
+            df,
+            [
+                "@puic",
+                "path",
+                "tag",
+                "status",
+                "geometry_status",
+                "ImxArea",
+                "parent",
+                "children",
+                "@name",
+            ],
+            ["path_to_root"],
+        )
+        status_order = ["added", "changed", "type_change", "removed", "unchanged"]
+        df["status"] = pd.Categorical(
+            df["status"], categories=status_order, ordered=True
+        )
+        df = df.sort_values(by=["path", "status"])
+        df["status"] = df["status"].astype("object")
+    return df
+
+
+def _prepare_diff_sheet(
+    change_dicts: list[dict[str, Any]], header_loader: HeaderAnnotator | None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Build the overview columns and the sheet frame of a path, runs in the sheet workers."""
+    df = _get_diff_df(change_dicts)
+    overview_df = select_overview_columns(df)
+    if df.empty or df.shape[1] == 0:
+        return overview_df, df
+
+    if header_loader:
+        df = header_loader.apply_metadata_header(df)
+    df = df.fillna("")
+    if not header_loader:
+        del df["path_to_root"]
+    return overview_df, df
+
 
 @dataclass
 class CompareContainerInfo:
@@ -45,6 +254,57 @@ class CompareContainerInfo:
     container_type: str
 
 
+@dataclass
+class CompareSummary:
+    """
+    Change statistics of a compare.
+
+    Every object is counted once, for the t2 path or the t1 path if not present in t2. An object of which
+    the path changed is only counted for the t2 path.
+
+    Attributes:
+        counts: Object count by path, status and geometry status.
+        property_changes: Count of objects with a changed property by path and property key, most
+            changed properties first.
+    """
+
+    counts: dict[str, dict[str, dict[str, int]]]
+    property_changes: dict[str, dict[str, int]]
+
+    def get_count(
+        self,
+        path: str | None = None,
+        status: ChangeStatusEnum | str | None = None,
+        geometry_status: GeometryChangeStatus | str | None = None,
+    ) -> int:
+        """
+        Get the object count of a path, status and geometry status.
+
+        Args:
+            path: The object path. If None, all paths are counted.
+            status: The change status. If None, all statuses are counted.
+            geometry_status: The geometry change status. If None, all geometry statuses are counted.
+
+        Returns:
+            The object count.
+        """
+        status = status.value if isinstance(status, ChangeStatusEnum) else status
+        geometry_status = (
+            geometry_status.value
+            if isinstance(geometry_status, GeometryChangeStatus)
+            else geometry_status
+        )
+        return sum(
+            count
+            for counts_path, by_status in self.counts.items()
+            if path is None or counts_path == path
+            for counts_status, by_geometry_status in by_status.items()
+            if status is None or counts_status == status
+            for counts_geometry_status, count in by_geometry_status.items()
+            if geometry_status is None or counts_geometry_status == geometry_status
+        )
+
+
 class ImxContainerCompare:
     def __init__(
         self,
@@ -52,6 +312,10 @@ class ImxContainerCompare:
         container_id_1: str,
         container_id_2: str,
         object_paths: list[str] | None = None,
+        workers: int = 1,
+        changed_only: bool = False,
+        compare_cache: CompareCache | None = None,
+        line_diff_tolerances: LineDiffTolerances | None = None,
     ):
         """
         Initialize an IMX container comparison instance.
@@ -64,33 +328,81 @@ class ImxContainerCompare:
             container_id_2: The second container ID for comparison.
             object_paths: A list of object paths to filter the comparison.
                 If None, all objects within the containers will be compared.
+            workers: The number of processes comparing objects, objects are sharded by puic. Defaults to 1.
+            changed_only: Only keep added, removed and changed objects, unchanged objects are only kept by puic
+                and left out of all reports. Defaults to False.
+            compare_cache: Change records shared by compares of the same repo, so equal object pairs are
+                compared once. If None, no change records are cached.
+            line_diff_tolerances: The tolerances used to compare line coordinates. If None, the defaults
+                are used.
 
         Attributes:
             container_id_1: The first container ID.
             container_id_2: The second container ID.
             object_paths: The object paths used to filter comparisons.
             compared_objects: A list of compared IMX objects.
+            workers: The number of processes comparing objects.
+            changed_only: If unchanged objects are left out.
+            line_diff_tolerances: The tolerances used to compare line coordinates.
 
+        Objects are compared on first request and memoized by puic, asking for a single path only
+        compares the objects of that path. Compared objects are bucketed by path and status.
         """
         self._repo = repo
         self.container_id_1 = container_id_1
         self.container_id_2 = container_id_2
-        self._imx_info: dict[str, CompareContainerInfo] = {}
         self.object_paths = object_paths
-        self.compared_objects: list[ChangedImxObject] = self._get_compared_objects()
+        self.workers = workers
+        self.changed_only = changed_only
+        self.line_diff_tolerances = line_diff_tolerances or LineDiffTolerances()
+        self._compare_cache = (
+            compare_cache if compare_cache is not None else CompareCache(max_size=0)
+        )
+        self._container_info: dict[str, CompareContainerInfo] = {}
+        self._object_pairs: (
+            dict[str, tuple[ImxObject | None, ImxObject | None]] | None
+        ) = None
+        self._puics_by_path: dict[str, list[str]] = {}
+        self._puic_positions: dict[str, int] = {}
+        self._compared_by_puic: dict[str, ChangedImxObject] = {}
+        self._unchanged_puics: set[str] = set()
+        self._compared_by_path: dict[str, list[ChangedImxObject]] = {}
+        self._compared_by_path_status: dict[
+            str, dict[ChangeStatusEnum, list[ChangedImxObject]]
+        ] = {}
+        self._guid_displays: dict[str, str] | None = None
+        # change records read from a saved compare, restored on first request
+        self._stored_records: dict[str, tuple[list, GeometryChangeStatus]] = {}
+        self._unchanged_geometry_statuses: dict[str, GeometryChangeStatus] = {}
+        self._summary: CompareSummary | None = None
+        # saved once all objects are compared
+        self._save_when_complete_path: Path | None = None
+
+    @property
+    def compared_objects(self) -> list[ChangedImxObject]:
+        """All compared objects, in repo order."""
+        return self.get_compared_objects()
+
+    @property
+    def _imx_info(self) -> dict[str, CompareContainerInfo]:
+        self._index_objects()
+        return self._container_info
 
     def _set_container_info(self, container_id, t):
-        if container_id not in self._imx_info and t:
-            self._imx_info[container_id] = CompareContainerInfo(
+        if container_id not in self._container_info and t:
+            self._container_info[container_id] = CompareContainerInfo(
                 t.imx_file.path.name,
                 t.imx_file.file_hash,
                 t.imx_file.imx_version,
                 t.imx_situation or "container",
             )
 
-    def _get_compared_objects(self) -> list[ChangedImxObject]:
-        compared_objects = []
+    def _index_objects(self) -> dict[str, tuple[ImxObject | None, ImxObject | None]]:
+        """Index the t1 and t2 object by puic and the puics by path, without comparing them."""
+        if self._object_pairs is not None:
+            return self._object_pairs
 
+        object_pairs: dict[str, tuple[ImxObject | None, ImxObject | None]] = {}
         repo_objects = (
             self._repo.get_by_paths(self.object_paths)
             if self.object_paths
@@ -105,13 +417,670 @@ class ImxContainerCompare:
             self._set_container_info(self.container_id_2, t2)
 
             if t1 or t2:
-                compare = ChangedImxObject(t1=t1, t2=t2)
-                if compare:
-                    compared_objects.append(compare)
+                puic = multi_object.puic
+                self._puic_positions[puic] = len(object_pairs)
+                object_pairs[puic] = (t1, t2)
+                paths = {imx_object.path for imx_object in (t1, t2) if imx_object}
+                for path in paths:
+                    self._puics_by_path.setdefault(path, []).append(puic)
+
+        self._object_pairs = object_pairs
+        return object_pairs
+
+    def get_compared_object(self, puic: str) -> ChangedImxObject | None:
+        """
+        Get the compared object of a single puic.
+
+        Args:
+            puic: The puic of the object.
 
+        Returns:
+            The compared object, None if the puic is not present in both containers or is unchanged in
+            changed only mode.
+        """
+        if puic not in self._index_objects():
+            return None
+        self._compare_objects([puic])
+        return self._compared_by_puic.get(puic)
+
+    def _get_path_objects(
+        self, path: str, statuses: list[ChangeStatusEnum] | None = None
+    ) -> list[ChangedImxObject]:
+        """Get the compared objects of a path from the path and status buckets, buckets are build once."""
+        if path not in self._compared_by_path:
+            puics = self._puics_by_path.get(path, [])
+            self._compare_objects(puics)
+            items = [
+                self._compared_by_puic[puic]
+                for puic in puics
+                if puic in self._compared_by_puic
+            ]
+            buckets: dict[ChangeStatusEnum, list[ChangedImxObject]] = {}
+            for item in items:
+                buckets.setdefault(item.status, []).append(item)
+            self._compared_by_path[path] = items
+            self._compared_by_path_status[path] = buckets
+
+        if statuses is None:
+            return self._compared_by_path[path]
+        if len(statuses) == 1:
+            return self._compared_by_path_status[path].get(statuses[0], [])
+        return [
+            item for item in self._compared_by_path[path] if item.status in statuses
+        ]
+
+    def get_compared_objects(
+        self,
+        object_paths: list[str] | None = None,
+        statuses: list[ChangeStatusEnum] | None = None,
+    ) -> list[ChangedImxObject]:
+        """
+        Get the compared objects, only the objects not compared before are compared.
+
+        Args:
+            object_paths: Only return objects of which the t1 or t2 path is in the given paths.
+                If None, all objects are returned.
+            statuses: Only return objects with one of the given statuses. If None, all statuses are returned.
+
+        Returns:
+            The compared objects in repo order.
+        """
+        object_pairs = self._index_objects()
+        if object_paths is None:
+            self._compare_objects(list(object_pairs))
+            items = [
+                self._compared_by_puic[puic]
+                for puic in object_pairs
+                if puic in self._compared_by_puic
+            ]
+            if statuses is None:
+                return items
+            return [item for item in items if item.status in statuses]
+
+        self._compare_objects(
+            [
+                puic
+                for path in object_paths
+                if path not in self._compared_by_path
+                for puic in self._puics_by_path.get(path, [])
+            ]
+        )
+        groups = [self._get_path_objects(path, statuses) for path in object_paths]
+        if len(groups) == 1:
+            return list(groups[0])
+        unique_items = {item.puic: item for group in groups for item in group}
+        return sorted(
+            unique_items.values(), key=lambda item: self._puic_positions[item.puic]
+        )
+
+    def get_unchanged_puics(self, object_paths: list[str] | None = None) -> list[str]:
+        """
+        Get the puics of the unchanged objects, in changed only mode these objects are not kept.
+
+        Args:
+            object_paths: Only return puics of which the t1 or t2 path is in the given paths.
+                If None, all unchanged puics are returned.
+
+        Returns:
+            The unchanged puics in repo order.
+        """
+        object_pairs = self._index_objects()
+        if object_paths is None:
+            puics = list(object_pairs)
+        else:
+            path_puics = {
+                puic
+                for path in object_paths
+                for puic in self._puics_by_path.get(path, [])
+            }
+            puics = sorted(path_puics, key=self._puic_positions.__getitem__)
+        self._compare_objects(puics)
+        return [
+            puic
+            for puic in puics
+            if puic in self._unchanged_puics
+            or self._compared_by_puic[puic].status == ChangeStatusEnum.UNCHANGED
+        ]
+
+    @staticmethod
+    def _get_library_version() -> str:
+        return importlib.metadata.version("imxInsights")
+
+    def _get_content_key(self) -> dict[str, Any]:
+        """Get the container type and the hashes of the imx files of the t1 and t2 objects."""
+        object_pairs = self._index_objects()
+        content_key: dict[str, Any] = {}
+        for side, container_id in (
+            ("t1", self.container_id_1),
+            ("t2", self.container_id_2),
+        ):
+            imx_objects = [pair[side == "t2"] for pair in object_pairs.values()]
+            info = self._container_info.get(container_id)
+            content_key[side] = {
+                "container_type": info.container_type if info else None,
+                "file_hashes": dict(
+                    sorted(
+                        {
+                            imx_object.imx_file.path.name: imx_object.imx_file.file_hash
+                            for imx_object in imx_objects
+                            if imx_object is not None
+                        }.items()
+                    )
+                ),
+            }
+        return content_key
+
+    def get_cache_key(self) -> str:
+        """
+        Get the key of the compare result, saved compares with equal keys have equal results.
+
+        The key is a hash of the library version, the object paths, the line diff tolerances and the file
+        hashes and container type of both containers, the container ids are not part of the key.
+
+        Returns:
+            The hex digest of the key.
+        """
+        key = {
+            "version": self._get_library_version(),
+            "object_paths": self.object_paths,
+            "line_diff_tolerances": asdict(self.line_diff_tolerances),
+            "content": self._get_content_key(),
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+    def save(self, file_path: str | Path) -> Path:
+        """
+        Save the compare result as JSON lines, gzip compressed if the file name ends on .gz.
+
+        The first line holds the library version, the line diff tolerances and the file hashes of both
+        containers, the other lines
+        hold the puic, geometry status and the changed properties of every object. Unchanged properties
+        are restored from the objects on load. All objects not compared before are compared.
+
+        Args:
+            file_path: The path of the compare file.
+
+        Returns:
+            The path of the compare file.
+        """
+        file_path = Path(file_path)
+        object_pairs = self._index_objects()
+        puics = list(object_pairs)
+        self._compare_objects(puics)
+
+        unchanged_statuses = self._get_unchanged_geometry_statuses()
+
+        header = {
+            "format": COMPARE_FILE_FORMAT,
+            "format_version": COMPARE_FILE_FORMAT_VERSION,
+            "version": self._get_library_version(),
+            "object_paths": self.object_paths,
+            "line_diff_tolerances": asdict(self.line_diff_tolerances),
+            "content": self._get_content_key(),
+        }
+        with _open_compare_file(file_path, "w") as file:
+            file.write(json.dumps(header) + "\n")
+            for puic in puics:
+                record: list[Any]
+                if puic in unchanged_statuses:
+                    record = [puic, unchanged_statuses[puic].value, []]
+                else:
+                    compared = self._compared_by_puic[puic]
+                    record = [
+                        puic,
+                        compared.geometry.status.value
+                        if compared.geometry
+                        else GeometryChangeStatus.UNDEFINED.value,
+                        [
+                            [
+                                key,
+                                change.status.value,
+                                change.t1,
+                                change.t2,
+                                change.diff_string,
+                                change.analyse,
+                            ]
+                            for key, change in compared.changes.items()
+                            if change.status != ChangeStatusEnum.UNCHANGED
+                        ],
+                    ]
+                file.write(
+                    json.dumps(record, separators=(",", ":"), default=_json_default)
+                    + "\n"
+                )
+        logger.success(f"Compare saved at {file_path}.")
+        return file_path
+
+    def save_when_complete(self, file_path: str | Path) -> None:
+        """
+        Save the compare result once all objects are compared, objects are not compared to save it.
+
+        The result is saved under a temporary name first and renamed when written, so a failed save is
+        never reused. A failed save is logged and removed, the compare result is not affected.
+
+        Args:
+            file_path: The path of the compare file.
+        """
+        self._save_when_complete_path = Path(file_path)
+        self._save_if_complete()
+
+    def _save_if_complete(self) -> None:
+        if self._save_when_complete_path is None:
+            return
+        compared_count = len(self._compared_by_puic) + len(self._unchanged_puics)
+        if compared_count < len(self._index_objects()):
+            return
+
+        file_path, self._save_when_complete_path = self._save_when_complete_path, None
+        temp_file_path = file_path.with_name(f".{file_path.name}")
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            self.save(temp_file_path)
+            temp_file_path.replace(file_path)
+        except Exception as e:
+            temp_file_path.unlink(missing_ok=True)
+            logger.warning(f"Could not save compare at {file_path}: {e}")
+
+    def _load_records(self, file_path: Path) -> None:
+        with _open_compare_file(file_path, "r") as file:
+            header = json.loads(file.readline())
+            if (
+                header.get("format") != COMPARE_FILE_FORMAT
+                or header.get("format_version") != COMPARE_FILE_FORMAT_VERSION
+            ):
+                raise ValueError(f"{file_path} is not a saved compare file")  # noqa: TRY003
+            if header["version"] != self._get_library_version():
+                raise ValueError(  # noqa: TRY003
+                    f"{file_path} is saved by imxInsights {header['version']}, expected {self._get_library_version()}"
+                )
+            if header["line_diff_tolerances"] != asdict(self.line_diff_tolerances):
+                raise ValueError(  # noqa: TRY003
+                    f"{file_path} is saved with other line diff tolerances"
+                )
+            if header["content"] != self._get_content_key():
+                raise ValueError(  # noqa: TRY003
+                    f"{file_path} does not match the files of the compared containers"
+                )
+
+            stored_records = {}
+            for line in file:
+                puic, geometry_status, changes = json.loads(line)
+                stored_records[puic] = (changes, GeometryChangeStatus(geometry_status))
+        self._stored_records = {
+            puic: record
+            for puic, record in stored_records.items()
+            if not self._is_compared(puic)
+        }
+
+    @classmethod
+    def load(
+        cls,
+        file_path: str | Path,
+        repo: ImxMultiRepoProtocol,
+        container_id_1: str,
+        container_id_2: str,
+        **kwargs: Any,
+    ) -> "ImxContainerCompare":
+        """
+        Load a saved compare result, objects are not compared again.
+
+        The containers are matched by file hashes, so the container ids can differ from the saved compare.
+
+        Args:
+            file_path: The path of the compare file.
+            repo: The repository containing the compared containers.
+            container_id_1: The first container ID of the comparison.
+            container_id_2: The second container ID of the comparison.
+            **kwargs: Other arguments of ImxContainerCompare, like workers, changed_only and
+                line_diff_tolerances.
+
+        Returns:
+            The compare with the saved result.
+
+        Raises:
+            ValueError: If the file is not a saved compare, is saved by another library version or with other
+                line diff tolerances, or does not match the files of the containers.
+        """
+        file_path = Path(file_path)
+        with _open_compare_file(file_path, "r") as file:
+            object_paths = json.loads(file.readline()).get("object_paths")
+        compare = cls(
+            repo, container_id_1, container_id_2, object_paths=object_paths, **kwargs
+        )
+        compare._load_records(file_path)
+        return compare
+
+    def _get_unchanged_geometry_statuses(self) -> dict[str, GeometryChangeStatus]:
+        """Get the geometry status of the unchanged objects not kept in changed only mode, classified once."""
+        object_pairs = self._index_objects()
+        pending = [
+            puic
+            for puic in object_pairs
+            if puic in self._unchanged_puics
+            and puic not in self._unchanged_geometry_statuses
+        ]
+        if pending:
+            pairs = [object_pairs[puic] for puic in pending]
+            self._unchanged_geometry_statuses.update(
+                zip(
+                    pending,
+                    classify_geometry_changes(
+                        [t1.geometry if t1 else None for t1, _ in pairs],
+                        [t2.geometry if t2 else None for _, t2 in pairs],
+                    ),
+                )
+            )
+        return self._unchanged_geometry_statuses
+
+    def summary(self) -> CompareSummary:
+        """
+        Get the change statistics of the compare, counted from the change records without pandas.
+
+        All objects not compared before are compared. The summary is computed once, the compare result
+        does not change.
+
+        Returns:
+            The object counts by path, status and geometry status and the property change counts by path.
+        """
+        if self._summary is not None:
+            return self._summary
+
+        object_pairs = self._index_objects()
+        self._compare_objects(list(object_pairs))
+        unchanged_statuses = self._get_unchanged_geometry_statuses()
+        unchanged = ChangeStatusEnum.UNCHANGED.value
+
+        counts: dict[str, dict[str, dict[str, int]]] = {}
+        property_changes: dict[str, dict[str, int]] = {}
+        for puic, (t1, t2) in object_pairs.items():
+            # objects are counted once, for the t2 path or the t1 path of removed objects
+            path = cast(ImxObject, t2 or t1).path
+            path_counts = counts.setdefault(path, {})
+            path_property_changes = property_changes.setdefault(path, {})
+            compared = self._compared_by_puic.get(puic)
+            if compared is None:
+                status = unchanged
+                geometry_status = unchanged_statuses[puic].value
+            else:
+                status = compared.status.value
+                geometry_status = (
+                    compared.geometry.status.value
+                    if compared.geometry
+                    else GeometryChangeStatus.UNDEFINED.value
+                )
+                for key, change in compared.changes.items():
+                    if change.status != ChangeStatusEnum.UNCHANGED:
+                        path_property_changes[key] = (
+                            path_property_changes.get(key, 0) + 1
+                        )
+            by_geometry_status = path_counts.setdefault(status, {})
+            by_geometry_status[geometry_status] = (
+                by_geometry_status.get(geometry_status, 0) + 1
+            )
+
+        self._summary = CompareSummary(
+            dict(sorted(counts.items())),
+            {
+                path: dict(
+                    sorted(
+                        property_changes[path].items(),
+                        key=lambda item: (-item[1], item[0]),
+                    )
+                )
+                for path in sorted(property_changes)
+            },
+        )
+        return self._summary
+
+    def _restore_change_record(self, puic: str) -> ChangeRecord:
+        stored_changes, geometry_status = self._stored_records[puic]
+        t1, t2 = self._index_objects()[puic]
+        changes = {
+            key: Change(
+                status=ChangeStatusEnum(status),
+                t1=t1_value,
+                t2=t2_value,
+                diff_string=diff_string,
+                analyse=analyse,
+            )
+            for key, status, t1_value, t2_value, diff_string, analyse in stored_changes
+        }
+        t1_properties, _ = ChangedImxObject._add_missing_keys(
+            t1.get_imx_property_dict() if t1 else {},
+            t2.get_imx_property_dict() if t2 else {},
+        )
+        for key, change in get_unchanged_changes(t1_properties).items():
+            changes.setdefault(key, change)
+        return changes, geometry_status
+
+    def _is_compared(self, puic: str) -> bool:
+        return puic in self._compared_by_puic or puic in self._unchanged_puics
+
+    def _store_compared_object(self, puic: str, compared: ChangedImxObject) -> None:
+        self._stored_records.pop(puic, None)
+        if self.changed_only and compared.status == ChangeStatusEnum.UNCHANGED:
+            self._unchanged_puics.add(puic)
+        else:
+            self._compared_by_puic[puic] = compared
+
+    def _compare_objects(self, puics: list[str]) -> None:
+        """Compare the objects not compared before, geometry changes are classified in one batch."""
+        object_pairs = self._index_objects()
+        if self.changed_only:
+            # equal content is unchanged, these objects are never materialized
+            self._unchanged_puics.update(
+                puic
+                for puic in puics
+                if not self._is_compared(puic)
+                and _has_equal_content(*object_pairs[puic])
+            )
+
+        for puic, compared in self._compare_in_workers(puics).items():
+            self._store_compared_object(puic, compared)
+
+        pending = [puic for puic in dict.fromkeys(puics) if not self._is_compared(puic)]
+        if pending:
+            compared_objects = self._build_compared_objects(pending, add_to_cache=True)
+            for puic, compared in zip(pending, compared_objects):
+                self._store_compared_object(puic, compared)
+
+        self._save_if_complete()
+
+    def _build_compared_objects(
+        self, puics: list[str], add_to_cache: bool = False
+    ) -> list[ChangedImxObject]:
+        """Compare objects without memoizing them, geometry changes are classified in one batch.
+
+        Saved and cached change records are used when present, compared objects are only added to the
+        compare cache if add_to_cache is set.
+        """
+        object_pairs = self._index_objects()
+        pairs = [object_pairs[puic] for puic in puics]
+        keys = [
+            get_compare_cache_key(puic, *object_pairs[puic], self.line_diff_tolerances)
+            for puic in puics
+        ]
+        compared: dict[int, ChangedImxObject] = {}
+        for idx, (puic, (t1, t2), key) in enumerate(zip(puics, pairs, keys)):
+            record = (
+                self._restore_change_record(puic)
+                if puic in self._stored_records
+                else self._compare_cache.get(key)
+            )
+            if record is not None:
+                compared[idx] = ChangedImxObject(t1=t1, t2=t2, change_record=record)
+
+        missing = [idx for idx in range(len(puics)) if idx not in compared]
+        missing_pairs = [pairs[idx] for idx in missing]
+        geometry_statuses = classify_geometry_changes(
+            [t1.geometry if t1 else None for t1, _ in missing_pairs],
+            [t2.geometry if t2 else None for _, t2 in missing_pairs],
+        )
+        for idx, geometry_status in zip(missing, geometry_statuses):
+            t1, t2 = pairs[idx]
+            compared[idx] = ChangedImxObject(
+                t1=t1,
+                t2=t2,
+                geometry_status=geometry_status,
+                line_diff_tolerances=self.line_diff_tolerances,
+            )
+        if add_to_cache:
+            for idx, key in enumerate(keys):
+                self._compare_cache.add(key, compared[idx])
+        return [compared[idx] for idx in range(len(puics))]
+
+    @staticmethod
+    def _get_change_record(compared: ChangedImxObject) -> dict[str, Any]:
+        imx_object = compared.t2 if compared.t2 else compared.t1
+        return {
+            "puic": compared.puic,
+            "path": imx_object.path if imx_object else None,
+            "status": compared.status.value,
+            "geometry_status": compared.geometry.status.value
+            if compared.geometry
+            else "",
+            "changes": {
+                key: {"status": change.status.value, "t1": change.t1, "t2": change.t2}
+                for key, change in compared.changes.items()
+                if change.status != ChangeStatusEnum.UNCHANGED
+            },
+        }
+
+    def iter_changes(
+        self,
+        object_paths: list[str] | None = None,
+        after_puic: str | None = None,
+        until_puic: str | None = None,
+        chunk_size: int = ITER_CHANGES_CHUNK_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream a change record per object, objects are compared chunk by chunk and are not kept.
+
+        Records are yielded in puic order, a stream can be resumed by passing the puic of the last record
+        as after_puic, and split in puic ranges by after_puic and until_puic. Objects compared before are
+        not compared again. In changed only mode unchanged objects are skipped.
+
+        Each record is a plain dict with the puic, path, status, geometry_status and the changes by
+        property key, with the status, t1 and t2 value of every property that is not unchanged.
+
+        Args:
+            object_paths: Only yield objects of which the t1 or t2 path is in the given paths.
+                If None, all objects are yielded.
+            after_puic: Only yield objects with a puic greater than this puic.
+            until_puic: Only yield objects with a puic less than or equal to this puic.
+            chunk_size: The number of objects compared in one batch.
+
+        Yields:
+            The change record of every object in the puic range.
+        """
+        object_pairs = self._index_objects()
+        if object_paths is None:
+            puics = sorted(object_pairs)
+        else:
+            puics = sorted(
+                {
+                    puic
+                    for path in object_paths
+                    for puic in self._puics_by_path.get(path, [])
+                }
+            )
+        start = 0 if after_puic is None else bisect.bisect_right(puics, after_puic)
+        stop = (
+            len(puics) if until_puic is None else bisect.bisect_right(puics, until_puic)
+        )
+
+        for idx in range(start, stop, chunk_size):
+            chunk = puics[idx : min(idx + chunk_size, stop)]
+            for compared in self._get_transient_compared_objects(chunk):
+                yield self._get_change_record(compared)
+
+    def _get_transient_compared_objects(
+        self, puics: list[str]
+    ) -> list[ChangedImxObject]:
+        """Get the compared objects in the given order, objects not compared before are not memoized.
+
+        Objects not compared before are compared in a batch and released by the caller, so memory does
+        not grow with the compare. In changed only mode unchanged objects are skipped.
+        """
+        object_pairs = self._index_objects()
+        pending = [
+            puic
+            for puic in puics
+            if not self._is_compared(puic)
+            and not (self.changed_only and _has_equal_content(*object_pairs[puic]))
+        ]
+        built = self._compare_in_workers(pending, add_to_cache=False)
+        rest = [puic for puic in pending if puic not in built]
+        built.update(zip(rest, self._build_compared_objects(rest)))
+
+        compared_objects = []
+        for puic in puics:
+            compared = self._compared_by_puic.get(puic) or built.get(puic)
+            if compared is None or (
+                self.changed_only and compared.status == ChangeStatusEnum.UNCHANGED
+            ):
+                continue
+            compared_objects.append(compared)
         return compared_objects
 
-    def _replace_guids_with_names(self, input_string):
+    def _compare_in_workers(
+        self, puics: list[str], add_to_cache: bool = True
+    ) -> dict[str, ChangedImxObject]:
+        """Compare the objects not compared before in a process pool, the results are not memoized.
+
+        Workers get the property dicts and geometries only, objects with equal content are not send.
+        Chunks are mapped in order and results are assigned by puic, so output does not depend on workers.
+        Compared objects are only added to the compare cache if add_to_cache is set.
+        """
+        if self.workers < 2:
+            return {}
+
+        object_pairs = self._index_objects()
+        pending = [
+            puic
+            for puic in dict.fromkeys(puics)
+            if not self._is_compared(puic)
+            and puic not in self._stored_records
+            and not _has_equal_content(*object_pairs[puic])
+            and get_compare_cache_key(
+                puic, *object_pairs[puic], self.line_diff_tolerances
+            )
+            not in self._compare_cache
+        ]
+        workers = min(self.workers, len(pending) // MIN_OBJECTS_PER_WORKER)
+        if workers < 2:
+            return {}
+
+        logger.debug(f"compare {len(pending)} objects in {workers} processes")
+        chunk_size = math.ceil(len(pending) / (workers * 4))
+        chunks = [
+            pending[idx : idx + chunk_size]
+            for idx in range(0, len(pending), chunk_size)
+        ]
+        payloads = [
+            [_serialize_pair(*object_pairs[puic]) for puic in chunk] for chunk in chunks
+        ]
+        get_records = partial(
+            get_change_records, line_diff_tolerances=self.line_diff_tolerances
+        )
+        compared_by_puic: dict[str, ChangedImxObject] = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk, records in zip(chunks, executor.map(get_records, payloads)):
+                for puic, record in zip(chunk, records):
+                    t1, t2 = object_pairs[puic]
+                    compared = ChangedImxObject(t1=t1, t2=t2, change_record=record)
+                    if add_to_cache:
+                        self._compare_cache.add(
+                            get_compare_cache_key(
+                                puic, t1, t2, self.line_diff_tolerances
+                            ),
+                            compared,
+                        )
+                    compared_by_puic[puic] = compared
+        return compared_by_puic
+
+    @staticmethod
+    def _get_guid_display(t1: ImxObject | None, t2: ImxObject | None) -> str:
         def get_attr(t1, t2, attr="tag"):
             if t1 is None and t2 is None:
                 return ""
@@ -123,34 +1092,31 @@ class ImxContainerCompare:
 
             return getattr(t1, attr, "") if t1 == t2 else getattr(t2, attr, "")
 
-        def replacer(match):
-            guid = match.group(1)
-            obj = replacements.get(guid)
-            return f"{obj}" if obj else f"{guid}-not-present"  # {guid}|
-
-        # Regex to match GUIDs (with optional ++ or -- prefixes)
-        guid_pattern = r"(?:\+\+|--)?([0-9a-fA-F-]{36})"
-        guids = re.findall(guid_pattern, input_string)
-
-        replacements = {}
-        for guid in guids:
-            try:
-                multi_object = self._repo.find(guid)
-                t1 = multi_object.get_by_container_id(self.container_id_1)
-                t2 = multi_object.get_by_container_id(self.container_id_2)
-
-                tag = get_attr(t1, t2, "tag")
-                name = get_attr(t1, t2, "name")
-                if name == "":
-                    name = "NoName"
-
-                replacements[guid] = (
-                    f"{tag}|{name}|t1:{'✔' if t1 else 'X'}|t2:{'✔' if t2 else 'X'}"
+        tag = get_attr(t1, t2, "tag")
+        name = get_attr(t1, t2, "name")
+        if name == "":
+            name = "NoName"
+        return f"{tag}|{name}|t1:{'✔' if t1 else 'X'}|t2:{'✔' if t2 else 'X'}"
+
+    def _get_guid_displays(self) -> dict[str, str]:
+        """Get the display string of every puic in the repo, the table is build once per compare."""
+        if self._guid_displays is None:
+            self._guid_displays = {
+                multi_object.puic: self._get_guid_display(
+                    multi_object.get_by_container_id(self.container_id_1),
+                    multi_object.get_by_container_id(self.container_id_2),
                 )
-            except ValueError:
-                replacements[guid] = "NotPresent|Unknown|t1:X|t2:X"
+                for multi_object in self._repo.get_all()
+            }
+        return self._guid_displays
 
-        return re.sub(guid_pattern, replacer, input_string)
+    def _replace_guids_with_names(self, input_string):
+        guid_displays = self._get_guid_displays()
+
+        def replacer(match):
+            return guid_displays.get(match.group(1), GUID_NOT_PRESENT_DISPLAY)
+
+        return GUID_PATTERN.sub(replacer, input_string)
 
     def _nice_display(self, property_dict: dict[str, str]) -> dict[str, str]:
         new_property_dict = {}
@@ -174,6 +1140,7 @@ class ImxContainerCompare:
         add_analyse: bool = True,
         styled_df: bool = True,
         ref_display: bool = True,
+        statuses: list[ChangeStatusEnum] | None = None,
     ) -> pd.DataFrame:
         """
         Generates a DataFrame detailing the changes for a specific object path.
@@ -183,54 +1150,43 @@ class ImxContainerCompare:
             add_analyse (bool): Whether to add analysis to the DataFrame.
             styled_df (bool): Whether to apply styling to highlight changes.
             ref_display (bool): Whether to add reference display properties to the output.
+            statuses (list[ChangeStatusEnum] | None): Optional list of object statuses to filter the changes.
 
         Returns:
             pd.DataFrame: A DataFrame representing the changes for the specified object path.
         """
-        items = [
-            item
-            for item in self.compared_objects
-            if (item.t1 and item.t1.path in object_paths)
-            or (item.t2 and item.t2.path in object_paths)
-        ]
+        items = self.get_compared_objects(object_paths, statuses)
+        return self._get_pandas_from_compared_objects(
+            items, add_analyse=add_analyse, styled_df=styled_df, ref_display=ref_display
+        )
 
-        out = [item.get_change_dict(add_analyse=add_analyse) for item in items]
+    def _get_pandas_from_compared_objects(
+        self,
+        items: list[ChangedImxObject],
+        add_analyse: bool = True,
+        styled_df: bool = True,
+        ref_display: bool = True,
+    ) -> pd.DataFrame:
+        df = _get_diff_df(
+            self._get_change_dicts(
+                items, add_analyse=add_analyse, ref_display=ref_display
+            )
+        )
+        if not df.empty and styled_df:
+            # TODO: return styler or dataframe, probly give type errors all over the place...
+            df = self._style_diff_pandas(df)  # type: ignore[assignment]
+        return df
 
+    def _get_change_dicts(
+        self,
+        items: list[ChangedImxObject],
+        add_analyse: bool = True,
+        ref_display: bool = True,
+    ) -> list[dict[str, Any]]:
+        out = [item.get_change_dict(add_analyse=add_analyse) for item in items]
         if ref_display:
             out = [self._nice_display(item) for item in out]
-
-        df = pd.DataFrame(out)
-        if not df.empty:
-            df = clean_diff_df(df)
-
-            # TODO: remove path_to_root
-            df = df_columns_sort_start_end(
-                df,
-                [
-                    "@puic",
-                    "path",
-                    "tag",
-                    "status",
-                    "geometry_status",
-                    "ImxArea",
-                    "parent",
-                    "children",
-                    "@name",
-                ],
-                ["path_to_root"],
-            )
-            status_order = ["added", "changed", "type_change", "removed", "unchanged"]
-            df["status"] = pd.Categorical(
-                df["status"], categories=status_order, ordered=True
-            )
-            df = df.sort_values(by=["path", "status"])
-            df["status"] = df["status"].astype("object")
-
-            if styled_df:
-                # TODO: return styler or dataframe, probly give type errors all over the place...
-                df = self._style_diff_pandas(df)  # type: ignore[assignment]
-
-        return df
+        return out
 
     @staticmethod
     def _style_diff_pandas(df: pd.DataFrame) -> Styler:
@@ -255,6 +1211,7 @@ class ImxContainerCompare:
         object_paths: list[str] | None = None,
         to_wgs: bool = True,
         ref_display: bool = True,
+        statuses: list[ChangeStatusEnum] | None = None,
     ) -> ShapelyGeoJsonFeatureCollection:
         """
         Generates a GeoJSON feature collection representing the changed objects.
@@ -263,22 +1220,22 @@ class ImxContainerCompare:
             object_paths (list[str] | None): Optional list of object paths to filter the GeoJSON features. If None, all changed objects are included.
             to_wgs (bool): Whether to convert the coordinates to WGS84.
             ref_display (bool): Whether to add reference display properties to the output.
+            statuses (list[ChangeStatusEnum] | None): Optional list of object statuses to filter the GeoJSON features.
 
         Returns:
             ShapelyGeoJsonFeatureCollection: A GeoJSON collection representing the changed objects.
         """
-        if object_paths:
-            features = []
-            for item in self.compared_objects:
-                if item.t2 and item.t2.path in object_paths:
-                    features.append(item.as_geojson_feature(as_wgs=to_wgs))
-                elif item.t1 and item.t1.path in object_paths:
-                    features.append(item.as_geojson_feature(as_wgs=to_wgs))
+        items = self.get_compared_objects(object_paths or None, statuses)
 
-        else:
-            features = [
-                item.as_geojson_feature(as_wgs=to_wgs) for item in self.compared_objects
-            ]
+        return self._get_geojson_from_compared_objects(items, to_wgs, ref_display)
+
+    def _get_geojson_from_compared_objects(
+        self,
+        compared_objects: list[ChangedImxObject],
+        to_wgs: bool = True,
+        ref_display: bool = True,
+    ) -> ShapelyGeoJsonFeatureCollection:
+        features = [item.as_geojson_feature(as_wgs=to_wgs) for item in compared_objects]
 
         if ref_display:
             for feature in features:
@@ -288,6 +1245,11 @@ class ImxContainerCompare:
             features, crs=CrsEnum.WGS84 if to_wgs else CrsEnum.RD_NEW_NAP
         )
 
+    def _group_compared_objects_by_path(self) -> dict[str, list[ChangedImxObject]]:
+        """Group compared objects by their t1 and t2 path."""
+        self._compare_objects(list(self._index_objects()))
+        return {path: self._get_path_objects(path) for path in self._puics_by_path}
+
     def get_project_metadata_geojson(
         self, to_wgs: bool = True
     ) -> ShapelyGeoJsonFeatureCollection:
@@ -375,14 +1337,20 @@ class ImxContainerCompare:
         return ShapelyGeoJsonFeatureCollection(features)
 
     def create_geojson_files(
-        self, directory_path: str | Path, to_wgs: bool = True
+        self,
+        directory_path: str | Path,
+        to_wgs: bool = True,
+        max_workers: int | None = None,
     ) -> None:
         """
         Creates GeoJSON files for each unique object path in the compared objects.
 
+        Compared objects are grouped by path in a single pass, the files are built and written concurrently.
+
         Args:
             directory_path (str | Path): The directory where the GeoJSON files will be created.
             to_wgs (bool): Whether to convert the coordinates to WGS84.
+            max_workers (int | None): Maximum number of threads used to build and write the files.
         """
         logger.info("create geojson files")
 
@@ -390,26 +1358,34 @@ class ImxContainerCompare:
             directory_path = Path(directory_path)
         directory_path.mkdir(parents=True, exist_ok=True)
 
-        paths = self._repo.get_all_paths()
-
-        geojson_dict = {}
-        for path in paths:
-            geojson_dict[path] = self.get_geojson([path], to_wgs)
-
-        geojson_dict = dict(sorted(geojson_dict.items()))
-        geojson_dict = upper_keys_with_index(geojson_dict)
+        objects_by_path = self._group_compared_objects_by_path()
+        self._get_guid_displays()
+        paths = upper_keys_with_index(
+            {path: path for path in sorted(self._repo.get_all_paths())}
+        )
 
-        for path, geojson_collection in geojson_dict.items():
-            if len(geojson_collection.features) != 0:
-                logger.info(f"create geojson file {path}")
-                file_name = f"{directory_path}\\{path}.geojson"
-                geojson_collection.to_geojson_file(file_name)
+        file_builders = [
+            (
+                directory_path / f"{file_key}.geojson",
+                partial(
+                    self._get_geojson_from_compared_objects,
+                    objects_by_path.get(path, []),
+                    to_wgs,
+                ),
+            )
+            for file_key, path in paths.items()
+        ]
+        for file_name in write_geojson_files(
+            file_builders, max_workers=max_workers, skip_empty=True
+        ):
+            logger.info(f"created geojson file {file_name}")
 
         feature_collection = self.get_project_metadata_geojson(to_wgs=to_wgs)
-        file_name = f"{directory_path}\\ProjectMetadataAreas.geojson"
-        feature_collection.to_geojson_file(file_name)
+        feature_collection.to_geojson_file(
+            directory_path / "ProjectMetadataAreas.geojson"
+        )
 
-        logger.success("creating change excel file finished")
+        logger.success("creating geojson files finished")
 
     @staticmethod
     def _get_imx_details(info, container_id, prefix):
@@ -427,6 +1403,7 @@ class ImxContainerCompare:
         ref_display: bool = True,
         add_review_styles: bool = True,
         header_spec: HeaderSpec | None = None,
+        workers: int = 1,
     ) -> None:
         """
         Exports the overview and detailed changes to an Excel file. Adds header formatting in case a specification file is provided.
@@ -437,6 +1414,7 @@ class ImxContainerCompare:
             ref_display: if True we add ref display column
             add_review_styles: Whether to add review formatting styles to the Excel workbook. Defaults to True.
             header_spec: HeaderSpec object containing header metadata.
+            workers: The number of processes preparing the path sheets, sheets are written in order. Defaults to 1.
         """
 
         file_name = Path(file_name) if isinstance(file_name, str) else file_name
@@ -453,70 +1431,99 @@ class ImxContainerCompare:
 
         logger.info("create change excel file")
 
-        paths = self._repo.get_all_paths()
-        diff_dict = {
-            item: self.get_pandas(
-                [item],
-                add_analyse=add_analyse,
-                styled_df=False,
-                ref_display=ref_display,
-            )
-            for item in paths
-        }
-        diff_dict = dict(sorted(diff_dict.items()))
-        diff_dict = upper_keys_with_index(diff_dict)
-        diff_dict = add_overview_df_to_diff_dict(diff_dict)
+        # frames are build and written sheet by sheet, objects not compared before are released after
+        # their change dicts are made. The info and overview sheets are added first and written last.
+        object_pairs = self._index_objects()
+        if ref_display:
+            self._get_guid_displays()
+        sheet_paths = upper_keys_with_index(
+            {path: path for path in sorted(self._repo.get_all_paths())}
+        )
+        overview_sheet_name = shorten_sheet_name("meta-overview")
+        has_overview = any(
+            not (self.changed_only and _has_equal_content(*object_pairs[puic]))
+            for path in sheet_paths.values()
+            for puic in self._puics_by_path.get(path, [])
+        )
+        overview_dfs = []
+        unchanged_puics: set[str] = set()
+
+        def get_sheet_payloads() -> Iterator[tuple[str, list[dict[str, Any]]]]:
+            for key, path in sheet_paths.items():
+                puics = self._puics_by_path.get(path, [])
+                compared_objects = self._get_transient_compared_objects(puics)
+                if self.changed_only:
+                    unchanged_puics.update(
+                        set(puics).difference(item.puic for item in compared_objects)
+                    )
+                yield (
+                    key,
+                    self._get_change_dicts(
+                        compared_objects,
+                        add_analyse=add_analyse,
+                        ref_display=ref_display,
+                    ),
+                )
 
         with pd.ExcelWriter(
             file_name,
             engine="xlsxwriter",
-            engine_kwargs={"options": {"strings_to_numbers": True}},
+            engine_kwargs={
+                "options": EXCEL_WRITER_OPTIONS | {"strings_to_numbers": True}
+            },
         ) as writer:
-            process_info = {
-                "Diff Report": "",
-                "Run Date": datetime.now().isoformat(),
-                "": "",
-                **self._get_imx_details(self._imx_info, self.container_id_1, "T1"),
-                **self._get_imx_details(self._imx_info, self.container_id_2, "T2"),
-            }
-            inf_df = app_info_df(process_info)
-            write_df_to_sheet(writer, "info", inf_df, header=False, auto_filter=False)
+            get_or_add_worksheet(writer, "info")
+            if has_overview:
+                get_or_add_worksheet(writer, overview_sheet_name)
 
-            for key, df in diff_dict.items():
+            for key, future in prepare_sheets(
+                _prepare_diff_sheet, get_sheet_payloads(), header_loader, workers
+            ):
+                overview_df, df = future.result()
+                overview_dfs.append(overview_df)
                 if df.empty or df.shape[1] == 0:
                     continue
                 try:
                     sheet_name = shorten_sheet_name(key)
                     logger.debug(f"processing {key}")
 
-                    if key == "meta-overview":
-                        df = df.reset_index(drop=True)
-                    elif header_loader:
-                        df = header_loader.apply_metadata_header(df)
-
-                    df = df.fillna("")
-
-                    if key == "meta-overview":
-                        work_sheet = write_df_to_sheet(writer, sheet_name, df)
-                    elif not header_loader:
-                        del df["path_to_root"]
-                        styled_df = self._style_diff_pandas(df)
+                    if not header_loader:
                         work_sheet = write_df_to_sheet(
-                            writer, sheet_name, styled_df, grouped_columns=["G:H"]
+                            writer,
+                            sheet_name,
+                            df,
+                            grouped_columns=["G:H"],
+                            cell_format_fn=diff_cell_format,
                         )
                     else:
                         work_sheet = header_loader.to_excel_with_metadata(
                             writer,
                             sheet_name,
                             df,
-                            styler_fn=self._style_diff_pandas,
+                            cell_format_fn=diff_cell_format,
                         )
 
-                    if key != "meta-overview":
-                        set_sheet_color_by_change_status(df, work_sheet)
+                    set_sheet_color_by_change_status(df, work_sheet)
 
                 except Exception as e:
                     logger.exception(f"Error writing sheet '{sheet_name}': {e}")
+                del df
+
+            process_info = {
+                "Diff Report": "",
+                "Run Date": datetime.now().isoformat(),
+                "": "",
+                **self._get_imx_details(self._imx_info, self.container_id_1, "T1"),
+                **self._get_imx_details(self._imx_info, self.container_id_2, "T2"),
+            }
+            if self.changed_only:
+                process_info["Unchanged Objects"] = len(unchanged_puics)
+            inf_df = app_info_df(process_info)
+            write_df_to_sheet(writer, "info", inf_df, header=False, auto_filter=False)
+
+            if has_overview:
+                overview_df = get_overview_df(overview_dfs).reset_index(drop=True)
+                write_df_to_sheet(writer, overview_sheet_name, overview_df.fillna(""))
 
         if add_review_styles:
             add_review_styles_to_excel(file_name)
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -64,9 +65,26 @@ class ImxContainerCompareChain:
                 )
 
     def _set_comparisons(self) -> None:
-        for idx, (container_id_a, container_id_b) in enumerate(self.container_id_pairs):
-            compare = self.imx_repo.compare(container_id_a, container_id_b)
-            self._compare.append(compare)
+        # pairs in the chain more than once share their compare, all compares share the repo compare cache
+        compares: dict[tuple[str, str], ImxContainerCompare] = {}
+        for container_id_a, container_id_b in self.container_id_pairs:
+            pair = (container_id_a, container_id_b)
+            if pair not in compares:
+                compares[pair] = self.imx_repo.compare(container_id_a, container_id_b)
+            self._compare.append(compares[pair])
+
+    def _add_snapshot_columns(
+        self, df: pd.DataFrame, idx: int, item: ImxContainerCompare
+    ) -> pd.DataFrame:
+        df = df.copy()
+        if self.container_id_name_mapping:
+            df["snapshot_name"] = (
+                f"{self.container_id_name_mapping[item.container_id_1]} vs {self.container_id_name_mapping[item.container_id_2]}"
+            )
+        df["snapshot"] = idx
+        df["container_id_1"] = item.container_id_1
+        df["container_id_2"] = item.container_id_2
+        return clean_diff_df(df)
 
     def _get_combined_dataframe(self, object_paths: list[str]):
         dfs = []
@@ -74,33 +92,47 @@ class ImxContainerCompareChain:
             df = item.get_pandas(object_paths=object_paths, styled_df=False)
             if df.empty:
                 continue
-
-            if self.container_id_name_mapping:
-                df["snapshot_name"] = (
-                    f"{self.container_id_name_mapping[item.container_id_1]} vs {self.container_id_name_mapping[item.container_id_2]}"
-                )
-            df["snapshot"] = idx
-            df["container_id_1"] = item.container_id_1
-            df["container_id_2"] = item.container_id_2
-            df = clean_diff_df(df)
-            dfs.append(df)
+            dfs.append(self._add_snapshot_columns(df, idx, item))
         if len(dfs) == 0:
             return pd.DataFrame()
         return pd.concat(dfs, ignore_index=True)
 
+    @staticmethod
+    def _align_snapshots(df: pd.DataFrame) -> pd.DataFrame:
+        """Add a row for every puic missing in a snapshot, rows are ordered by puic and snapshot.
+
+        Only the missing rows are created, with a puic and snapshot and no values. Puics and snapshots
+        are ordered by first appearance.
+        """
+        puic_codes, puic_values = pd.factorize(df["@puic"], use_na_sentinel=False)
+        snapshot_codes, snapshot_values = pd.factorize(
+            df["snapshot"], use_na_sentinel=False
+        )
+        present = np.zeros((len(puic_values), len(snapshot_values)), dtype=bool)
+        present[puic_codes, snapshot_codes] = True
+        missing_puic_codes, missing_snapshot_codes = np.nonzero(~present)
+
+        order = puic_codes * len(snapshot_values) + snapshot_codes
+        if len(missing_puic_codes):
+            missing = pd.DataFrame(
+                {
+                    "@puic": puic_values.take(missing_puic_codes),
+                    "snapshot": snapshot_values.take(missing_snapshot_codes),
+                }
+            )
+            df = pd.concat([df, missing], ignore_index=True)
+            order = np.concatenate(
+                [
+                    order,
+                    missing_puic_codes * len(snapshot_values) + missing_snapshot_codes,
+                ]
+            )
+        return df.iloc[np.argsort(order, kind="stable")].reset_index(drop=True)
+
     @staticmethod
     def _process_dataframe(df: pd.DataFrame):
-        puic_values = df["@puic"].unique()
-        snapshot_values = df["snapshot"].unique()
-        all_combinations = pd.MultiIndex.from_product(
-            [puic_values.tolist(), snapshot_values.tolist()],
-            names=["@puic", "snapshot"],
-        ).to_frame(index=False)
-        df = all_combinations.merge(df, on=["@puic", "snapshot"], how="left")
-
-        for col in df.select_dtypes(include="category").columns:
-            df[col] = df[col].cat.add_categories("").fillna("")
-        df = df.fillna("")
+        # missing values are kept as NA, they are written as empty cells
+        df = ImxContainerCompareChain._align_snapshots(df)
 
         start_column = [
             "container_id_1",
@@ -124,6 +156,9 @@ class ImxContainerCompareChain:
         df["status"] = pd.Categorical(
             df["status"], categories=custom_order, ordered=True
         )
+        for column in ["path", "tag"]:
+            if column in df.columns:
+                df[column] = df[column].astype("category")
         return df
 
     @staticmethod
@@ -159,6 +194,51 @@ class ImxContainerCompareChain:
             df = self._style_dataframe(df)
         return df
 
+    def get_dataframes(
+        self,
+        object_paths: list[str] | None = None,
+        styled_df: bool = True,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Retrieves a processed dataframe for every object path in a single pass over the chain.
+
+        Every compare in the chain builds the frame of a path once, also if the pair is in the chain more
+        than once. The frames are equal to the frames of `get_dataframe` for a single path.
+
+        Args:
+            object_paths: The object paths to retrieve data from. If None, all paths of the repo are used.
+            styled_df: Whether to apply styling to the dataframes. Defaults to True.
+
+        Returns:
+            dict[str, pd.DataFrame]: The dataframe by object path, paths without changes in any compare
+                have an empty dataframe.
+        """
+        paths = (
+            list(object_paths)
+            if object_paths is not None
+            else sorted(self.imx_repo.get_all_paths())
+        )
+        compare_frames: dict[int, dict[str, pd.DataFrame]] = {}
+        path_dfs: dict[str, list[pd.DataFrame]] = {path: [] for path in paths}
+        for idx, item in enumerate(self._compare):
+            if id(item) not in compare_frames:
+                compare_frames[id(item)] = {
+                    path: item.get_pandas(object_paths=[path], styled_df=False)
+                    for path in paths
+                }
+            for path, df in compare_frames[id(item)].items():
+                if not df.empty:
+                    path_dfs[path].append(self._add_snapshot_columns(df, idx, item))
+
+        dataframes = {}
+        for path, dfs in path_dfs.items():
+            if len(dfs) == 0:
+                dataframes[path] = pd.DataFrame()
+                continue
+            df = self._process_dataframe(pd.concat(dfs, ignore_index=True))
+            dataframes[path] = self._style_dataframe(df) if styled_df else df
+        return dataframes
+
     def get_overview_dataframe(
         self,
         styled_df: bool = True,
@@ -209,16 +289,14 @@ class ImxContainerCompareChain:
 
         file_path = Path(file_path).resolve()
 
-        paths = self.imx_repo.get_all_paths()
-        diff_dict = {path: self.get_dataframe([path]) for path in sorted(paths)}
-        diff_dict = upper_keys_with_index(diff_dict)
+        diff_dict = upper_keys_with_index(self.get_dataframes())
 
         with pd.ExcelWriter(file_path, engine="xlsxwriter") as writer:
             for path, df in diff_dict.items():
                 logger.info(f"create sheet for imx path {path}")
                 sheet_name = shorten_sheet_name(path)
 
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
+                df.to_excel(writer, sheet_name=sheet_name, index=False, na_rep="")
                 worksheet = writer.sheets[sheet_name]
                 worksheet.autofit()
                 worksheet.freeze_panes(1, 0)
@@ -23,6 +23,7 @@ from imxInsights.utils.flatten_unflatten import (
     remove_sourceline_from_dict,
     sort_dict_by_sourceline,
 )
+from imxInsights.utils.hash import hash_flat_dict
 from imxInsights.utils.xml_helpers import (
     find_parent_entity,
     find_parent_with_tag,
@@ -80,6 +81,7 @@ class ImxObject:
         self.imx_situation: str | None = self._get_imx_situation()
         self.container_id: str | None = None
         self.refs: list[Any] = []
+        self._content_fingerprint: str | None = None
 
     def __repr__(self) -> str:
         return f"<ImxObject {self.path} puic={self.puic} name='{self.name}'/>"
@@ -181,6 +183,21 @@ class ImxObject:
     ):
         self._geometry = geometry
 
+    @property
+    def built_geometry(
+        self,
+    ) -> (
+        LineString
+        | Point
+        | Polygon
+        | MultiLineString
+        | MultiPoint
+        | MultiPolygon
+        | GeometryCollection
+    ):
+        """The geometry set by the repo builders, it is not part of the properties nor the content fingerprint."""
+        return self._geometry
+
     @property
     def extension_properties(self) -> dict[str, str]:
         extensions_dict = defaultdict(list)
@@ -188,6 +205,21 @@ class ImxObject:
             extensions_dict[f"extension.{item.tag}"].append(item.properties)
         return flatten_dict(dict(extensions_dict))
 
+    @property
+    def content_fingerprint(self) -> str:
+        """
+        Hash of the imx property dict, objects with equal fingerprints have equal properties.
+
+        The fingerprint is computed once and reused, it is reset when the object tree is (re)build.
+        """
+        if self._content_fingerprint is None:
+            self._content_fingerprint = hash_flat_dict(self.get_imx_property_dict())
+        return self._content_fingerprint
+
+    def reset_content_fingerprint(self) -> None:
+        """Reset the content fingerprint, it will be computed again on the next access."""
+        self._content_fingerprint = None
+
     def get_imx_property_dict(
         self,
         add_extension_properties: bool = True,
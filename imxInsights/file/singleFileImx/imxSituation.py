@@ -61,8 +61,11 @@ class ImxSituation(ImxRepo):
         directory_path: str | Path,
         to_wgs: bool = True,
         nice_display_ref: bool = True,
+        max_workers: int | None = None,
     ):
-        super().create_geojson_files(directory_path, to_wgs, nice_display_ref)
+        super().create_geojson_files(
+            directory_path, to_wgs, nice_display_ref, max_workers=max_workers
+        )
         dir_path = (
             Path(directory_path) if isinstance(directory_path, str) else directory_path
         )
@@ -1,23 +1,48 @@
+import gzip
+import json
 from collections import OrderedDict
+from collections.abc import Iterable
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 from loguru import logger
 
-from imxInsights.compare.imxContainerCompare import ImxContainerCompare
+from imxInsights.compare.custom_operators.diff_shapely import LineDiffTolerances
+from imxInsights.compare.imxContainerCompare import (
+    COMPARE_CACHE_SIZE,
+    CompareCache,
+    ImxContainerCompare,
+)
 from imxInsights.compare.imxContainerCompareChain import ImxContainerCompareChain
 from imxInsights.domain.imxObject import ImxObject
 from imxInsights.file.containerizedImx.imxContainerProtocol import ImxContainerProtocol
 from imxInsights.file.singleFileImx.imxSituationProtocol import ImxSituationProtocol
 from imxInsights.repo.imxMultiRepoObject import ImxMultiRepoObject
 from imxInsights.repo.imxMultiRepoProtocol import ImxMultiRepoProtocol
+from imxInsights.utils.parquet_helpers import (
+    build_exceptions_as_records,
+    import_pyarrow,
+    imx_file_hashes,
+    imx_objects_to_arrow_table,
+    write_parquet_table,
+)
 from imxInsights.utils.report_helpers import upper_keys_with_index
 from imxInsights.utils.shapely.shapely_geojson import (
     CrsEnum,
     ShapelyGeoJsonFeature,
     ShapelyGeoJsonFeatureCollection,
+    write_geojson_files,
 )
 from imxInsights.utils.shapely.shapely_transform import ShapelyTransform
+from imxInsights.utils.sqlite_helpers import (
+    create_path_views,
+    create_sqlite_database,
+    create_sqlite_indexes,
+    insert_imx_objects,
+    insert_rows,
+)
 
 
 class ImxMultiRepo(ImxMultiRepoProtocol):
@@ -26,6 +51,8 @@ class ImxMultiRepo(ImxMultiRepoProtocol):
         containers: list[ImxContainerProtocol | ImxSituationProtocol],
         container_aliases: list[str] | None = None,
         version_safe: bool = True,
+        compare_cache_dir: str | Path | None = None,
+        compare_cache_size: int = COMPARE_CACHE_SIZE,
     ):
         self._validate_containers(containers, version_safe, container_aliases)
         self.containers: list[ImxContainerProtocol | ImxSituationProtocol] = containers
@@ -37,6 +64,18 @@ class ImxMultiRepo(ImxMultiRepoProtocol):
             OrderedDict()
         )
         self._keys: frozenset[str] = frozenset()
+        # change records of changed pairs shared by the compares of this repo, a bounded lru cache
+        self._compare_cache = CompareCache(max_size=compare_cache_size)
+        # opt-in directory of saved compares, reused by compares of the same files
+        self.compare_cache_dir = (
+            Path(compare_cache_dir) if compare_cache_dir is not None else None
+        )
+        # multi repo objects are build once, with path, type and container presence indexes
+        self._multi_objects: dict[str, ImxMultiRepoObject] = {}
+        self._puic_positions: dict[str, int] = {}
+        self._puics_by_path: dict[str, list[str]] = {}
+        self._puics_by_type: dict[str, list[str]] = {}
+        self._puics_by_container: dict[str, set[str]] = {}
         self._process_container_objects()
         self._update_keys()
 
@@ -98,8 +137,43 @@ class ImxMultiRepo(ImxMultiRepoProtocol):
                 self.tree_dict[puic][container_id].append(imx_object)
 
     def _update_keys(self) -> None:
-        """Update the unique keys (puics) of the tree_dict."""
+        """Update the unique keys (puics) of the tree_dict and the indexes."""
         self._keys = frozenset(self.tree_dict.keys())
+        self._update_indexes()
+
+    def _update_indexes(self) -> None:
+        """Build the multi repo objects and the path, type and container presence indexes in a single pass."""
+        self._multi_objects = {}
+        self._puic_positions = {}
+        self._puics_by_path = {}
+        self._puics_by_type = {}
+        self._puics_by_container = {
+            container_id: set() for container_id in self.container_order
+        }
+        for puic in self.tree_dict:
+            multi_object = self._get_objects_by_key(puic)
+            self._puic_positions[puic] = len(self._multi_objects)
+            self._multi_objects[puic] = multi_object
+            for path in dict.fromkeys(obj.path for obj in multi_object):
+                self._puics_by_path.setdefault(path, []).append(puic)
+            for tag in dict.fromkeys(obj.tag for obj in multi_object):
+                self._puics_by_type.setdefault(tag, []).append(puic)
+            for container_id, imx_objects in self.tree_dict[puic].items():
+                if len(imx_objects) > 0:
+                    self._puics_by_container[container_id].add(puic)
+
+    def _get_indexed_objects(
+        self, index: dict[str, list[str]], keys: Iterable[str]
+    ) -> list[ImxMultiRepoObject]:
+        """Get the objects of the given index keys, in repo order and without duplicates."""
+        groups = [index[key] for key in dict.fromkeys(keys) if key in index]
+        if len(groups) == 1:
+            return [self._multi_objects[puic] for puic in groups[0]]
+        puics = sorted(
+            {puic for group in groups for puic in group},
+            key=self._puic_positions.__getitem__,
+        )
+        return [self._multi_objects[puic] for puic in puics]
 
     def get_container(self, container_id: str):
         container = [
@@ -135,45 +209,29 @@ class ImxMultiRepo(ImxMultiRepoProtocol):
         key: str,
     ) -> ImxMultiRepoObject:
         """Returns all ImxObject instances for a given key (puic), maintaining container order."""
+        if key in self._multi_objects:
+            return self._multi_objects[key]
         return self._get_objects_by_key(key)
 
     def get_all(self) -> list[ImxMultiRepoObject]:
         """Returns a list of tuples for each ImxObject, maintaining container order."""
-        return [self._get_objects_by_key(key) for key in self.tree_dict]
+        return list(self._multi_objects.values())
 
     def get_all_types(self) -> set[str]:
         """Returns all unique types (tags) of ImxObject instances."""
-        return {
-            obj.tag
-            for group in self.get_all() or []
-            for obj in (group or [])
-            if obj is not None
-        }
+        return set(self._puics_by_type)
 
     def get_by_types(self, object_types: list[str]) -> list[ImxMultiRepoObject]:
         """Returns all items by given types, will check first type of object."""
-        return [
-            item
-            for item in self.get_all()
-            if any(obj and obj.tag in object_types for obj in item)
-        ]
+        return self._get_indexed_objects(self._puics_by_type, object_types)
 
     def get_all_paths(self) -> set[str]:
         """Returns all unique paths of ImxObject instances."""
-        return {
-            obj.path
-            for group in self.get_all() or []
-            for obj in (group or [])
-            if obj and obj.path
-        }
+        return {path for path in self._puics_by_path if path}
 
     def get_by_paths(self, object_paths: list[str]) -> list[ImxMultiRepoObject]:
         """Returns all items by given paths, ensuring at least one item matches the paths."""
-        return [
-            item
-            for item in self.get_all()
-            if any(obj and obj.path in object_paths for obj in item)
-        ]
+        return self._get_indexed_objects(self._puics_by_path, object_paths)
 
     def get_pandas(
         self,
@@ -210,15 +268,20 @@ class ImxMultiRepo(ImxMultiRepoProtocol):
     def _filter_objects(
         self, types: list[str] | None, paths: list[str] | None
     ) -> list[ImxMultiRepoObject]:
-        """Filter objects by types or paths."""
-        imx_objects = []
-        if types:
-            imx_objects.extend(self.get_by_types(types))
-        if paths:
-            imx_objects.extend(self.get_by_paths(paths))
+        """Filter objects by types or paths, in repo order."""
         if not types and not paths:
-            imx_objects.extend(self.get_all())
-        return list(set(imx_objects))
+            return self.get_all()
+        if not paths:
+            return self.get_by_types(types or [])
+        if not types:
+            return self.get_by_paths(paths)
+        puics = {
+            item.puic for item in [*self.get_by_types(types), *self.get_by_paths(paths)]
+        }
+        return [
+            self._multi_objects[puic]
+            for puic in sorted(puics, key=self._puic_positions.__getitem__)
+        ]
 
     def _prepare_dataframe(self, df: pd.DataFrame, pivot_df: bool) -> pd.DataFrame:
         """Prepare and format the DataFrame."""
@@ -250,90 +313,311 @@ class ImxMultiRepo(ImxMultiRepoProtocol):
         extension_properties: bool = False,
     ) -> ShapelyGeoJsonFeatureCollection:
         """Generate a GeoJSON feature collection from a list of object types or paths."""
+        return self._get_geojson_from_objects(
+            [
+                imx_object
+                for item in self.get_by_paths(object_path)
+                for imx_object in item.imx_objects
+            ],
+            container_id,
+            as_wgs=as_wgs,
+            extension_properties=extension_properties,
+        )
+
+    @staticmethod
+    def _get_geojson_from_objects(
+        imx_objects: Iterable[ImxObject | None],
+        container_id: str,
+        as_wgs: bool = True,
+        extension_properties: bool = False,
+    ) -> ShapelyGeoJsonFeatureCollection:
         features: list[ShapelyGeoJsonFeature] = []
 
-        for item in self.get_by_paths(object_path):
-            for imx_object in item.imx_objects:
-                if not imx_object:
-                    continue
-                if imx_object.container_id != container_id:
-                    continue
-
-                location = None
-                if imx_object.geometry is not None:
-                    location = imx_object.geometry
-                if imx_object.geographic_location is not None and hasattr(
-                    imx_object.geographic_location, "shapely"
-                ):
-                    location = imx_object.geographic_location.shapely
-
-                if location:
-                    geometry = (
-                        ShapelyTransform.rd_to_wgs(location) if as_wgs else location
-                    )
-                    features.append(
-                        ShapelyGeoJsonFeature(
-                            geometry_list=[geometry],
-                            properties=imx_object.properties
-                            | (
-                                imx_object.extension_properties
-                                if extension_properties
-                                else {}
-                            ),
-                        )
+        for imx_object in imx_objects:
+            if not imx_object:
+                continue
+            if imx_object.container_id != container_id:
+                continue
+
+            location = None
+            if imx_object.geometry is not None:
+                location = imx_object.geometry
+            if imx_object.geographic_location is not None and hasattr(
+                imx_object.geographic_location, "shapely"
+            ):
+                location = imx_object.geographic_location.shapely
+
+            if location:
+                geometry = ShapelyTransform.rd_to_wgs(location) if as_wgs else location
+                features.append(
+                    ShapelyGeoJsonFeature(
+                        geometry_list=[geometry],
+                        properties=imx_object.properties
+                        | (
+                            imx_object.extension_properties
+                            if extension_properties
+                            else {}
+                        ),
                     )
+                )
         return ShapelyGeoJsonFeatureCollection(
             features, crs=CrsEnum.WGS84 if as_wgs else CrsEnum.RD_NEW_NAP
         )
 
+    def _group_container_objects_by_path(
+        self, container_id: str
+    ) -> dict[str, list[ImxObject]]:
+        """Group the objects of a container by every path its puic has in any container, from the indexes."""
+        if container_id not in self._puics_by_container:
+            raise ValueError(f"container_id:{container_id} not in repo.")
+        present = self._puics_by_container[container_id]
+        return {
+            path: [
+                self.tree_dict[puic][container_id][0]
+                for puic in puics
+                if puic in present
+            ]
+            for path, puics in self._puics_by_path.items()
+        }
+
     def create_geojson_files(
         self,
         directory_path: str | Path,
         container_id: str,
         as_wgs: bool = True,
         extension_properties: bool = False,
+        max_workers: int | None = None,
     ) -> None:
         """Create GeoJSON files for the specified object types or paths and save them to the given directory."""
         if isinstance(directory_path, str):
             directory_path = Path(directory_path)
         directory_path.mkdir(parents=True, exist_ok=True)
 
-        paths = self.get_all_paths()
-        geojson_dict = {}
-        for path in paths:
-            geojson_dict[path] = self.get_geojson(
-                [path],
-                container_id,
-                as_wgs=as_wgs,
-                extension_properties=extension_properties,
+        objects_by_path = self._group_container_objects_by_path(container_id)
+        paths = upper_keys_with_index(
+            {path: path for path in sorted(self.get_all_paths())}
+        )
+
+        file_builders = [
+            (
+                directory_path / f"{file_key}.geojson",
+                partial(
+                    self._get_geojson_from_objects,
+                    objects_by_path.get(path, []),
+                    container_id,
+                    as_wgs=as_wgs,
+                    extension_properties=extension_properties,
+                ),
             )
-        geojson_dict = dict(sorted(geojson_dict.items()))
-        geojson_dict = upper_keys_with_index(geojson_dict)
+            for file_key, path in paths.items()
+        ]
+        for container in self.containers:
+            if container.project_metadata:
+                file_builders.append(
+                    (
+                        directory_path
+                        / f"ProjectMetadata_{container.container_id}.geojson",
+                        partial(container.project_metadata.get_geojson, as_wgs),
+                    )
+                )
 
-        for path, feature_collection in geojson_dict.items():
-            file_name = f"{directory_path}\\{path}.geojson"
-            feature_collection.to_geojson_file(file_name)
+        for file_name in write_geojson_files(file_builders, max_workers=max_workers):
             logger.success(f"GeoJSON file created and saved at {file_name}.")
 
-        for container in self.containers:
-            if container.project_metadata:
-                feature_collection = container.project_metadata.get_geojson(
-                    as_wgs=as_wgs
+    def _group_objects_by_path(self) -> dict[str, list[ImxObject]]:
+        """Group the objects of all containers by their own path in a single pass, in container order."""
+        grouped: dict[str, list[ImxObject]] = {}
+        for container_objects in self.tree_dict.values():
+            for items in container_objects.values():
+                if len(items) > 0:
+                    grouped.setdefault(items[0].path, []).append(items[0])
+        return grouped
+
+    def to_parquet(self, directory_path: str | Path) -> list[Path]:
+        """
+        Write the objects of all containers to parquet files, one file per object path.
+
+        Each row is an object in one of the containers, identified by the container_id column. Properties are
+        stored as string columns and the geometry as WKB. The container order, imx versions, file hashes and
+        build exceptions are stored in the schema metadata. Files are written path by path so only one table
+        is in memory at the time.
+
+        !!! info
+            Parquet export requires the optional pyarrow dependency.
+
+        Args:
+            directory_path: The directory where the parquet files will be created.
+
+        Returns:
+            The paths of the created parquet files.
+        """
+        import_pyarrow()
+        if isinstance(directory_path, str):
+            directory_path = Path(directory_path)
+        directory_path.mkdir(parents=True, exist_ok=True)
+
+        build_exceptions = {
+            container.container_id: container.get_build_exceptions()
+            for container in self.containers
+        }
+        imx_versions = {
+            container.container_id: container.imx_version
+            for container in self.containers
+        }
+        file_paths = []
+        for path, imx_objects in sorted(self._group_objects_by_path().items()):
+            puics = {item.puic for item in imx_objects}
+            table = imx_objects_to_arrow_table(
+                imx_objects,
+                extra_columns={
+                    "container_id": [item.container_id for item in imx_objects]
+                },
+                metadata={
+                    "object_path": path,
+                    "container_order": self.container_order,
+                    "container_aliases": self.container_aliases,
+                    "imx_versions": imx_versions,
+                    "file_hashes": {
+                        container_id: imx_file_hashes(
+                            item
+                            for item in imx_objects
+                            if item.container_id == container_id
+                        )
+                        for container_id in self.container_order
+                    },
+                    "build_exceptions": {
+                        container_id: build_exceptions_as_records(exceptions, puics)
+                        for container_id, exceptions in build_exceptions.items()
+                    },
+                },
+            )
+            file_path = directory_path / f"{path}.parquet"
+            write_parquet_table(table, file_path)
+            file_paths.append(file_path)
+            logger.success(f"Parquet file created and saved at {file_path}.")
+        return file_paths
+
+    def to_sqlite(self, file_path: str | Path) -> Path:
+        """
+        Write the objects of all containers to a sqlite database, an existing file will be replaced.
+
+        The database has a table of containers, objects (with WKB geometry and bounding box), a long key
+        value table of flattened properties, refs, parent child edges and build exceptions. For every object
+        path a wide view with one column per property is created and an R*Tree index `objects_rtree` is
+        added on the bounding boxes. Objects are inserted container by container in bulk transactions.
+
+        ??? example
+            ```sql
+            SELECT o.puic, o.container_id FROM objects o
+            JOIN objects_rtree r ON r.object_id = o.object_id
+            WHERE r.min_x <= 150000 AND r.max_x >= 149000 AND r.min_y <= 430000 AND r.max_y >= 429000;
+            ```
+
+        Args:
+            file_path: The path of the sqlite file.
+
+        Returns:
+            The path of the created sqlite file.
+        """
+        file_path = Path(file_path)
+        connection = create_sqlite_database(file_path)
+        try:
+            insert_rows(
+                connection,
+                "containers",
+                (
+                    (
+                        container.container_id,
+                        idx,
+                        self.container_aliases[idx] if self.container_aliases else None,
+                        container.imx_version,
+                        str(container.path),
+                    )
+                    for idx, container in enumerate(self.containers)
+                ),
+            )
+
+            property_keys_by_path: dict[str, dict[str, None]] = {}
+            object_id = 1
+            for container in self.containers:
+                imx_objects = list(container.get_all())
+                insert_imx_objects(
+                    connection, imx_objects, object_id, property_keys_by_path
                 )
-                file_name = f"{directory_path}\\ProjectMetadata_{container.container_id}.geojson"
-                feature_collection.to_geojson_file(file_name)
-                logger.success(f"GeoJSON file created and saved at {file_name}.")
+                object_id += len(imx_objects)
+                insert_rows(
+                    connection,
+                    "build_exceptions",
+                    (
+                        (
+                            container.container_id,
+                            record["puic"],
+                            record["exception"],
+                            record["level"],
+                            record["msg"],
+                        )
+                        for record in build_exceptions_as_records(
+                            container.get_build_exceptions()
+                        )
+                    ),
+                )
+                logger.info(
+                    f"{len(imx_objects)} objects of {container.container_id} written to sqlite"
+                )
+
+            create_path_views(connection, dict(sorted(property_keys_by_path.items())))
+            create_sqlite_indexes(connection)
+        finally:
+            connection.close()
+
+        logger.success(f"Sqlite file created and saved at {file_path}.")
+        return file_path
 
     def compare(
         self,
         container_id_1: str,
         container_id_2: str,
         object_path: list[str] | None = None,
+        workers: int = 1,
+        changed_only: bool = False,
+        line_diff_tolerances: LineDiffTolerances | None = None,
     ) -> ImxContainerCompare:
         logger.info(
             f"compare {container_id_1} vs {container_id_2} {object_path if object_path else ''}"
         )
-        return ImxContainerCompare(self, container_id_1, container_id_2)
+        compare_kwargs: dict[str, Any] = {
+            "workers": workers,
+            "changed_only": changed_only,
+            "compare_cache": self._compare_cache,
+            "line_diff_tolerances": line_diff_tolerances,
+        }
+        compare = ImxContainerCompare(
+            self, container_id_1, container_id_2, **compare_kwargs
+        )
+        if self.compare_cache_dir is None:
+            return compare
+
+        file_path = self.compare_cache_dir / f"{compare.get_cache_key()}.jsonl.gz"
+        if file_path.exists():
+            try:
+                logger.info(f"reuse compare saved at {file_path}")
+                return ImxContainerCompare.load(
+                    file_path, self, container_id_1, container_id_2, **compare_kwargs
+                )
+            except (
+                ValueError,
+                json.JSONDecodeError,
+                gzip.BadGzipFile,
+                EOFError,
+                OSError,
+                KeyError,
+                TypeError,
+            ) as e:
+                logger.warning(f"Could not reuse saved compare {file_path}: {e}")
+
+        # objects are compared on request, the result is saved once all objects are compared
+        compare.save_when_complete(file_path)
+        return compare
 
     def compare_chain(
         self,
@@ -113,6 +113,10 @@ class ObjectTree:
         build_rail_connections(self.get_by_types, self.find, self.build_exceptions)
         add_refs(self.tree_dict, self.find)
 
+        # extensions and children of existing objects can change while adding a file
+        for imx_object in self.get_all():
+            imx_object.reset_content_fingerprint()
+
         # todo: classify area
 
     @staticmethod
@@ -225,6 +229,18 @@ class ObjectTree:
         """
         return list(set([item[0].path for item in self.tree_dict.values()]))
 
+    def get_grouped_by_paths(self) -> dict[str, list[ImxObject]]:
+        """
+        Groups all objects in the tree by their path in a single pass.
+
+        Returns:
+            dict[str, list[ImxObject]]: Mapping of object path to the ImxObjects on that path.
+        """
+        grouped: defaultdict[str, list[ImxObject]] = defaultdict(list)
+        for item in self.tree_dict.values():
+            grouped[item[0].path].append(item[0])
+        return dict(grouped)
+
     def get_by_paths(self, object_paths: list[str]) -> list[ImxObject]:
         """
         Retrieves objects of specified paths from the tree.
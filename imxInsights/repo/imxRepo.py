@@ -2,8 +2,9 @@ import tempfile
 import uuid
 import zipfile
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
@@ -13,12 +14,22 @@ from imxInsights.domain.imxObject import ImxObject
 from imxInsights.exceptions import ImxException
 from imxInsights.repo.imxObjectTree import ObjectTree
 from imxInsights.utils.areaClassifier import AreaClassifier
-from imxInsights.utils.headerAnnotator import HeaderSpec
+from imxInsights.utils.headerAnnotator import HeaderAnnotator, HeaderSpec
 from imxInsights.utils.pandas_helpers import df_columns_sort_start_end
+from imxInsights.utils.parquet_helpers import (
+    build_exceptions_as_records,
+    import_pyarrow,
+    imx_file_hashes,
+    imx_objects_to_arrow_table,
+    write_parquet_table,
+)
 from imxInsights.utils.report_helpers import (
+    EXCEL_WRITER_OPTIONS,
     add_nice_display,
     add_review_styles_to_excel,
     app_info_df,
+    get_ref_displays,
+    prepare_sheets,
     shorten_sheet_name,
     upper_keys_with_index,
     write_df_to_sheet,
@@ -27,10 +38,44 @@ from imxInsights.utils.shapely.shapely_geojson import (
     CrsEnum,
     ShapelyGeoJsonFeature,
     ShapelyGeoJsonFeatureCollection,
+    write_geojson_files,
 )
 from imxInsights.utils.shapely.shapely_transform import ShapelyTransform
 
 
+def _get_objects_df(records: list[dict], puic_as_index: bool = True) -> pd.DataFrame:
+    df = pd.DataFrame.from_records(records)
+
+    df = df_columns_sort_start_end(
+        df,
+        [
+            "@puic",
+            "path",
+            "tag",
+            "ImxArea",
+            "parent",
+            "children",
+            "@name",
+        ],
+        ["path_to_root"],
+    )
+
+    if not df.empty and puic_as_index:
+        df.set_index("@puic", inplace=False)
+        df.fillna("", inplace=True)
+    return df
+
+
+def _prepare_objects_sheet(
+    records: list[dict], header_loader: HeaderAnnotator | None
+) -> pd.DataFrame:
+    """Build the sheet frame of a path, runs in the sheet workers."""
+    df = _get_objects_df(records)
+    if header_loader:
+        df = header_loader.apply_metadata_header(df)
+    return df
+
+
 class ImxRepo:
     """
     Represents an IMX container.
@@ -50,6 +95,7 @@ class ImxRepo:
         self.imx_version: str | None = None
         self.file_path: Path = Path(imx_file_path)
         self.path: Path = self._get_file_path(imx_file_path=imx_file_path)
+        self._ref_displays: dict[str, str] | None = None
 
     def _get_file_path(self, imx_file_path: Path | str) -> Path:
         """
@@ -168,9 +214,15 @@ class ImxRepo:
         """
         return self._tree.build_exceptions.exceptions
 
+    def _get_ref_displays(self) -> dict[str, str]:
+        """Get the reference display string by puic, the table is build once per repo."""
+        if self._ref_displays is None:
+            self._ref_displays = get_ref_displays(self._tree.tree_dict)
+        return self._ref_displays
+
     @staticmethod
     def _extract_overview_properties(
-        imx_object, input_props=None, nice_display_ref=False
+        imx_object, input_props=None, nice_display_ref=False, ref_displays=None
     ):
         props = (
             imx_object.get_imx_property_dict()
@@ -183,7 +235,7 @@ class ImxRepo:
         )
 
         if nice_display_ref:
-            props = add_nice_display(imx_object, props)
+            props = add_nice_display(imx_object, props, ref_displays)
 
         return props
 
@@ -251,40 +303,31 @@ class ImxRepo:
                 for item in self.get_all()
             ]
         else:
-            value_objects = []
-            for item in object_type_or_path:
-                if "." in item:
-                    value_objects.extend(self.get_by_paths([item]))
-                else:
-                    value_objects.extend(self.get_by_types([item]))
-
-            records = [
-                self._extract_overview_properties(
-                    item, nice_display_ref=nice_display_ref
-                )
-                for item in value_objects
-            ]
+            records = self._get_object_records(
+                object_type_or_path, nice_display_ref=nice_display_ref
+            )
 
-        df = pd.DataFrame.from_records(records)
+        return _get_objects_df(records, puic_as_index=puic_as_index)
 
-        df = df_columns_sort_start_end(
-            df,
-            [
-                "@puic",
-                "path",
-                "tag",
-                "ImxArea",
-                "parent",
-                "children",
-                "@name",
-            ],
-            ["path_to_root"],
-        )
+    def _get_object_records(
+        self, object_type_or_path: list[str], nice_display_ref: bool = True
+    ) -> list[dict]:
+        ref_displays = self._get_ref_displays() if nice_display_ref else None
+        value_objects = []
+        for item in object_type_or_path:
+            if "." in item:
+                value_objects.extend(self.get_by_paths([item]))
+            else:
+                value_objects.extend(self.get_by_types([item]))
 
-        if not df.empty and puic_as_index:
-            df.set_index("@puic", inplace=False)
-            df.fillna("", inplace=True)
-        return df
+        return [
+            self._extract_overview_properties(
+                item,
+                nice_display_ref=nice_display_ref,
+                ref_displays=ref_displays,
+            )
+            for item in value_objects
+        ]
 
     def get_pandas_df_dict(
         self, key_based_on_type: bool = False, nice_display_ref: bool = False
@@ -330,9 +373,13 @@ class ImxRepo:
             "Metadata.@registrationTime",
             "Metadata.@source",
         ]
+        ref_displays = self._get_ref_displays() if nice_display_ref else None
         properties = [
             self._extract_overview_properties(
-                node, list_of_columns, nice_display_ref=nice_display_ref
+                node,
+                list_of_columns,
+                nice_display_ref=nice_display_ref,
+                ref_displays=ref_displays,
             )
             for node in nodes
         ]
@@ -367,8 +414,21 @@ class ImxRepo:
             ShapelyGeoJsonFeatureCollection: A GeoJSON feature collection containing the geographical features.
 
         """
+        return self._get_geojson_from_objects(
+            self.get_by_paths(object_path),
+            to_wgs=to_wgs,
+            nice_display_ref=nice_display_ref,
+        )
+
+    def _get_geojson_from_objects(
+        self,
+        imx_objects: Iterable[ImxObject],
+        to_wgs: bool = True,
+        nice_display_ref: bool = False,
+    ) -> ShapelyGeoJsonFeatureCollection:
+        ref_displays = self._get_ref_displays() if nice_display_ref else None
         features: list[ShapelyGeoJsonFeature] = []
-        for item in self.get_by_paths(object_path):
+        for item in imx_objects:
             location = None
             if item.geometry is not None:
                 location = item.geometry
@@ -385,7 +445,7 @@ class ImxRepo:
                 geometry = []
 
             properties = self._extract_overview_properties(
-                item, nice_display_ref=nice_display_ref
+                item, nice_display_ref=nice_display_ref, ref_displays=ref_displays
             )
 
             features.append(
@@ -404,28 +464,85 @@ class ImxRepo:
         directory_path: str | Path,
         to_wgs: bool = True,
         nice_display_ref: bool = True,
+        max_workers: int | None = None,
     ):
         """
         Create GeoJSON files for the specified object types or paths and save them to the given directory.
 
+        Objects are grouped by path in a single pass, the files are built and written concurrently.
+
         Args:
             directory_path: The directory where the GeoJSON files will be created.
             to_wgs: convert to WGS84
             nice_display_ref: add nice display refs
+            max_workers: maximum number of threads used to build and write the files
 
         """
         dir_path = Path(directory_path)
-        for path in self.get_all_paths():
-            dir_path.mkdir(parents=True, exist_ok=True)
-            geojson_feature_collection = self.get_geojson(
-                [path],
-                to_wgs=to_wgs,
-                nice_display_ref=nice_display_ref,
+        dir_path.mkdir(parents=True, exist_ok=True)
+        if nice_display_ref:
+            # build the display table before the file builders share it
+            self._get_ref_displays()
+
+        file_builders = [
+            (
+                dir_path / f"{path}.geojson",
+                partial(
+                    self._get_geojson_from_objects,
+                    imx_objects,
+                    to_wgs=to_wgs,
+                    nice_display_ref=nice_display_ref,
+                ),
             )
-            geojson_file_path = dir_path / f"{path}.geojson"
-            geojson_feature_collection.to_geojson_file(geojson_file_path)
+            for path, imx_objects in self._tree.get_grouped_by_paths().items()
+        ]
+        for geojson_file_path in write_geojson_files(
+            file_builders, max_workers=max_workers
+        ):
             logger.success(f"GeoJSON file created and saved at {geojson_file_path}.")
 
+    def to_parquet(self, directory_path: str | Path) -> list[Path]:
+        """
+        Write all objects to parquet files, one file per object path.
+
+        Properties are stored as string columns and the geometry as WKB. Container id, imx version, file hashes
+        and build exceptions are stored in the schema metadata. Files are written path by path so only one
+        table is in memory at the time.
+
+        !!! info
+            Parquet export requires the optional pyarrow dependency.
+
+        Args:
+            directory_path: The directory where the parquet files will be created.
+
+        Returns:
+            The paths of the created parquet files.
+        """
+        import_pyarrow()
+        dir_path = Path(directory_path)
+        dir_path.mkdir(parents=True, exist_ok=True)
+
+        build_exceptions = self.get_build_exceptions()
+        file_paths = []
+        for path, imx_objects in sorted(self._tree.get_grouped_by_paths().items()):
+            table = imx_objects_to_arrow_table(
+                imx_objects,
+                metadata={
+                    "object_path": path,
+                    "container_id": self.container_id,
+                    "imx_version": self.imx_version,
+                    "file_hashes": imx_file_hashes(imx_objects),
+                    "build_exceptions": build_exceptions_as_records(
+                        build_exceptions, {item.puic for item in imx_objects}
+                    ),
+                },
+            )
+            file_path = dir_path / f"{path}.parquet"
+            write_parquet_table(table, file_path)
+            file_paths.append(file_path)
+            logger.success(f"Parquet file created and saved at {file_path}.")
+        return file_paths
+
     @staticmethod
     def _get_full_path(node):
         """Recursively get the path from a node to the top ancestor."""
@@ -439,10 +556,12 @@ class ImxRepo:
         return path
 
     @staticmethod
-    def _find_missing_in_scope_puic_paths(header_loader, pandas_dict) -> pd.DataFrame:
+    def _find_missing_in_scope_puic_paths(
+        header_loader, paths_to_root: Iterable[str]
+    ) -> pd.DataFrame:
         """
         Return a DataFrame with a single column 'path' containing all in-scope .@puic
-        spec paths that are not present in the data.
+        spec paths that are not present in the data, given the path to root of the objects in the data.
         """
 
         spec = header_loader.spec_df
@@ -471,18 +590,7 @@ class ImxRepo:
         )
 
         # 2) Actual .@puic paths present in the data
-        #    We derive them from the first 'path_to_root' of each df (if present), then append '.@puic'
-        actual_puic_from_data = set()
-        for df in pandas_dict.values():
-            if (
-                isinstance(df, pd.DataFrame)
-                and not df.empty
-                and "path_to_root" in df.columns
-            ):
-                # use iloc[0] safely
-                root = df["path_to_root"].iloc[0]
-                if pd.notna(root):
-                    actual_puic_from_data.add(f"{root}.@puic")
+        actual_puic_from_data = {f"{root}.@puic" for root in paths_to_root if root}
 
         # 3) Compute missing items
         expected_set = set(map(str, expected_puic_spec))
@@ -496,8 +604,18 @@ class ImxRepo:
         add_review_styles: bool = True,
         nice_display_ref: bool = True,
         header_spec: HeaderSpec | None = None,
+        workers: int = 1,
     ):
-        """Writes the comparison results to an Excel file, applying formatting."""
+        """
+        Writes the repository objects to an Excel file, applying formatting.
+
+        Args:
+            file_path: The path of the Excel file.
+            add_review_styles: If True, review cell styles are added to the workbook.
+            nice_display_ref: If True, references are displayed by name.
+            header_spec: Optional spec to add metadata headers to the object sheets.
+            workers: The number of processes preparing the path sheets, sheets are written in order. Defaults to 1.
+        """
         file_name = Path(file_path) if isinstance(file_path, str) else file_path
         header_loader = None
         if header_spec:
@@ -512,18 +630,34 @@ class ImxRepo:
                 header_loader = header_spec.get_annotator()
 
         logger.info("create change excel file")
-        pandas_dict = dict(
-            sorted(self.get_pandas_df_dict(nice_display_ref=nice_display_ref).items())
+        # frames are build and written sheet by sheet, only the keys are needed up front
+        objects_by_path = self._tree.get_grouped_by_paths()
+        sheet_paths = upper_keys_with_index(
+            {path: path for path in sorted(objects_by_path)}
         )
-        pandas_dict = upper_keys_with_index(pandas_dict)
         overview_df = self.get_pandas_df_overview(nice_display_ref=nice_display_ref)
-        if header_spec:
+        if header_loader:
             not_present_but_in_scope = self._find_missing_in_scope_puic_paths(
-                header_loader, pandas_dict
+                header_loader,
+                {
+                    imx_objects[0].path_to_root
+                    for imx_objects in objects_by_path.values()
+                },
             )
 
+        def get_sheet_payloads() -> Iterator[tuple[str, list[dict]]]:
+            for key, path in sheet_paths.items():
+                yield (
+                    key,
+                    self._get_object_records([path], nice_display_ref=nice_display_ref),
+                )
+
         file_path = Path(file_path).resolve()
-        with pd.ExcelWriter(file_path, engine="xlsxwriter") as writer:
+        with pd.ExcelWriter(
+            file_path,
+            engine="xlsxwriter",
+            engine_kwargs={"options": EXCEL_WRITER_OPTIONS},
+        ) as writer:
             index_data = []
 
             process_data = {
@@ -547,7 +681,7 @@ class ImxRepo:
                     '=HYPERLINK("#META_OVERVIEW!A1", "Go to sheet")',
                 ]
             )
-            for key, df in pandas_dict.items():
+            for key in sheet_paths:
                 sheet_name = shorten_sheet_name(key)
                 index_data.append(
                     [sheet_name, key, f'=HYPERLINK("#{sheet_name}!A1", "Go to sheet")']
@@ -559,7 +693,6 @@ class ImxRepo:
                 writer, "INDEX", index_df, index=True, header=True, auto_filter=True
             )
 
-            overview_df.to_excel(writer, sheet_name="META_OVERVIEW", index=False)
             write_df_to_sheet(
                 writer,
                 "META_OVERVIEW",
@@ -568,8 +701,9 @@ class ImxRepo:
                 header=True,
                 auto_filter=True,
             )
+            del overview_df
 
-            if header_spec:
+            if header_loader:
                 write_df_to_sheet(
                     writer,
                     "InScopeMissingObjects",
@@ -579,13 +713,15 @@ class ImxRepo:
                     auto_filter=True,
                 )
 
-            for key, df in pandas_dict.items():
+            for key, future in prepare_sheets(
+                _prepare_objects_sheet, get_sheet_payloads(), header_loader, workers
+            ):
                 try:
                     sheet_name = shorten_sheet_name(key)
                     logger.debug(f"processing {key}")
+                    df = future.result()
 
                     if header_loader:
-                        df = header_loader.apply_metadata_header(df)
                         worksheet = header_loader.to_excel_with_metadata(
                             writer,
                             sheet_name,
@@ -603,6 +739,7 @@ class ImxRepo:
                         )
 
                     worksheet.set_column("E:F", options={"level": 1, "hidden": True})
+                    del df
 
                 except Exception as e:
                     logger.exception(f"Error writing sheet '{sheet_name}': {e}")
@@ -65,3 +65,22 @@ def hash_dict_ignor_nested(dictionary: dict) -> str:
 
     hash_object = hashlib.sha1(json.dumps(new_dict, sort_keys=True).encode())
     return hash_object.hexdigest()
+
+
+def hash_flat_dict(dictionary: dict) -> str:
+    """
+    Compute the SHA-1 hash of a flat dictionary, independent of the key order.
+
+    Two dictionaries with the same keys and values have the same hash, so the hash can be used as a
+    content fingerprint to skip comparing dictionaries that are equal.
+
+    Args:
+        dictionary (Dict): The flat dictionary whose content should be hashed.
+
+    Returns:
+        str: A hexadecimal string representing the SHA-1 hash of the dictionary.
+    """
+    hash_object = hashlib.sha1(
+        json.dumps(dictionary, sort_keys=True, default=str).encode()
+    )
+    return hash_object.hexdigest()
@@ -1,13 +1,20 @@
-from collections.abc import Callable
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from loguru import logger
-from pandas.io.formats.style import Styler
 from xlsxwriter.worksheet import Worksheet  # type: ignore
 
-from imxInsights.utils.report_helpers import apply_autofilter, autosize_columns
+from imxInsights.utils.report_helpers import (
+    CellFormatFn,
+    apply_autofilter,
+    autosize_columns,
+    write_df_rows,
+)
 
 # TODO: add info for display and analyse columns
 # TODO: write index on excel support? and rename index to write_index in write_df_to_sheet
@@ -78,6 +85,7 @@ class HeaderAnnotator:
         # Normalize spec file by applying transformations
         self._apply_hyperlink_columns()
         self._drop_ignored_and_duplicates()
+        self._build_spec_path_index()
 
     def _apply_hyperlink_columns(self) -> None:
         """
@@ -104,6 +112,31 @@ class HeaderAnnotator:
             self.spec_ignore_cols, axis="columns", errors="ignore"
         ).drop_duplicates()
 
+    def _build_spec_path_index(self) -> None:
+        """
+        Index the spec rows by path, so lookups do not scan the whole spec for every sheet.
+
+        Spec paths are kept sorted for prefix lookups and mapped to their row positions for exact
+        lookups. Spec slices are memoized by object base path.
+        """
+        spec_paths = self.spec_df[self.spec_path_col].tolist()
+        self._spec_positions_by_path: dict[str, list[int]] = defaultdict(list)
+        for position, spec_path in enumerate(spec_paths):
+            if isinstance(spec_path, str):
+                self._spec_positions_by_path[spec_path].append(position)
+        self._sorted_spec_paths = sorted(self._spec_positions_by_path)
+        self._specs_by_base_path: dict[str, pd.DataFrame] = {}
+
+    def _get_spec_positions_by_prefix(self, prefix: str) -> list[int]:
+        """Return the spec row positions of the paths starting with the prefix, in spec order."""
+        start = bisect_left(self._sorted_spec_paths, prefix)
+        positions = []
+        for spec_path in self._sorted_spec_paths[start:]:
+            if not spec_path.startswith(prefix):
+                break
+            positions.extend(self._spec_positions_by_path[spec_path])
+        return sorted(positions)
+
     @staticmethod
     def _clean_path(s: str) -> str:
         """
@@ -163,33 +196,11 @@ class HeaderAnnotator:
         # Collect all object bases that have a @puic (strip the trailing ".@puic")
         puic_bases = {p.rsplit(".", 1)[0] for p in paths if p.endswith(".@puic")}
 
-        # Keep only topmost puic bases:
-        #    - Sort bases by length (shortest first = higher in hierarchy)
-        #    - Discard bases that are descendants of already selected bases
-        sorted_bases = sorted(puic_bases, key=len)  # shortest first
-        topmost_bases: list[str] = []
-        for b in sorted_bases:
-            if not any(b.startswith(tb + ".") for tb in topmost_bases):
-                topmost_bases.append(b)
-
-        # Identify nested puic bases (descendants of a topmost base, not equal to it)
-        nested_puic_bases = {
-            b
-            for b in puic_bases
-            if any(b.startswith(tb + ".") for tb in topmost_bases if tb != b)
-        }
-
-        # Keep rows:
-        #    - that are under a topmost puic base
-        #    - but exclude rows under nested puic bases
+        # A path is under a topmost puic object if exactly one of its dotted prefixes is a puic
+        # base, more than one means it is under a nested puic object. The first puic base on the
+        # path is always a topmost base as no shorter puic base is above it.
         def keep_path(p: str) -> bool:
-            starts_with_any = any(
-                p.startswith(tb + ".") or p == tb for tb in topmost_bases
-            )
-            under_nested_puic = any(
-                p.startswith(nb + ".") or p == nb for nb in nested_puic_bases
-            )
-            return starts_with_any and not under_nested_puic
+            return sum(prefix in puic_bases for prefix in _dotted_prefixes(p)) == 1
 
         mask = paths.map(keep_path)
         return df[mask].copy()
@@ -198,19 +209,26 @@ class HeaderAnnotator:
         """
         Extract a subset of the specification relevant to a given object base path.
 
+        The subset is memoized by base path and must not be modified by the caller.
+
         Args:
             object_base_path (str): Path prefix to filter specification rows.
 
         Returns:
             pd.DataFrame: Specification rows starting with the given path.
         """
-        object_specs_df = self.spec_df[
-            self.spec_df[self.spec_path_col].str.startswith(object_base_path)
+        if object_base_path in self._specs_by_base_path:
+            return self._specs_by_base_path[object_base_path]
+
+        object_specs_df = self.spec_df.iloc[
+            self._get_spec_positions_by_prefix(object_base_path)
         ].copy()
         object_specs_df["field"] = object_specs_df[self.spec_path_col].str.slice(
             start=len(object_base_path)
         )
-        return self._filter_out_nested_puic_objects(object_specs_df)
+        object_specs_df = self._filter_out_nested_puic_objects(object_specs_df)
+        self._specs_by_base_path[object_base_path] = object_specs_df
+        return object_specs_df
 
     def _build_column_path_map(
         self, df: pd.DataFrame, object_base_path: str
@@ -272,9 +290,14 @@ class HeaderAnnotator:
         )
 
         # Handle extension objects via direct matches on full paths in the spec
+        direct_match_positions = sorted(
+            position
+            for field_name in column_path_map_df["field"].dropna().unique()
+            for position in self._spec_positions_by_path.get(field_name, [])
+        )
         direct_match_specs_df = pd.merge(
             column_path_map_df,
-            self.spec_df,
+            self.spec_df.iloc[direct_match_positions],
             how="inner",
             left_on="field",
             right_on=self.spec_path_col,
@@ -475,37 +498,33 @@ class HeaderAnnotator:
         index: bool = False,
         header: bool = True,
         auto_filter: bool = True,
-        styler_fn: Callable | None = None,
+        cell_format_fn: CellFormatFn | None = None,
     ) -> Worksheet:
         """
-        Write a DataFrame or Styler to an Excel worksheet, including metadata header rows.
+        Write a DataFrame to an Excel worksheet, including metadata header rows.
 
         The header rows are styled in gray and frozen, while the data block
-        may have styling applied through a custom styler function.
+        may have cell formats applied through a custom format function. Rows are
+        written in order so the writer can be in constant memory mode.
 
         Args:
             writer: An ExcelWriter object.
             sheet_name (str): Target worksheet name.
-            df (pd.DataFrame | Styler): Data or styled DataFrame including metadata rows.
+            df (pd.DataFrame): Data including metadata rows.
             index (bool, optional): Write index column. Default False.
             header (bool, optional): Write column headers. Default True.
             auto_filter (bool, optional): Add an autofilter. Default True.
-            styler_fn (Callable, optional): Function applied to style the body rows.
+            cell_format_fn (CellFormatFn, optional): Returns the format of a body cell by column and value.
 
         Returns:
             Worksheet: The created xlsxwriter worksheet object.
         """
-        is_metadata_row = df.index.to_series().apply(lambda x: isinstance(x, str))
+        is_metadata_row = np.fromiter(
+            (isinstance(label, str) for label in df.index), dtype=bool, count=len(df)
+        )
         metadata_block_df = df[is_metadata_row]
 
         metadata_rows = len(metadata_block_df)
-        metadata_block_df.to_excel(
-            writer,
-            sheet_name=sheet_name,
-            index=index,
-            header=False,
-        )
-        worksheet = writer.sheets[sheet_name]
 
         # Style all specification rows
         metadata_cell_format = {
@@ -517,31 +536,32 @@ class HeaderAnnotator:
             "border": 7,
             "text_wrap": True,
         }
-        metadata_format = writer.book.add_format(metadata_cell_format)
-
-        for _, _row in df[is_metadata_row].iterrows():
-            xlsx_row_idx = df.index.get_loc(_row.name)
-            worksheet.set_row(xlsx_row_idx, 15.0001, metadata_format)
+        worksheet = write_df_rows(
+            writer,
+            sheet_name,
+            metadata_block_df,
+            index=index,
+            header=False,
+            row_format=metadata_cell_format,
+            row_height=15.0001,
+        )
 
         data_block = df[~is_metadata_row]
-        if styler_fn:
-            data_block = styler_fn(data_block)
-
-        data_block.to_excel(
+        write_df_rows(
             writer,
-            sheet_name=sheet_name,
+            sheet_name,
+            data_block,
+            start_row=metadata_rows,
             index=index,
             header=header,
-            startrow=metadata_rows,
+            cell_format_fn=cell_format_fn,
         )
 
         worksheet.freeze_panes(metadata_rows + 1, 2)
 
         # Calculate widths and apply filter only to the data area
-        data_df = df.data if isinstance(df, Styler) else df  # type: ignore
-
-        if auto_filter and not data_df.empty:
-            apply_autofilter(worksheet, start_row=metadata_rows, data_df=data_df)
+        if auto_filter and not df.empty:
+            apply_autofilter(worksheet, start_row=metadata_rows, data_df=df)
 
         # TODO: refactor below
         autosize_columns(
@@ -558,6 +578,15 @@ class HeaderAnnotator:
         return worksheet
 
 
+def _dotted_prefixes(path: str) -> Iterator[str]:
+    """Yield the prefixes of a dotted path ending at a dot, and the path itself."""
+    dot_idx = path.find(".")
+    while dot_idx != -1:
+        yield path[:dot_idx]
+        dot_idx = path.find(".", dot_idx + 1)
+    yield path
+
+
 @dataclass
 class HeaderSpec:
     """
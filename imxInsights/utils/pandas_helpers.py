@@ -1,3 +1,7 @@
+import re
+from typing import Any
+
+import numpy as np
 import pandas as pd
 
 
@@ -51,16 +55,58 @@ def styler_highlight_change_status(value: str) -> str:  # pragma: no cover
     return ""
 
 
-def style_puic_groups(df):  # pragma: no cover
-    styles = pd.DataFrame("", index=df.index, columns=df.columns)
-    last_value = None
+# xlsxwriter equivalents of the css used by styler_highlight_changes and styler_highlight_change_status
+_CHANGE_FONT_COLORS = {"++": "#FF0000", "--": "#0000FF", "->": "#008000"}
+_CHANGE_STATUS_FONT_COLORS = {
+    "added": "#FF0000",
+    "changed": "#008000",
+    "removed": "#0000FF",
+}
+_DIFF_CELL_FORMAT = {"border": 1, "border_color": "#000000", "valign": "vcenter"}
+_DIFF_CELL_FORMATS_BY_FONT_COLOR = {
+    color: _DIFF_CELL_FORMAT | {"font_color": color, "bold": True}
+    for color in [*_CHANGE_FONT_COLORS.values(), *_CHANGE_STATUS_FONT_COLORS.values()]
+}
+_DIFF_EXCLUDED_COLUMNS = re.compile(r"(\.display|\|analyse)$")
+
 
-    for i in range(len(df)):
-        if df["@puic"].iloc[i] != last_value:
-            styles.iloc[i, :] = "border-top: 2px solid black;"
-        last_value = df["@puic"].iloc[i]
+def diff_cell_format(column: str, value: Any) -> dict[str, Any]:
+    """
+    Get the xlsxwriter cell format of a diff DataFrame cell, the same look as the diff Styler.
+
+    Args:
+        column: The column name of the cell.
+        value: The value of the cell.
 
-    return styles
+    Returns:
+        The xlsxwriter format properties.
+    """
+    value = "" if value is None else str(value)
+    font_color = None
+    if column == "status":
+        font_color = _CHANGE_STATUS_FONT_COLORS.get(value)
+    elif not _DIFF_EXCLUDED_COLUMNS.search(column):
+        if value.startswith("++"):
+            font_color = _CHANGE_FONT_COLORS["++"]
+        elif value.startswith("--"):
+            font_color = _CHANGE_FONT_COLORS["--"]
+        elif "->" in value:
+            font_color = _CHANGE_FONT_COLORS["->"]
+
+    if font_color is None:
+        return _DIFF_CELL_FORMAT
+    return _DIFF_CELL_FORMATS_BY_FONT_COLOR[font_color]
+
+
+def style_puic_groups(df):  # pragma: no cover
+    puics = df["@puic"]
+    group_start = (puics != puics.shift()).to_numpy()
+    styles = np.where(group_start, "border-top: 2px solid black;", "")
+    return pd.DataFrame(
+        np.repeat(styles[:, None], len(df.columns), axis=1),
+        index=df.index,
+        columns=df.columns,
+    )
 
 
 def df_columns_sort_start_end(
@@ -0,0 +1,149 @@
+import json
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pyproj
+import shapely
+
+from imxInsights.domain.imxObject import ImxObject
+from imxInsights.exceptions import ImxException
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+GEOMETRY_COLUMN = "geometry"
+GEOMETRY_CRS = "EPSG:7415"
+
+
+def import_pyarrow():
+    """
+    Import pyarrow, pyarrow is an optional dependency only needed for columnar exports.
+
+    Returns:
+        The pyarrow and pyarrow.parquet modules.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(  # noqa: TRY003
+            "Parquet export requires pyarrow, install it by `pip install imxInsights[parquet]`."
+        ) from e
+    return pa, pq
+
+
+def build_exceptions_as_records(
+    build_exceptions: Mapping[str, list[ImxException]],
+    puics: set[str] | None = None,
+) -> list[dict[str, str]]:
+    """
+    Convert build exceptions to json serializable records.
+
+    Args:
+        build_exceptions: Build exceptions by puic.
+        puics: If given, only exceptions of these puics are returned.
+
+    Returns:
+        A list of records with puic, exception type, level and message.
+    """
+    return [
+        {
+            "puic": puic,
+            "exception": type(exception).__name__,
+            "level": exception.level.value,
+            "msg": exception.msg,
+        }
+        for puic, exceptions in build_exceptions.items()
+        if puics is None or puic in puics
+        for exception in exceptions
+    ]
+
+
+def _geo_metadata() -> dict[str, Any]:
+    return {
+        "version": "1.0.0",
+        "primary_column": GEOMETRY_COLUMN,
+        "columns": {
+            GEOMETRY_COLUMN: {
+                "encoding": "WKB",
+                "geometry_types": [],
+                "crs": pyproj.CRS(GEOMETRY_CRS).to_json_dict(),
+            }
+        },
+    }
+
+
+def imx_objects_to_arrow_table(
+    imx_objects: list[ImxObject],
+    extra_columns: dict[str, list[Any]] | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> "pa.Table":
+    """
+    Create an Arrow table of ImxObjects, one row per object.
+
+    All flattened imx properties become string columns, the geometry is stored as WKB in a binary column
+    described by GeoParquet metadata. Metadata values are stored json encoded in the schema metadata.
+
+    Args:
+        imx_objects: The objects to put in the table.
+        extra_columns: Columns to put in front of the property columns, one value per object.
+        metadata: Key value pairs added to the schema metadata.
+
+    Returns:
+        The Arrow table.
+    """
+    pa, _ = import_pyarrow()
+
+    records = [imx_object.get_imx_property_dict() for imx_object in imx_objects]
+    property_columns = list(dict.fromkeys(key for record in records for key in record))
+
+    columns: dict[str, Any] = {}
+    for key, values in (extra_columns or {}).items():
+        columns[key] = pa.array(values, type=pa.string())
+    for key in property_columns:
+        columns[key] = pa.array(
+            [
+                None if record.get(key) is None else str(record[key])
+                for record in records
+            ],
+            type=pa.string(),
+        )
+
+    geometries = [imx_object.geometry for imx_object in imx_objects]
+    wkb = shapely.to_wkb(geometries, output_dimension=3)
+    columns[GEOMETRY_COLUMN] = pa.array(
+        [
+            None if geometry is None or geometry.is_empty else value
+            for geometry, value in zip(geometries, wkb)
+        ],
+        type=pa.binary(),
+    )
+
+    schema_metadata = {
+        key: json.dumps(value) for key, value in (metadata or {}).items()
+    } | {"geo": json.dumps(_geo_metadata())}
+    return pa.table(columns).replace_schema_metadata(schema_metadata)
+
+
+def imx_file_hashes(imx_objects: Iterable[ImxObject]) -> dict[str, str]:
+    """Return the file hash by file name of the imx files the given objects are parsed from."""
+    return {
+        imx_object.imx_file.path.name: imx_object.imx_file.file_hash
+        for imx_object in imx_objects
+    }
+
+
+def write_parquet_table(table: "pa.Table", file_path: str | Path) -> None:
+    """
+    Write an Arrow table to a parquet file.
+
+    Args:
+        table: The table to write.
+        file_path: The path of the parquet file.
+    """
+    _, pq = import_pyarrow()
+    pq.write_table(table, file_path)
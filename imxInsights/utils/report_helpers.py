@@ -1,17 +1,25 @@
+import copy
 import importlib.metadata
 import os
+import shutil
 import tempfile
+import weakref
 import xml.etree.ElementTree as ET
 import zipfile
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
+import numpy as np
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import NamedStyle, PatternFill
 from pandas.io.formats.style import Styler
+from xlsxwriter.utility import xl_cell_to_rowcol  # type: ignore
 from xlsxwriter.worksheet import Worksheet  # type: ignore
 
+from imxInsights.domain.imxReferenceObjects import ImxRef, RefStatus
+
 INVALID_SHEET_CHARS = set(r"[]:*?/\\")
 
 
@@ -154,6 +162,183 @@ def app_info_df(process_data: dict) -> pd.DataFrame:
     return metadata_df
 
 
+CellFormatFn = Callable[[str, Any], dict[str, Any] | None]
+"""Returns the xlsxwriter format properties of a cell by column name and value, or None for no format."""
+
+# write constant memory workbooks, every row is flushed to disk once the next row is written
+EXCEL_WRITER_OPTIONS: dict[str, Any] = {"constant_memory": True}
+
+# the look of the header and index cells written by pandas
+HEADER_CELL_FORMAT: dict[str, Any] = {
+    "bold": True,
+    "border": 1,
+    "align": "center",
+    "valign": "top",
+}
+
+# column widths are estimated from an even sample of at most this many rows
+WIDTH_SAMPLE_ROWS = 2000
+
+
+# formats by workbook and format properties, shared by all sheets written to a workbook
+_WORKBOOK_FORMATS: "weakref.WeakKeyDictionary[Any, dict[tuple, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_cached_format(workbook, properties: dict[str, Any] | None):
+    """
+    Return the workbook format of the given format properties, a format is added once per workbook.
+
+    Args:
+        workbook: The xlsxwriter workbook.
+        properties: The xlsxwriter format properties.
+
+    Returns:
+        The format, or None if no properties are given.
+    """
+    if not properties:
+        return None
+    formats = _WORKBOOK_FORMATS.setdefault(workbook, {})
+    key = tuple(properties.items())
+    if key not in formats:
+        formats[key] = workbook.add_format(properties)
+    return formats[key]
+
+
+def get_or_add_worksheet(writer, sheet_name: str) -> Worksheet:
+    """Return the worksheet of the writer by name, the worksheet is added if not present."""
+    worksheet = writer.book.get_worksheet_by_name(sheet_name)
+    if worksheet is None:
+        worksheet = writer.book.add_worksheet(sheet_name)
+    return worksheet
+
+
+def _get_index_run_starts(index: pd.Index) -> list[list[int]]:
+    """Get for every index level and row the position of the first row with the same labels up to that level."""
+    labels = list(index) if index.nlevels > 1 else [(item,) for item in index]
+    run_starts = []
+    for level in range(index.nlevels):
+        starts: list[int] = []
+        for position, label in enumerate(labels):
+            same_as_previous = (
+                level < index.nlevels - 1
+                and position > 0
+                and label[: level + 1] == labels[position - 1][: level + 1]
+            )
+            starts.append(starts[-1] if same_as_previous else position)
+        run_starts.append(starts)
+    return run_starts
+
+
+def _write_index_cells(
+    worksheet: Worksheet,
+    row_idx: int,
+    position: int,
+    index_value: Any,
+    run_starts: list[list[int]],
+    cell_format: Any = None,
+) -> None:
+    """
+    Write the index labels of a row, repeated labels of outer levels are only written on the first row.
+
+    Pandas merges the cells of repeated labels, merge ranges can not be added in constant memory mode
+    once the first row of the range is flushed.
+    """
+    labels = index_value if len(run_starts) > 1 else (index_value,)
+    for level, (label, starts) in enumerate(zip(labels, run_starts)):
+        if starts[position] == position:
+            worksheet.write(row_idx, level, label, cell_format)
+
+
+def write_df_rows(
+    writer,
+    sheet_name: str,
+    df: pd.DataFrame,
+    *,
+    start_row: int = 0,
+    index: bool = False,
+    header: bool = True,
+    cell_format_fn: CellFormatFn | None = None,
+    row_format: dict[str, Any] | None = None,
+    row_height: float | None = None,
+    header_format: dict[str, Any] | None = HEADER_CELL_FORMAT,
+) -> Worksheet:
+    """
+    Write a DataFrame to an Excel sheet row by row.
+
+    Pandas writes frames column by column, that does not work for workbooks in constant memory mode
+    where a row is flushed to disk as soon as the next row is started.
+
+    Args:
+        writer: An ExcelWriter object using the xlsxwriter engine.
+        sheet_name: Target worksheet name, the sheet is added if not present.
+        df: The DataFrame to write.
+        start_row: Zero-based row to start writing.
+        index: Write the index as first column.
+        header: Write the column names as first row.
+        cell_format_fn: Returns the format properties of a data cell by column name and value.
+        row_format: Format properties set on every data row, cells without own format use it.
+        row_height: Height set on every data row.
+        header_format: Format properties of the column name and index cells, the pandas look by default.
+
+    Returns:
+        Worksheet: The xlsxwriter worksheet object.
+    """
+    worksheet = get_or_add_worksheet(writer, sheet_name)
+    # format functions mostly return shared dicts, keep them referenced so the ids stay unique
+    formats_by_id: dict[int, tuple[dict[str, Any], Any]] = {}
+
+    def _get_format(properties: dict[str, Any] | None):
+        if not properties:
+            return None
+        cached = formats_by_id.get(id(properties))
+        if cached is None or cached[0] is not properties:
+            cached = (properties, get_cached_format(writer.book, properties))
+            formats_by_id[id(properties)] = cached
+        return cached[1]
+
+    row_cell_format = _get_format(row_format)
+    header_cell_format = _get_format(header_format) if header or index else None
+    columns = [str(column) for column in df.columns]
+    col_offset = df.index.nlevels if index else 0
+    run_starts = _get_index_run_starts(df.index) if index else []
+
+    row_idx = start_row
+    if header:
+        if index:
+            worksheet.write_row(row_idx, 0, df.index.names, header_cell_format)
+        worksheet.write_row(row_idx, col_offset, columns, header_cell_format)
+        row_idx += 1
+
+    values = df.to_numpy(dtype=object, copy=True)
+    values[pd.isna(values)] = None
+    for position, (index_value, row_values) in enumerate(zip(df.index, values)):
+        if row_cell_format is not None or row_height is not None:
+            worksheet.set_row(row_idx, row_height, row_cell_format)
+        if index:
+            _write_index_cells(
+                worksheet,
+                row_idx,
+                position,
+                index_value,
+                run_starts,
+                header_cell_format,
+            )
+        if cell_format_fn is None:
+            # empty cells without format are skipped by xlsxwriter
+            worksheet.write_row(row_idx, col_offset, row_values)
+        else:
+            for col_idx, (column, value) in enumerate(zip(columns, row_values)):
+                cell_format = _get_format(cell_format_fn(column, value))
+                if value is None and cell_format is None:
+                    continue
+                worksheet.write(row_idx, col_idx + col_offset, value, cell_format)
+        row_idx += 1
+
+    return worksheet
+
+
 def write_df_to_sheet(
     writer,
     sheet_name: str,
@@ -163,10 +348,27 @@ def write_df_to_sheet(
     header: bool = True,
     auto_filter: bool = True,
     grouped_columns: list[str] | None = None,
+    cell_format_fn: CellFormatFn | None = None,
 ) -> Worksheet:
-    """Write a DataFrame or Styler object to an Excel sheet."""
-    df.to_excel(writer, sheet_name=sheet_name, index=index, header=header)
-    worksheet = writer.sheets[sheet_name]
+    """
+    Write a DataFrame or Styler object to an Excel sheet.
+
+    DataFrames are written row by row and can be used with constant memory workbooks, cell formats are
+    given by the cell_format_fn. Styler objects are written by pandas and need a workbook in the default
+    mode.
+    """
+    if isinstance(df, Styler):
+        df.to_excel(writer, sheet_name=sheet_name, index=index, header=header)
+        worksheet = writer.sheets[sheet_name]
+    else:
+        worksheet = write_df_rows(
+            writer,
+            sheet_name,
+            df,
+            index=index,
+            header=header,
+            cell_format_fn=cell_format_fn,
+        )
     worksheet.freeze_panes(1, 0)
 
     data = df.data if isinstance(df, Styler) else df  # type: ignore
@@ -175,14 +377,99 @@ def write_df_to_sheet(
         num_cols = len(data.columns) - 1
         worksheet.autofilter(0, 0, 0, num_cols)
 
-    if grouped_columns:
-        for grouped_column in grouped_columns:
-            worksheet.set_column(grouped_column, options={"level": 1, "hidden": True})
-
-    worksheet.autofit()
+    # widths are estimated from the frame, autofit needs all cells in memory and is slow on large sheets
+    grouped_options = {
+        col_idx: {"level": 1, "hidden": True}
+        for grouped_column in grouped_columns or []
+        for col_idx in column_range_indices(grouped_column)
+    }
+    autosize_columns(
+        worksheet,
+        data.reset_index() if index else data,
+        0,
+        min_width=8,
+        header_min_width=80,
+        padding=2,
+        column_options=grouped_options,
+    )
     return worksheet
 
 
+def column_range_indices(column_range: str) -> range:
+    """Return the zero-based column indices of an Excel column range like "G:H"."""
+    first, _, last = column_range.partition(":")
+    _, first_col = xl_cell_to_rowcol(f"{first}1")
+    _, last_col = xl_cell_to_rowcol(f"{last or first}1")
+    return range(first_col, last_col + 1)
+
+
+P = TypeVar("P")
+R = TypeVar("R")
+
+# the header annotator of a sheet worker process, set once per process so it is not send per sheet
+_sheet_worker_header_loader: Any = None
+
+
+def _init_sheet_worker(header_loader: Any) -> None:
+    global _sheet_worker_header_loader
+    _sheet_worker_header_loader = header_loader
+
+
+def _prepare_sheet_in_worker(prepare_fn: Callable[[P, Any], R], payload: P) -> R:
+    return prepare_fn(payload, _sheet_worker_header_loader)
+
+
+def prepare_sheets(
+    prepare_fn: Callable[[P, Any], R],
+    payloads: Iterable[tuple[str, P]],
+    header_loader: Any = None,
+    workers: int = 1,
+) -> Iterator[tuple[str, "Future[R]"]]:
+    """
+    Prepare the content of report sheets, yielded in the order of the payloads.
+
+    With more than one worker the sheets are prepared in a process pool. Workers get the picklable
+    payload of a sheet and send back the prepared content, so the pool works with every start
+    method. The header annotator is send once per worker. Payloads are consumed lazily and a few
+    sheets are prepared ahead, so memory is bounded while the sheets are written in order by the
+    single writer.
+
+    Args:
+        prepare_fn: Module level function returning the content of a sheet from its payload and
+            the header annotator, the content must be picklable.
+        payloads: The sheet keys and payloads in output order.
+        header_loader: Optional header annotator passed to the prepare function.
+        workers: The number of worker processes, 1 prepares the sheets in this process.
+
+    Yields:
+        The key and a future of the prepared content, the result raises if preparing failed.
+    """
+    if workers <= 1:
+        for key, payload in payloads:
+            future: Future[R] = Future()
+            try:
+                future.set_result(prepare_fn(payload, header_loader))
+            except Exception as e:
+                future.set_exception(e)
+            yield key, future
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_sheet_worker,
+        initargs=(header_loader,),
+    ) as executor:
+        pending: deque[tuple[str, Future[R]]] = deque()
+        for key, payload in payloads:
+            pending.append(
+                (key, executor.submit(_prepare_sheet_in_worker, prepare_fn, payload))
+            )
+            if len(pending) >= workers * 2:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
 REVIEW_STYLES = {
     "OK": "80D462",
     "OK met opm": "66FF99",
@@ -194,75 +481,139 @@ REVIEW_STYLES = {
 }
 
 
+SPREADSHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+
+
+def _add_review_styles_to_styles_xml(data: bytes) -> bytes:
+    """Add the review styles as fills, cell style formats and named cell styles to a styles.xml."""
+    ET.register_namespace("", SPREADSHEET_NS)
+    tree = ET.fromstring(data)
+    ns = {"ns": SPREADSHEET_NS}
+
+    fills = tree.find("ns:fills", ns)
+    cell_style_xfs = tree.find("ns:cellStyleXfs", ns)
+    cell_styles = tree.find("ns:cellStyles", ns)
+    if fills is None or cell_style_xfs is None or cell_styles is None:
+        raise ValueError("styles.xml is missing fills, cellStyleXfs or cellStyles")  # noqa: TRY003
+
+    present = {item.attrib["name"] for item in cell_styles.findall("ns:cellStyle", ns)}
+    for name, color in REVIEW_STYLES.items():
+        if name in present:
+            continue
+        fill = ET.SubElement(fills, f"{{{SPREADSHEET_NS}}}fill")
+        pattern_fill = ET.SubElement(
+            fill, f"{{{SPREADSHEET_NS}}}patternFill", patternType="solid"
+        )
+        ET.SubElement(pattern_fill, f"{{{SPREADSHEET_NS}}}fgColor", rgb=f"FF{color}")
+        ET.SubElement(pattern_fill, f"{{{SPREADSHEET_NS}}}bgColor", rgb=f"FF{color}")
+
+        ET.SubElement(
+            cell_style_xfs,
+            f"{{{SPREADSHEET_NS}}}xf",
+            numFmtId="0",
+            fontId="0",
+            fillId=f"{len(fills) - 1}",
+            borderId="0",
+            applyNumberFormat="0",
+            applyFont="0",
+            applyFill="1",
+            applyBorder="0",
+            applyAlignment="0",
+        )
+        ET.SubElement(
+            cell_styles,
+            f"{{{SPREADSHEET_NS}}}cellStyle",
+            name=name,
+            xfId=f"{len(cell_style_xfs) - 1}",
+        )
+
+    for element in [fills, cell_style_xfs, cell_styles]:
+        element.attrib["count"] = f"{len(element)}"
+    return ET.tostring(tree, encoding="utf-8", xml_declaration=True)
+
+
 def add_review_styles_to_excel(file_name: str | Path) -> None:
     """
     Add predefined review styles as named styles to an existing Excel file.
 
+    Only `xl/styles.xml` is read and patched in memory, the workbook is not loaded. The other members are
+    streamed in chunks into a temp file next to the target, so memory use does not grow with the sheets.
+
     Args:
         file_name (str | Path): Path to the Excel file to modify.
 
     Returns:
         None
     """
-    if isinstance(file_name, Path):
-        file_name = f"{file_name}"
+    file_name = Path(file_name)
+    temp_fd, temp_file_name = tempfile.mkstemp(suffix=".xlsx", dir=file_name.parent)
+    os.close(temp_fd)
+    try:
+        with zipfile.ZipFile(file_name, "r") as zip_in:
+            with zipfile.ZipFile(temp_file_name, "w") as zip_out:
+                for item in zip_in.infolist():
+                    if item.filename == "xl/styles.xml":
+                        data = _add_review_styles_to_styles_xml(zip_in.read(item))
+                        zip_out.writestr(item, data)
+                        continue
+                    # writing sets the sizes and crc on the info, keep the one of the input intact
+                    with (
+                        zip_in.open(item) as member_in,
+                        zip_out.open(copy.copy(item), "w") as member_out,
+                    ):
+                        shutil.copyfileobj(member_in, member_out)
+        os.replace(temp_file_name, file_name)
+    finally:
+        if os.path.exists(temp_file_name):
+            os.remove(temp_file_name)
 
-    wb = load_workbook(file_name)
 
-    for name, color in REVIEW_STYLES.items():
-        style = NamedStyle(name=name)
-        style.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
-        if name not in wb.named_styles:
-            wb.add_named_style(style)
-
-    temp_file_name = tempfile.mktemp(suffix=".xlsx")
-    wb.save(temp_file_name)
-
-    with zipfile.ZipFile(temp_file_name, "r") as zip_in:
-        with zipfile.ZipFile(file_name, "w") as zip_out:
-            for item in zip_in.infolist():
-                data = zip_in.read(item.filename)
-                if item.filename == "xl/styles.xml":
-                    tree = ET.fromstring(data)
-                    ns = {
-                        "ns": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
-                    }
-
-                    idx_to_set = []
-                    for idx, cell_style in enumerate(
-                        tree.findall(".//ns:cellStyle", ns)
-                    ):
-                        if cell_style.attrib["name"] in REVIEW_STYLES.keys():
-                            idx_to_set.append(idx)
+def get_ref_displays(tree_dict) -> dict[str, str]:
+    """
+    Build the reference display string of every puic in a tree once, so nice display is a lookup.
 
-                    for idx, cell_xf in enumerate(
-                        tree.findall(".//ns:cellStyleXfs/ns:xf", ns)
-                    ):
-                        if idx in idx_to_set:
-                            cell_xf.attrib["applyFont"] = "0"
-                            cell_xf.attrib["applyBorder"] = "0"
-                            cell_xf.attrib["applyAlignment"] = "0"
-                            cell_xf.attrib["applyNumberFormat"] = "0"
-                            cell_xf.attrib["applyFill"] = "1"
+    Args:
+        tree_dict: The objects by puic of a single repo.
+
+    Returns:
+        The display string by puic, formatted as the display of a present ImxRef.
+    """
+    return {
+        puic: ImxRef(
+            field="", field_value=puic, lookup=puic, imx_object=imx_objects[0]
+        ).display
+        for puic, imx_objects in tree_dict.items()
+        if imx_objects
+    }
 
-                    updated_data = ET.tostring(
-                        tree, encoding="utf-8", xml_declaration=True
-                    )
-                    zip_out.writestr(item, updated_data)
-                else:
-                    zip_out.writestr(item, data)
 
-    if os.path.exists(temp_file_name):
-        os.remove(temp_file_name)
+def add_nice_display(imx_object, props, ref_displays: dict[str, str] | None = None):
+    """
+    Add a display column to every reference property.
 
+    Args:
+        imx_object: The object the properties belong to.
+        props: The flattened properties of the object.
+        ref_displays: Display strings by puic from get_ref_displays, if None they are taken from the object refs.
 
-def add_nice_display(imx_object, props):
+    Returns:
+        The properties with newline separated values and the display columns.
+    """
     # TODO: not sure, if we overwrite the ref, or add a column...
     add_column = True
 
-    ref_lookup_map = {
-        ref.lookup: ref.display for ref in imx_object.refs
-    }  # Create a lookup map once
+    if ref_displays is None:
+        ref_lookup_map = {ref.lookup: ref.display for ref in imx_object.refs}
+
+        def get_ref_display(lookup: str) -> str | None:
+            return ref_lookup_map.get(lookup)
+
+    else:
+        # every reference to an other puic is a ref, missing puics are not present
+        def get_ref_display(lookup: str) -> str | None:
+            if lookup == imx_object.puic or lookup == "":
+                return None
+            return ref_displays.get(lookup, RefStatus.NOT_PRESENT.value)
 
     result = {}
     for key, value in props.items():
@@ -270,43 +621,56 @@ def add_nice_display(imx_object, props):
         result[key] = formatted_value
 
         if key.endswith("Ref"):
-            if value in ref_lookup_map:
-                result[f"{key}|display" if add_column else key] = ref_lookup_map[value]
+            ref_display = get_ref_display(value)
+            if ref_display is not None:
+                result[f"{key}|display" if add_column else key] = ref_display
 
         elif key.endswith("Refs"):
-            ref_displays = [
-                ref_lookup_map[item]
+            ref_displays_of_value = [
+                ref_display
                 for item in value.split(" ")
-                if item in ref_lookup_map
+                if (ref_display := get_ref_display(item)) is not None
             ]
-            if ref_displays:
+            if ref_displays_of_value:
                 result[f"{key}|display" if add_column else key] = "\n".join(
-                    ref_displays
+                    ref_displays_of_value
                 )
     return result
 
 
+OVERVIEW_COLUMNS = [
+    "@puic",
+    "path",
+    "tag",
+    "ImxArea",
+    "parent",
+    "@name",
+    "status",
+    "geometry_status",
+    "Location.GeographicLocation.@accuracy",
+    "Location.GeographicLocation.@dataAcquisitionMethod",
+    "Metadata.@isInService",
+    "Metadata.@lifeCycleStatus",
+    "Metadata.@source",
+]
+
+
+def select_overview_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Select the overview columns present in a diff DataFrame."""
+    return df[[col for col in OVERVIEW_COLUMNS if col in df.columns]]
+
+
+def get_overview_df(diff_dfs: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate the overview columns of diff DataFrames into a single overview DataFrame."""
+    return select_overview_columns(
+        pd.concat([select_overview_columns(df) for df in diff_dfs], axis=0)
+    )
+
+
 def add_overview_df_to_diff_dict(
     diff_dict: dict[str, pd.DataFrame],
 ) -> dict[str, pd.DataFrame]:
-    overview_df = pd.concat(list(diff_dict.values()), axis=0)
-    columns_to_keep = [
-        "@puic",
-        "path",
-        "tag",
-        "ImxArea",
-        "parent",
-        "@name",
-        "status",
-        "geometry_status",
-        "Location.GeographicLocation.@accuracy",
-        "Location.GeographicLocation.@dataAcquisitionMethod",
-        "Metadata.@isInService",
-        "Metadata.@lifeCycleStatus",
-        "Metadata.@source",
-    ]
-    existing_columns = [col for col in columns_to_keep if col in overview_df.columns]
-    return {"meta-overview": overview_df[existing_columns]} | diff_dict
+    return {"meta-overview": get_overview_df(diff_dict.values())} | diff_dict
 
 
 def unwrap_df(df: pd.DataFrame | pd.io.formats.style.Styler) -> pd.DataFrame:
@@ -347,6 +711,54 @@ def apply_autofilter(
     worksheet.autofilter(start_row, 0, start_row, last_col_idx)
 
 
+def estimate_column_widths(
+    full_df: pd.DataFrame,
+    data_start_row: int = 0,
+    *,
+    min_width: int = 15,
+    header_min_width: int = 80,
+    padding: int = 2,
+    max_rows: int = WIDTH_SAMPLE_ROWS,
+) -> list[int]:
+    """
+    Estimate the width of every column from the cell contents and header text.
+
+    Frames with more than max_rows data rows are sampled evenly, so the cost does not grow with the
+    sheet size. String lengths are computed vectorized once per column.
+
+    Args:
+        full_df (pd.DataFrame): Full DataFrame written to the sheet (metadata + data).
+        data_start_row (int, optional): First row index where data (not metadata) starts. Default 0.
+        min_width (int, optional): Minimum width per column (characters). Default 15.
+        header_min_width (int, optional): Minimum width cap based on the header length. Default 80.
+        padding (int, optional): Extra width padding (characters). Default 2.
+        max_rows (int, optional): Maximum number of data rows measured per column.
+
+    Returns:
+        list[int]: The width by column index.
+    """
+    visible_df = full_df.iloc[data_start_row:]
+    if len(visible_df) > max_rows:
+        visible_df = visible_df.iloc[
+            np.linspace(0, len(visible_df) - 1, max_rows, dtype=np.intp)
+        ]
+
+    widths = []
+    for col_idx, col_name in enumerate(full_df.columns):
+        max_content_len = visible_df.iloc[:, col_idx].astype(str).str.len().max()
+        if pd.isna(max_content_len):
+            max_content_len = 0
+
+        # Ensure we show the full header name; use a reasonable cap for huge columns
+        # We cap to max(header_min_width, header_len) to keep long headers readable.
+        header_len = len(str(col_name))
+        header_cap = max(header_min_width, header_len)
+
+        target_len = max(int(max_content_len), header_len, min_width)
+        widths.append(min(target_len, header_cap) + padding)
+    return widths
+
+
 def autosize_columns(
     worksheet: Worksheet,
     full_df: pd.DataFrame,
@@ -355,6 +767,7 @@ def autosize_columns(
     min_width: int = 15,
     header_min_width: int = 80,
     padding: int = 2,
+    column_options: dict[int, dict[str, Any]] | None = None,
 ) -> None:
     """
     Autosize columns based on the visible (non-metadata) cell contents and header text.
@@ -366,23 +779,18 @@ def autosize_columns(
         min_width (int, optional): Minimum width per column (characters). Default 15.
         header_min_width (int, optional): Minimum width cap based on the header length. Default 80.
         padding (int, optional): Extra width padding (characters). Default 2.
+        column_options (dict, optional): Column options like level and hidden by column index.
     """
     if full_df is None or full_df.empty:
         return
 
-    for col_idx, col_name in enumerate(full_df.columns):
-        visible_values = full_df[col_name].iloc[data_start_row:]
-        # Compute max content length among visible values
-        if not visible_values.empty:
-            max_content_len = visible_values.astype(str).map(len).max()
-        else:
-            max_content_len = 0
-
-        # Ensure we show the full header name; use a reasonable cap for huge columns
-        # We cap to max(header_min_width, header_len) to keep long headers readable.
-        header_len = len(str(col_name))
-        header_cap = max(header_min_width, header_len)
-
-        target_len = max(max_content_len, header_len, min_width)
-        final_width = min(target_len, header_cap) + padding
-        worksheet.set_column(col_idx, col_idx, final_width)
+    column_options = column_options or {}
+    widths = estimate_column_widths(
+        full_df,
+        data_start_row,
+        min_width=min_width,
+        header_min_width=header_min_width,
+        padding=padding,
+    )
+    for col_idx, width in enumerate(widths):
+        worksheet.set_column(col_idx, col_idx, width, None, column_options.get(col_idx))
@@ -1,7 +1,12 @@
+import json
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
+from typing import IO, Any
 
 import geojson as geojson_dependency
+import numpy as np
 from geojson import Feature as GeoJsonFeature
 from geojson import FeatureCollection as GeoJsonFeatureCollection
 from geojson import GeometryCollection as GeoJsonGeometryCollection
@@ -11,7 +16,6 @@ from geojson import MultiPoint as GeoJsonMultiPoint
 from geojson import MultiPolygon as GeoJsonMultiPolygon
 from geojson import Point as GeoJsonPoint
 from geojson import Polygon as GeoJsonPolygon
-from geojson import dump as geojson_dump
 from geojson import dumps as geojson_dumps
 from shapely.geometry import (
     GeometryCollection,
@@ -23,6 +27,11 @@ from shapely.geometry import (
     Polygon,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 geojson_dependency.geometry.DEFAULT_PRECISION = 16
 
 
@@ -117,6 +126,67 @@ class ShapelyGeoJsonFeature:
             polygon_entries.append(tuple(hole.coords))
         return polygon_entries
 
+    @staticmethod
+    def _round_coordinates(coords, precision: int | None) -> list:
+        array = np.asarray(coords, dtype=float)
+        if precision is not None:
+            array = np.round(array, precision)
+        return array.tolist()
+
+    def _geometry_as_dict(
+        self,
+        geom: Point | LineString | Polygon,
+        precision: int | None,
+    ) -> dict[str, Any]:
+        if isinstance(geom, Point):
+            return {
+                "type": "Point",
+                "coordinates": self._round_coordinates(geom.coords, precision)[0],
+            }
+        if isinstance(geom, LineString):
+            return {
+                "type": "LineString",
+                "coordinates": self._round_coordinates(geom.coords, precision),
+            }
+        return {
+            "type": "Polygon",
+            "coordinates": [
+                self._round_coordinates(ring, precision)
+                for ring in self._get_polygon_coordinates(geom)
+            ],
+        }
+
+    def as_dict(self, precision: int | None = None) -> dict[str, Any]:
+        """
+        Convert the ShapelyGeoJsonFeature to a plain GeoJSON feature dictionary.
+
+        Unlike `as_feature` this skips the geojson library objects, so it is cheap enough to call for every
+        feature while streaming a collection to disk.
+
+        Args:
+            precision: Number of decimals to round coordinates to, None keeps full precision.
+
+        Returns:
+            A JSON serializable dictionary of the GeoJSON feature.
+        """
+        geometries = [
+            self._geometry_as_dict(geom, precision) for geom in self.geometry_list
+        ]
+        geometry: dict[str, Any] | None
+        if not geometries:
+            geometry = None
+        elif len(geometries) == 1:
+            geometry = geometries[0]
+        elif len({item["type"] for item in geometries}) == 1:
+            geometry = {
+                "type": f"Multi{geometries[0]['type']}",
+                "coordinates": [item["coordinates"] for item in geometries],
+            }
+        else:
+            geometry = {"type": "GeometryCollection", "geometries": geometries}
+
+        return {"type": "Feature", "geometry": geometry, "properties": self.properties}
+
     def as_feature(self) -> GeoJsonFeature:
         """
         Convert the ShapelyGeoJsonFeature to a GeoJSON feature.
@@ -255,15 +325,80 @@ class ShapelyGeoJsonFeatureCollection:
         """
         return geojson_dumps(self._as_feature_collection(), sort_keys=True)
 
-    def to_geojson_file(self, file_path: str | Path) -> None:
+    def to_geojson_file(
+        self,
+        file_path: str | Path,
+        compact: bool = False,
+        precision: int | None = None,
+        fast_json: bool = True,
+    ) -> None:
         """Write the FeatureCollection to a GeoJSON file.
 
+        Features are serialized one at a time to the file handle, so the full document is never held in memory.
+
         Args:
             file_path: The path where the GeoJSON file will be saved.
+            compact: If True, write without indentation and whitespace.
+            precision: Number of decimals to round coordinates to, None keeps full precision.
+            fast_json: Use orjson for serializing when it is installed, only applies in compact mode.
 
         """
-        with open(file_path, mode="w") as file:
-            geojson_dump(self._as_feature_collection(), file, indent=4)
+        with open(file_path, mode="w", encoding="utf-8") as file:
+            self.write_geojson(
+                file, compact=compact, precision=precision, fast_json=fast_json
+            )
+
+    def write_geojson(
+        self,
+        file: IO[str],
+        compact: bool = False,
+        precision: int | None = None,
+        fast_json: bool = True,
+    ) -> None:
+        """Stream the FeatureCollection as GeoJSON to an open text file handle.
+
+        Args:
+            file: Writable text file handle.
+            compact: If True, write without indentation and whitespace.
+            precision: Number of decimals to round coordinates to, None keeps full precision.
+            fast_json: Use orjson for serializing when it is installed, only applies in compact mode.
+
+        """
+        dumps = _get_json_dumps(None if compact else 4, fast_json)
+        newline, indent = ("", "") if compact else ("\n", " " * 4)
+        key_separator = ":" if compact else ": "
+
+        header = [f'"type"{key_separator}"FeatureCollection"']
+        if self.crs:
+            crs = dumps(_crs_as_dict(self.crs)).replace("\n", f"\n{indent}")
+            header.append(f'"crs"{key_separator}{crs}')
+        header.append(f'"features"{key_separator}[')
+        file.write("{" + newline + indent)
+        file.write(f",{newline}{indent}".join(header) + newline)
+
+        for idx, feature in enumerate(self.features):
+            if idx:
+                file.write("," + newline)
+            feature_str = dumps(feature.as_dict(precision=precision))
+            file.write(indent * 2 + feature_str.replace("\n", f"\n{indent * 2}"))
+
+        file.write(f"{newline}{indent}]{newline}}}")
+
+
+def _crs_as_dict(crs: CrsEnum) -> dict[str, Any]:
+    return {
+        "type": "name",
+        "properties": {"name": f"urn:ogc:def:crs:EPSG::{crs.value}"},
+    }
+
+
+def _get_json_dumps(indent: int | None, fast_json: bool):
+    """Return a callable serializing an object to a JSON string."""
+    if indent is None and fast_json and orjson is not None:
+        return lambda obj: orjson.dumps(obj).decode("utf-8")
+    if indent is None:
+        return lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return lambda obj: json.dumps(obj, ensure_ascii=False, indent=indent)
 
 
 class FeatureCollection(GeoJsonFeatureCollection):
@@ -272,7 +407,36 @@ class FeatureCollection(GeoJsonFeatureCollection):
     def __init__(self, features, **extra):
         super().__init__(features, **extra)
         if "crs" in extra:
-            self["crs"] = {
-                "type": "name",
-                "properties": {"name": f"urn:ogc:def:crs:EPSG::{extra['crs'].value}"},
-            }
+            self["crs"] = _crs_as_dict(extra["crs"])
+
+
+def write_geojson_files(
+    file_builders: Iterable[tuple[Path, Callable[[], ShapelyGeoJsonFeatureCollection]]],
+    max_workers: int | None = None,
+    skip_empty: bool = False,
+) -> list[Path]:
+    """
+    Build and write GeoJSON files concurrently using a thread pool.
+
+    Args:
+        file_builders: Pairs of target file path and a callable that builds the feature collection for it.
+        max_workers: Maximum number of threads, None lets the executor decide.
+        skip_empty: If True, collections without features are not written.
+
+    Returns:
+        The paths of the files written, in the order of the given builders.
+    """
+
+    def _build_and_write(
+        item: tuple[Path, Callable[[], ShapelyGeoJsonFeatureCollection]],
+    ) -> Path | None:
+        file_path, build_collection = item
+        feature_collection = build_collection()
+        if skip_empty and len(feature_collection.features) == 0:
+            return None
+        feature_collection.to_geojson_file(file_path)
+        return file_path
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_build_and_write, file_builders))
+    return [file_path for file_path in results if file_path is not None]
@@ -0,0 +1,257 @@
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import shapely
+from loguru import logger
+
+from imxInsights.domain.imxObject import ImxObject
+
+# sqlite has a default limit of 2000 columns, keep some room for the fixed view columns
+SQLITE_MAX_VIEW_COLUMNS = 1990
+
+SQLITE_SCHEMA = """
+CREATE TABLE containers (
+    container_id TEXT PRIMARY KEY,
+    container_order INTEGER NOT NULL,
+    alias TEXT,
+    imx_version TEXT,
+    file_path TEXT
+);
+CREATE TABLE objects (
+    object_id INTEGER PRIMARY KEY,
+    container_id TEXT NOT NULL REFERENCES containers (container_id),
+    puic TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    path TEXT NOT NULL,
+    name TEXT,
+    parent_puic TEXT,
+    imx_situation TEXT,
+    file_name TEXT,
+    geometry BLOB,
+    min_x REAL,
+    min_y REAL,
+    max_x REAL,
+    max_y REAL
+);
+CREATE TABLE properties (
+    object_id INTEGER NOT NULL REFERENCES objects (object_id),
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (object_id, key)
+) WITHOUT ROWID;
+CREATE TABLE refs (
+    object_id INTEGER NOT NULL REFERENCES objects (object_id),
+    field TEXT NOT NULL,
+    field_value TEXT,
+    ref_puic TEXT NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE TABLE edges (
+    container_id TEXT NOT NULL REFERENCES containers (container_id),
+    parent_puic TEXT NOT NULL,
+    child_puic TEXT NOT NULL
+);
+CREATE TABLE build_exceptions (
+    container_id TEXT NOT NULL REFERENCES containers (container_id),
+    puic TEXT NOT NULL,
+    exception TEXT NOT NULL,
+    level TEXT NOT NULL,
+    msg TEXT
+);
+"""
+
+SQLITE_INDEXES = """
+CREATE INDEX idx_objects_puic ON objects (puic, container_id);
+CREATE INDEX idx_objects_path ON objects (path, container_id);
+CREATE INDEX idx_objects_tag ON objects (tag);
+CREATE INDEX idx_properties_key ON properties (key, value);
+CREATE INDEX idx_refs_object ON refs (object_id);
+CREATE INDEX idx_refs_ref_puic ON refs (ref_puic);
+CREATE INDEX idx_edges_parent ON edges (parent_puic, container_id);
+CREATE INDEX idx_edges_child ON edges (child_puic, container_id);
+CREATE INDEX idx_build_exceptions_puic ON build_exceptions (puic, container_id);
+"""
+
+SQLITE_RTREE = """
+CREATE VIRTUAL TABLE objects_rtree USING rtree (object_id, min_x, max_x, min_y, max_y);
+INSERT INTO objects_rtree
+    SELECT object_id, min_x, max_x, min_y, max_y FROM objects WHERE min_x IS NOT NULL;
+"""
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a table, view or column name for use in a sqlite statement."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def create_sqlite_database(file_path: str | Path) -> sqlite3.Connection:
+    """
+    Create a new sqlite database with the imx export schema, an existing file will be replaced.
+
+    Journaling and syncing are turned off while exporting, the database is written once and is not
+    usable if the export fails halfway.
+
+    Args:
+        file_path: The path of the sqlite file.
+
+    Returns:
+        The connection to the new database.
+    """
+    file_path = Path(file_path)
+    file_path.unlink(missing_ok=True)
+    connection = sqlite3.connect(file_path)
+    connection.execute("PRAGMA journal_mode = OFF")
+    connection.execute("PRAGMA synchronous = OFF")
+    connection.executescript(SQLITE_SCHEMA)
+    return connection
+
+
+def insert_imx_objects(
+    connection: sqlite3.Connection,
+    imx_objects: list[ImxObject],
+    first_object_id: int,
+    property_keys_by_path: dict[str, dict[str, None]],
+) -> None:
+    """
+    Bulk insert objects, properties, refs and parent child edges in a single transaction.
+
+    Object ids are given in order starting at first_object_id. The property keys found are collected
+    per path in property_keys_by_path, so the per path views can be created after all inserts.
+
+    Args:
+        connection: The connection to the sqlite database.
+        imx_objects: The objects to insert.
+        first_object_id: The object id of the first object.
+        property_keys_by_path: Ordered property keys by path, updated in place.
+    """
+    geometries = [imx_object.geometry for imx_object in imx_objects]
+    wkb = shapely.to_wkb(geometries, output_dimension=3)
+    bounds = shapely.bounds(geometries)
+    object_ids = range(first_object_id, first_object_id + len(imx_objects))
+
+    def _object_rows() -> Iterator[tuple[Any, ...]]:
+        for object_id, imx_object, geometry, value, (min_x, min_y, max_x, max_y) in zip(
+            object_ids, imx_objects, geometries, wkb, bounds.tolist()
+        ):
+            has_geometry = geometry is not None and not geometry.is_empty
+            yield (
+                object_id,
+                imx_object.container_id,
+                imx_object.puic,
+                imx_object.tag,
+                imx_object.path,
+                imx_object.name,
+                imx_object.parent.puic if imx_object.parent is not None else None,
+                imx_object.imx_situation,
+                imx_object.imx_file.path.name,
+                value if has_geometry else None,
+                *((min_x, min_y, max_x, max_y) if has_geometry else (None,) * 4),
+            )
+
+    def _property_rows() -> Iterator[tuple[int, str, str]]:
+        for object_id, imx_object in zip(object_ids, imx_objects):
+            properties = imx_object.get_imx_property_dict()
+            property_keys_by_path.setdefault(imx_object.path, {}).update(
+                dict.fromkeys(properties)
+            )
+            for key, value in properties.items():
+                yield object_id, key, value
+
+    def _ref_rows() -> Iterator[tuple[int, str, str, str, str]]:
+        for object_id, imx_object in zip(object_ids, imx_objects):
+            for ref in imx_object.refs:
+                yield (
+                    object_id,
+                    ref.field,
+                    ref.field_value,
+                    ref.lookup,
+                    ref.status.value,
+                )
+
+    with connection:
+        connection.executemany(
+            "INSERT INTO objects VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            _object_rows(),
+        )
+        connection.executemany(
+            "INSERT INTO properties VALUES (?, ?, ?)", _property_rows()
+        )
+        connection.executemany("INSERT INTO refs VALUES (?, ?, ?, ?, ?)", _ref_rows())
+        connection.executemany(
+            "INSERT INTO edges VALUES (?, ?, ?)",
+            (
+                (imx_object.container_id, imx_object.parent.puic, imx_object.puic)
+                for imx_object in imx_objects
+                if imx_object.parent is not None
+            ),
+        )
+
+
+def insert_rows(
+    connection: sqlite3.Connection, table: str, rows: Iterable[tuple[Any, ...]]
+) -> None:
+    """Bulk insert rows in a table in a single transaction."""
+    rows = list(rows)
+    if not rows:
+        return
+    placeholders = ", ".join("?" * len(rows[0]))
+    with connection:
+        connection.executemany(
+            f"INSERT INTO {quote_identifier(table)} VALUES ({placeholders})",
+            rows,
+        )
+
+
+def create_path_views(
+    connection: sqlite3.Connection, property_keys_by_path: dict[str, dict[str, None]]
+) -> None:
+    """
+    Create a wide view for every object path, one row per object and one column per property key.
+
+    The long properties table is pivoted with a single join grouped by object, views with more
+    columns than sqlite supports are cut off.
+
+    Args:
+        connection: The connection to the sqlite database.
+        property_keys_by_path: Ordered property keys by path.
+    """
+    with connection:
+        for path, keys in property_keys_by_path.items():
+            columns = list(keys)
+            if len(columns) > SQLITE_MAX_VIEW_COLUMNS:
+                logger.warning(
+                    f"View {path} has {len(columns)} columns, only the first {SQLITE_MAX_VIEW_COLUMNS} are added."
+                )
+                columns = columns[:SQLITE_MAX_VIEW_COLUMNS]
+            column_sql = "".join(
+                f",\n    MAX(CASE WHEN p.key = {_quote_literal(key)} THEN p.value END) "
+                f"AS {quote_identifier(key)}"
+                for key in columns
+            )
+            connection.execute(
+                f"CREATE VIEW {quote_identifier(path)} AS\n"
+                f"SELECT o.object_id, o.container_id{column_sql}\n"
+                f"FROM objects o LEFT JOIN properties p ON p.object_id = o.object_id\n"
+                f"WHERE o.path = {_quote_literal(path)}\n"
+                f"GROUP BY o.object_id"
+            )
+
+
+def create_sqlite_indexes(connection: sqlite3.Connection) -> None:
+    """
+    Create the indexes and the R*Tree spatial index, done after the bulk inserts as that is faster.
+
+    Args:
+        connection: The connection to the sqlite database.
+    """
+    connection.executescript(SQLITE_INDEXES)
+    try:
+        connection.executescript(SQLITE_RTREE)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Could not create R*Tree spatial index: {e}")
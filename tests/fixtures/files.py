@@ -1,3 +1,4 @@
+import glob
 import json
 
 import pytest
@@ -25,6 +26,11 @@ def imx_v1200_test_dir_file_path() -> str:
     return sample_path("1200/set_1")
 
 
+@pytest.fixture(scope="module")
+def imx_12diff_test_file_paths() -> list[str]:
+    return sorted(glob.glob(sample_path("12diff", "*.zip")))
+
+
 @pytest.fixture(scope="module")
 def load_test_features() -> dict:
     with open(sample_path("measure_test_set.geojson"), "r") as f:
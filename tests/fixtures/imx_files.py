@@ -21,3 +21,8 @@ def imx_v1200_zip_instance(imx_v1200_test_zip_file_path) -> ImxContainer:
 @pytest.fixture(scope="module")
 def imx_v1200_dir_instance(imx_v1200_test_dir_file_path) -> ImxContainer:
     return ImxContainer(imx_v1200_test_dir_file_path)
+
+
+@pytest.fixture(scope="module")
+def imx_12diff_instances(imx_12diff_test_file_paths) -> list[ImxContainer]:
+    return [ImxContainer(file_path) for file_path in imx_12diff_test_file_paths]
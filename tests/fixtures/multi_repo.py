@@ -31,3 +31,18 @@ def imx_v1200_triple_multi_repo_instance(
         ],
         version_safe=False
     )
+
+
+@pytest.fixture(scope="module")
+def imx_12diff_multi_repo_instance(
+    imx_12diff_instances: list[ImxContainer],
+    imx_v1200_zip_instance: ImxContainer,
+) -> ImxMultiRepo:
+    # the 12diff pair only has changed objects, the v1200 set shares no puics with it for added and removed objects
+    return ImxMultiRepo(
+        [
+            *imx_12diff_instances,
+            imx_v1200_zip_instance,
+        ],
+        version_safe=False
+    )
@@ -0,0 +1,356 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from imxInsights import ImxContainer, ImxMultiRepo
+from imxInsights.compare import imxContainerCompare
+from imxInsights.compare.changes import get_object_changes
+from imxInsights.compare.changeStatusEnum import ChangeStatusEnum
+from imxInsights.compare.imxContainerCompare import ImxContainerCompare
+from imxInsights.domain.imxObject import ImxObject
+
+
+@pytest.fixture(scope="module")
+def diff_ids(imx_12diff_instances: list[ImxContainer]) -> tuple[str, str]:
+    return imx_12diff_instances[0].container_id, imx_12diff_instances[1].container_id
+
+
+@pytest.fixture(scope="module")
+def added_removed_ids(imx_12diff_instances: list[ImxContainer], imx_v1200_zip_instance: ImxContainer) -> tuple[str, str]:
+    # the v1200 set shares no objects with the 12diff sets
+    return imx_12diff_instances[1].container_id, imx_v1200_zip_instance.container_id
+
+
+@pytest.fixture
+def diff_compare(imx_12diff_multi_repo_instance: ImxMultiRepo, diff_ids: tuple[str, str]) -> ImxContainerCompare:
+    return imx_12diff_multi_repo_instance.compare(*diff_ids)
+
+
+@pytest.fixture
+def added_removed_compare(
+    imx_12diff_multi_repo_instance: ImxMultiRepo, added_removed_ids: tuple[str, str]
+) -> ImxContainerCompare:
+    return imx_12diff_multi_repo_instance.compare(*added_removed_ids)
+
+
+def test_compare_fingerprint_fast_path(diff_compare: ImxContainerCompare):
+    compared_objects = diff_compare.compared_objects
+    equal_content = [
+        item for item in compared_objects
+        if item.t1 is not None and item.t2 is not None and item.t1.content_fingerprint == item.t2.content_fingerprint
+    ]
+    changed = [item for item in compared_objects if item.status == ChangeStatusEnum.CHANGED]
+    assert equal_content and changed, "Should contain objects with equal and with changed content"
+    for item in equal_content[:25]:
+        expected = get_object_changes(item.t1.get_imx_property_dict(), item.t2.get_imx_property_dict())
+        assert item.changes == expected, "Fast path should give the same changes as the diff"
+    assert all(item.status == ChangeStatusEnum.UNCHANGED for item in equal_content)
+    assert all(item.t1.content_fingerprint != item.t2.content_fingerprint for item in changed)
+
+
+def test_compare_lazy_by_path(
+    imx_12diff_multi_repo_instance: ImxMultiRepo, diff_ids: tuple[str, str], diff_compare: ImxContainerCompare
+):
+    path = "StopMarkerBoard"
+    items = diff_compare.get_compared_objects([path])
+    assert any(item.status == ChangeStatusEnum.CHANGED for item in items), "Should contain changed objects"
+    assert all(path in {obj.path for obj in (item.t1, item.t2) if obj} for item in items)
+    assert diff_compare.get_compared_object(items[0].puic) is items[0]
+    assert diff_compare.get_compared_object("not-a-puic") is None
+
+    eager = imx_12diff_multi_repo_instance.compare(*diff_ids)
+    eager_items = eager.compared_objects
+    assert [item.puic for item in items] == [
+        item.puic for item in eager_items if path in {obj.path for obj in (item.t1, item.t2) if obj}
+    ], "Should give the objects of the path in repo order"
+    assert [item.puic for item in diff_compare.compared_objects] == [item.puic for item in eager_items]
+    assert diff_compare.get_pandas([path], styled_df=False).equals(eager.get_pandas([path], styled_df=False))
+
+
+def test_compare_workers(
+    monkeypatch: pytest.MonkeyPatch,
+    imx_12diff_instances: list[ImxContainer],
+    imx_v1200_zip_instance: ImxContainer,
+    diff_ids: tuple[str, str],
+    added_removed_ids: tuple[str, str],
+):
+    paths = ["StopMarkerBoard", "Telegram", "Signal"]
+    monkeypatch.setattr(imxContainerCompare, "MIN_OBJECTS_PER_WORKER", 1)
+    for ids in [diff_ids, added_removed_ids]:
+        # a new repo for each compare, so all objects with changed content are send to the workers
+        containers = [*imx_12diff_instances, imx_v1200_zip_instance]
+        serial = ImxMultiRepo(containers, version_safe=False).compare(*ids).get_compared_objects(paths)
+        sharded = ImxMultiRepo(containers, version_safe=False).compare(*ids, workers=2).get_compared_objects(paths)
+        assert any(item.status != ChangeStatusEnum.UNCHANGED for item in serial), "Should contain changed objects"
+
+        assert [item.puic for item in sharded] == [item.puic for item in serial], "Order should not depend on workers"
+        for serial_item, sharded_item in zip(serial, sharded):
+            assert sharded_item.t1 is serial_item.t1
+            assert sharded_item.changes == serial_item.changes
+            assert sharded_item.status == serial_item.status
+            assert sharded_item.geometry.status == serial_item.geometry.status
+
+
+def test_compare_buckets(diff_compare: ImxContainerCompare, added_removed_compare: ImxContainerCompare):
+    for compare, paths in [
+        (diff_compare, ["Telegram", "StopMarkerBoard", "Telegram"]),
+        (added_removed_compare, ["Signal", "Telegram", "Signal"]),
+    ]:
+        all_items = compare.compared_objects
+        expected = [item for item in all_items if {obj.path for obj in (item.t1, item.t2) if obj} & set(paths)]
+        items = compare.get_compared_objects(paths)
+        assert items == expected, "Should keep repo order and skip duplicates"
+        items.clear()
+        assert compare.get_compared_objects(paths) == expected, "Should not share the bucket"
+
+        for status in ChangeStatusEnum:
+            assert compare.get_compared_objects(paths, [status]) == [
+                item for item in expected if item.status == status
+            ]
+            assert compare.get_compared_objects(statuses=[status]) == [
+                item for item in all_items if item.status == status
+            ]
+
+    assert diff_compare.get_compared_objects(statuses=[ChangeStatusEnum.CHANGED]), "Should contain changed objects"
+    assert diff_compare.get_pandas(["Telegram"], statuses=[ChangeStatusEnum.ADDED]).empty
+    for status in [ChangeStatusEnum.ADDED, ChangeStatusEnum.REMOVED]:
+        assert added_removed_compare.get_compared_objects(statuses=[status]), f"Should contain {status.value} objects"
+    assert len(added_removed_compare.get_pandas(["Signal"], statuses=[ChangeStatusEnum.ADDED], styled_df=False)) == len(
+        added_removed_compare.get_compared_objects(["Signal"], [ChangeStatusEnum.ADDED])
+    )
+
+
+def test_compare_guid_displays(diff_compare: ImxContainerCompare, added_removed_compare: ImxContainerCompare):
+    for compare, path in [(diff_compare, "StopMarkerBoard"), (added_removed_compare, "Signal")]:
+        df = compare.get_pandas([path], styled_df=False)
+        ref_columns = [column for column in df.columns if f"{column}|.display" in df.columns]
+        displays = [
+            (value, df.at[idx, f"{column}|.display"])
+            for column in ref_columns
+            for idx, value in df[column].items()
+            if isinstance(value, str) and value and " " not in value and "\n" not in value
+        ]
+        assert displays, "Should contain single references"
+        for value, display in displays:
+            # added and removed references are prefixed with ++ and --
+            referenced = compare.get_compared_object(value.lstrip("+-"))
+            if referenced is None:
+                assert display == "NotPresent|Unknown|t1:X|t2:X"
+                continue
+            imx_object = referenced.t2 or referenced.t1
+            assert display == (
+                f"{imx_object.tag}|{imx_object.name or 'NoName'}"
+                f"|t1:{'✔' if referenced.t1 else 'X'}|t2:{'✔' if referenced.t2 else 'X'}"
+            )
+
+
+def test_compare_changed_only(
+    imx_12diff_multi_repo_instance: ImxMultiRepo,
+    diff_ids: tuple[str, str],
+    added_removed_ids: tuple[str, str],
+    diff_compare: ImxContainerCompare,
+):
+    multi_repo = imx_12diff_multi_repo_instance
+    changed_only = multi_repo.compare(*diff_ids, changed_only=True)
+
+    expected = [item for item in diff_compare.compared_objects if item.status != ChangeStatusEnum.UNCHANGED]
+    assert expected, "Should contain changed objects"
+    assert [item.puic for item in changed_only.compared_objects] == [item.puic for item in expected]
+    assert [item.changes for item in changed_only.compared_objects] == [item.changes for item in expected]
+    unchanged_puics = changed_only.get_unchanged_puics()
+    assert unchanged_puics == diff_compare.get_unchanged_puics()
+    assert changed_only.get_unchanged_puics(["StopMarkerBoard"]) == [
+        item.puic for item in diff_compare.get_compared_objects(["StopMarkerBoard"], [ChangeStatusEnum.UNCHANGED])
+    ]
+    assert all(changed_only.get_compared_object(puic) is None for puic in unchanged_puics)
+    df = changed_only.get_pandas(["StopMarkerBoard"], styled_df=False)
+    assert len(df) == len(changed_only.get_compared_objects(["StopMarkerBoard"])) > 0
+
+    added_removed = multi_repo.compare(*added_removed_ids, changed_only=True)
+    assert not added_removed.get_unchanged_puics()
+    assert len(added_removed.compared_objects) == len(multi_repo.compare(*added_removed_ids).compared_objects)
+
+
+def test_compare_iter_changes(
+    imx_12diff_multi_repo_instance: ImxMultiRepo,
+    diff_ids: tuple[str, str],
+    diff_compare: ImxContainerCompare,
+    added_removed_compare: ImxContainerCompare,
+):
+    multi_repo = imx_12diff_multi_repo_instance
+    records = list(diff_compare.iter_changes(chunk_size=100))
+    statuses = {item.puic: item.status.value for item in multi_repo.compare(*diff_ids).compared_objects}
+    assert [record["puic"] for record in records] == sorted(statuses)
+    assert all(record["status"] == statuses[record["puic"]] for record in records)
+    assert "changed" in statuses.values(), "Should contain changed objects"
+    assert list(diff_compare.iter_changes(chunk_size=7)) == records, "Should not depend on the chunk size"
+
+    last_puic = records[len(records) // 2]["puic"]
+    resumed = list(diff_compare.iter_changes(until_puic=last_puic)) + list(diff_compare.iter_changes(after_puic=last_puic))
+    assert resumed == records
+
+    path_records = list(diff_compare.iter_changes(["StopMarkerBoard"]))
+    assert {record["path"] for record in path_records} == {"StopMarkerBoard"}
+    changed_records = list(multi_repo.compare(*diff_ids, changed_only=True).iter_changes(["StopMarkerBoard"]))
+    assert changed_records == [record for record in path_records if record["status"] != "unchanged"]
+    assert changed_records, "Should stream changed objects"
+
+    statuses = {record["status"] for record in added_removed_compare.iter_changes(["Signal", "Telegram"])}
+    assert statuses == {"added", "removed"}
+
+
+def test_compare_cache(
+    imx_12diff_instances: list[ImxContainer], imx_12diff_multi_repo_instance: ImxMultiRepo, diff_ids: tuple[str, str]
+):
+    def as_records(items):
+        return [(item.puic, item.status, item.geometry.status, item.changes) for item in items]
+
+    cached_repo = ImxMultiRepo(imx_12diff_instances, version_safe=False)
+    records = list(cached_repo.compare(*diff_ids).iter_changes())
+    first = cached_repo.compare(*diff_ids).get_compared_objects(["StopMarkerBoard"])
+    second = cached_repo.compare(*diff_ids).get_compared_objects(["StopMarkerBoard"])
+    assert any(item.status == ChangeStatusEnum.CHANGED for item in first), "Should contain changed objects"
+    assert as_records(first) == as_records(second), "Should give the same results for a repeated compare"
+    assert list(cached_repo.compare(*diff_ids).iter_changes()) == records
+    for cache_size in [0, 5]:
+        repo = ImxMultiRepo(imx_12diff_instances, version_safe=False, compare_cache_size=cache_size)
+        assert as_records(repo.compare(*diff_ids).get_compared_objects(["StopMarkerBoard"])) == as_records(first)
+        assert as_records(repo.compare(*diff_ids).get_compared_objects(["StopMarkerBoard"])) == as_records(first)
+
+    chain = imx_12diff_multi_repo_instance.compare_chain([diff_ids, diff_ids[::-1], diff_ids])
+    dataframes = chain.get_dataframes(["StopMarkerBoard", "Telegram"], styled_df=False)
+    for path, df in dataframes.items():
+        assert df.equals(chain.get_dataframe([path], styled_df=False))
+    assert set(dataframes["StopMarkerBoard"]["snapshot"]) == {0, 1, 2}
+
+
+def test_compare_save_load(
+    imx_12diff_instances: list[ImxContainer],
+    imx_12diff_multi_repo_instance: ImxMultiRepo,
+    diff_ids: tuple[str, str],
+    diff_compare: ImxContainerCompare,
+):
+    def as_records(items):
+        return [(item.puic, item.status, item.geometry.status, item.changes) for item in items]
+
+    def cached_repo(cache_dir):
+        return ImxMultiRepo(imx_12diff_instances, version_safe=False, compare_cache_dir=cache_dir)
+
+    expected = as_records(diff_compare.compared_objects)
+    assert any(status == ChangeStatusEnum.CHANGED for _, status, _, _ in expected), "Should contain changed objects"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = diff_compare.save(Path(temp_dir) / "compare.jsonl.gz")
+        loaded = ImxContainerCompare.load(file_path, ImxMultiRepo(imx_12diff_instances, version_safe=False), *diff_ids)
+        assert as_records(loaded.compared_objects) == expected
+        assert list(loaded.iter_changes()) == list(diff_compare.iter_changes())
+
+        with pytest.raises(ValueError):
+            ImxContainerCompare.load(file_path, imx_12diff_multi_repo_instance, *diff_ids[::-1])
+
+        cached_file_path = Path(temp_dir) / f"{diff_compare.get_cache_key()}.jsonl.gz"
+        cached_compare = cached_repo(temp_dir).compare(*diff_ids)
+        cached_compare.get_compared_objects(["StopMarkerBoard"])
+        assert not cached_file_path.exists(), "Should not compare all objects to save"
+        cached_compare.compared_objects
+        assert cached_file_path.exists(), "Should save once all objects are compared"
+        reused = cached_repo(temp_dir).compare(*diff_ids)
+        assert as_records(reused.get_compared_objects(["StopMarkerBoard"])) == as_records(
+            diff_compare.get_compared_objects(["StopMarkerBoard"])
+        )
+        assert as_records(reused.compared_objects) == expected
+
+        cached_file_path.write_bytes(b"not a compare")
+        recomputed = cached_repo(temp_dir).compare(*diff_ids)
+        assert as_records(recomputed.compared_objects) == expected, "Should compare again for a bad file"
+        reloaded = ImxContainerCompare.load(cached_file_path, imx_12diff_multi_repo_instance, *diff_ids)
+        assert as_records(reloaded.compared_objects) == expected, "Should replace a bad file"
+        assert [path.name for path in Path(temp_dir).iterdir() if path.name.startswith(".")] == []
+
+
+def test_compare_summary(
+    imx_12diff_multi_repo_instance: ImxMultiRepo,
+    diff_ids: tuple[str, str],
+    diff_compare: ImxContainerCompare,
+    added_removed_compare: ImxContainerCompare,
+):
+    summary = diff_compare.summary()
+    assert diff_compare.summary() == summary
+
+    path = "StopMarkerBoard"
+    items = [item for item in diff_compare.get_compared_objects([path]) if (item.t2 or item.t1).path == path]
+    assert summary.get_count(path) == len(items)
+    for status in ChangeStatusEnum:
+        assert summary.get_count(path, status) == len([item for item in items if item.status == status])
+    assert summary.get_count(path, ChangeStatusEnum.CHANGED) > 0, "Should count changed objects"
+    assert summary.get_count() == len(diff_compare.compared_objects), "Should count every object once"
+
+    changed_keys = [key for item in items for key, change in item.changes.items() if change.status != ChangeStatusEnum.UNCHANGED]
+    assert changed_keys, "Should contain changed properties"
+    assert list(summary.property_changes[path].items()) == [
+        (key, changed_keys.count(key))
+        for key in sorted(set(changed_keys), key=lambda key: (-changed_keys.count(key), key))
+    ], "Should count objects per changed property, most changed first"
+    assert imx_12diff_multi_repo_instance.compare(*diff_ids, changed_only=True).summary() == summary
+
+    added_removed_summary = added_removed_compare.summary()
+    assert added_removed_summary.get_count(path, ChangeStatusEnum.REMOVED) == summary.get_count(path)
+    assert added_removed_summary.get_count("Signal", ChangeStatusEnum.ADDED) == len(
+        added_removed_compare.get_compared_objects(["Signal"], [ChangeStatusEnum.ADDED])
+    ) > 0
+    assert added_removed_summary.get_count() == len(added_removed_compare.compared_objects)
+
+
+def test_compare_summary_moved_object(
+    imx_12diff_multi_repo_instance: ImxMultiRepo,
+    diff_ids: tuple[str, str],
+    diff_compare: ImxContainerCompare,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    path = "StopMarkerBoard"
+    count = diff_compare.summary().get_count(path)
+    moved = diff_compare.get_compared_objects([path], [ChangeStatusEnum.CHANGED])[0].t2
+    path_property = ImxObject.path
+    monkeypatch.setattr(
+        ImxObject, "path", property(lambda self: "MovedObject" if self is moved else path_property.fget(self))
+    )
+
+    compare = imx_12diff_multi_repo_instance.compare(*diff_ids)
+    summary = compare.summary()
+    assert summary.get_count() == len(compare.compared_objects), "Should count a moved object once"
+    assert summary.get_count("MovedObject") == 1, "Should count a moved object for the t2 path"
+    assert summary.get_count(path) == count - 1
+
+
+def test_compare_to_excel(
+    tmp_path: Path, imx_12diff_multi_repo_instance: ImxMultiRepo, diff_ids: tuple[str, str], diff_compare: ImxContainerCompare
+):
+    file_path = tmp_path / "diff.xlsx"
+    diff_compare.to_excel(file_path, add_review_styles=False)
+    workbook = load_workbook(file_path, read_only=True)
+    assert workbook.sheetnames[:2] == ["info", "meta-overview"]
+    assert workbook["meta-overview"].max_row == len(diff_compare.compared_objects) + 1, "Should add a row per object"
+
+    changed_only = imx_12diff_multi_repo_instance.compare(*diff_ids, changed_only=True)
+    changed_only.to_excel(file_path, add_review_styles=False)
+    workbook = load_workbook(file_path, read_only=True)
+    info = {row[0]: row[1] for row in workbook["info"].iter_rows(values_only=True)}
+    assert info["Unchanged Objects"] == len(changed_only.get_unchanged_puics()) > 0
+    assert workbook["meta-overview"].max_row == len(changed_only.compared_objects) + 1
+
+    unchanged = imx_12diff_multi_repo_instance.compare(diff_ids[0], diff_ids[0], changed_only=True)
+    unchanged.to_excel(file_path, add_review_styles=False)
+    assert "meta-overview" not in load_workbook(file_path, read_only=True).sheetnames, "Should skip an empty overview"
+
+
+def test_compare_to_excel_workers(tmp_path: Path, diff_compare: ImxContainerCompare):
+    diff_compare.to_excel(tmp_path / "serial.xlsx", add_review_styles=False)
+    diff_compare.to_excel(tmp_path / "parallel.xlsx", add_review_styles=False, workers=2)
+
+    serial = load_workbook(tmp_path / "serial.xlsx", read_only=True)
+    parallel = load_workbook(tmp_path / "parallel.xlsx", read_only=True)
+    assert serial.sheetnames == parallel.sheetnames, "Sheet order should not depend on workers"
+    for sheet_name in serial.sheetnames[1:]:
+        assert list(serial[sheet_name].values) == list(parallel[sheet_name].values), sheet_name
@@ -1,8 +1,14 @@
+import glob
+
 import pytest
 from uuid import uuid4
 from shapely.geometry import Point, LineString
+from imxInsights import ImxContainer, ImxMultiRepo
+from imxInsights.compare.changedImxObject import ChangedImxObject
 from imxInsights.compare.changeStatusEnum import ChangeStatusEnum
-from imxInsights.compare.changes import get_object_changes
+from imxInsights.compare.changes import _get_deep_diff_changes, get_flat_dict_changes, get_object_changes
+from imxInsights.compare.custom_operators.diff_shapely import LineDiffTolerances
+from tests.helpers import sample_path
 
 def deepdiff_dicts(dict1, dict2):
     return get_object_changes(dict1, dict2)
@@ -108,3 +114,71 @@ def test_type_change():
 #     assert changes["a"][2].t2 == 4
 
 
+UUID_1, UUID_2, UUID_3 = (
+    "762f68cf-11c0-454a-8a51-c98e70c40675",
+    "224fe516-bf0d-4ef0-bc01-330e0828b25a",
+    "514169ce-81df-4100-b5b2-59a0639828a5",
+)
+POINT_KEY = "Location.GeographicLocation.gml:Point.gml:coordinates"
+LINE_KEY = "Location.GeographicLocation.gml:LineString.gml:coordinates"
+
+
+@pytest.mark.parametrize(
+    "dict1, dict2",
+    [
+        ({"a": "1"}, {"a": "1", "b": "2"}),
+        ({"a": "1", "b": "2"}, {"a": "1"}),
+        ({"a": "1"}, {"a": "2"}),
+        ({"a": "1"}, {"a": 1}),
+        ({"a": None, "b": "2"}, {"a": "1", "b": None}),
+        ({"a": None}, {"a": None}),
+        ({"TrackRefs": f"{UUID_1} {UUID_2}"}, {"TrackRefs": f"{UUID_2} {UUID_1}"}),
+        ({"TrackRefs": f"{UUID_1} {UUID_2}"}, {"TrackRefs": f"{UUID_1}  {UUID_2}"}),
+        ({"TrackRefs": f"{UUID_1} {UUID_2}"}, {"TrackRefs": f"{UUID_1} {UUID_3}"}),
+        ({"TrackRefs": f"{UUID_1} {UUID_2}"}, {"TrackRefs": "not a uuid"}),
+        ({"TrackRefs": None}, {"TrackRefs": UUID_1}),
+        ({POINT_KEY: "183836.446,568138.764,3.141"}, {POINT_KEY: "183836.446,568138.764,3.142"}),
+        ({POINT_KEY: "183836.446,568138.764"}, {POINT_KEY: "183836.4460,568138.764"}),
+        ({POINT_KEY: "183836.446,568138.764,3.141"}, {POINT_KEY: None}),
+        ({LINE_KEY: "181764.3,578840.082,1.202 181751.507,578837.585,1.206"},
+         {LINE_KEY: "181764.3,578840.082,1.206 181751.507,578837.585,1.206"}),
+        ({LINE_KEY: None}, {LINE_KEY: "181764.3,578840.082 181751.507,578837.585"}),
+    ],
+)
+def test_flat_dict_changes_equal_deep_diff(dict1, dict2):
+    assert get_flat_dict_changes(dict1, dict2) == _get_deep_diff_changes(dict1, dict2)
+
+
+def test_line_diff_tolerances():
+    dict1, dict2 = {LINE_KEY: "0,0 10,0"}, {LINE_KEY: "0,0.5 10,0.5"}
+    tolerances = LineDiffTolerances(buffer_distance=0.1)
+
+    default = get_flat_dict_changes(dict1, dict2)[LINE_KEY].analyse
+    narrow = get_flat_dict_changes(dict1, dict2, tolerances)[LINE_KEY].analyse
+    assert 0 < default["intersection_over_union"] < 1
+    assert narrow["intersection_over_union"] == 0.0
+    assert _get_deep_diff_changes(dict1, dict2, tolerances)[LINE_KEY].analyse == narrow
+    assert get_flat_dict_changes(dict1, dict2)[LINE_KEY].analyse == default, "Tolerances should not be global"
+
+
+def _assert_flat_dict_changes_equal_deep_diff(containers: list[ImxContainer]):
+    multi_repo = ImxMultiRepo(containers, version_safe=False)
+    for imx_objects in multi_repo.tree_dict.values():
+        t1, t2 = (imx_objects.get(container.container_id) for container in containers)
+        dict1, dict2 = ChangedImxObject._add_missing_keys(
+            t1[0].get_imx_property_dict() if t1 else {},
+            t2[0].get_imx_property_dict() if t2 else {},
+        )
+        assert get_flat_dict_changes(dict1, dict2) == _get_deep_diff_changes(dict1, dict2)
+
+
+def test_flat_dict_changes_equal_deep_diff_v1200(
+    imx_v1200_zip_instance: ImxContainer, imx_v1200_dir_instance: ImxContainer
+):
+    _assert_flat_dict_changes_equal_deep_diff([imx_v1200_zip_instance, imx_v1200_dir_instance])
+
+
+@pytest.mark.slow
+def test_flat_dict_changes_equal_deep_diff_12diff():
+    containers = [ImxContainer(file_path) for file_path in sorted(glob.glob(sample_path("12diff", "*.zip")))]
+    _assert_flat_dict_changes_equal_deep_diff(containers)
@@ -2,7 +2,7 @@ import pytest
 from shapely.geometry import (
     Point, LineString, Polygon, MultiPoint, MultiPolygon, MultiLineString, GeometryCollection
 )
-from imxInsights.compare.geometryChange import GeometryChange, GeometryChangeStatus
+from imxInsights.compare.geometryChange import GeometryChange, GeometryChangeStatus, classify_geometry_changes
 
 
 def test_both_none():
@@ -100,21 +100,21 @@ def test_multipoint_z_removed():
     assert change.status == GeometryChangeStatus.Z_REMOVED
 
 
-# def test_geometrycollection_z_changed():
-#     geometries_t1 = [
-#         Point(0, 0, 4),
-#         LineString([(0, 0, 2), (1, 1, 2)]),
-#         Polygon([(0, 0, 5), (1, 1, 4), (1, 0, 5)])
-#     ]
-#     geometries_t2 = [
-#         Point(0, 0, 1),
-#         LineString([(0, 0, 3), (1, 1, 2)]),
-#         Polygon([(0, 0, 1), (1, 1, 1), (1, 0, 1)])
-#     ]
-#     t1 = GeometryCollection(geometries_t1)
-#     t2 = GeometryCollection(geometries_t2)
-#     change = GeometryChange(t1=t1, t2=t2)
-#     assert change.status == GeometryChangeStatus.Z_CHANGED
+def test_geometrycollection_z_changed():
+    geometries_t1 = [
+        Point(0, 0, 4),
+        LineString([(0, 0, 2), (1, 1, 2)]),
+        Polygon([(0, 0, 5), (1, 1, 4), (1, 0, 5)])
+    ]
+    geometries_t2 = [
+        Point(0, 0, 1),
+        LineString([(0, 0, 3), (1, 1, 2)]),
+        Polygon([(0, 0, 1), (1, 1, 1), (1, 0, 1)])
+    ]
+    t1 = GeometryCollection(geometries_t1)
+    t2 = GeometryCollection(geometries_t2)
+    change = GeometryChange(t1=t1, t2=t2)
+    assert change.status == GeometryChangeStatus.Z_CHANGED
 
 
 def test_geometrycollection_changed():
@@ -132,6 +132,26 @@ def test_geometrycollection_changed():
     assert change.status == GeometryChangeStatus.CHANGED
 
 
+def test_classify_geometry_changes():
+    pairs = [
+        (None, None, GeometryChangeStatus.UNDEFINED),
+        (GeometryCollection(), None, GeometryChangeStatus.UNDEFINED),
+        (None, Point(), GeometryChangeStatus.REMOVED),
+        (Point(1, 1), None, GeometryChangeStatus.REMOVED),
+        (None, Point(1, 1), GeometryChangeStatus.ADDED),
+        (Point(1, 1), Point(1, 1), GeometryChangeStatus.UNCHANGED),
+        (Point(1, 1), Point(1, 2), GeometryChangeStatus.CHANGED),
+        (LineString([(0, 0), (1, 1)]), LineString([(0, 0, 1), (1, 1, 1)]), GeometryChangeStatus.Z_ADDED),
+        (LineString([(0, 0, 1), (1, 1, 1)]), LineString([(0, 0), (1, 1)]), GeometryChangeStatus.Z_REMOVED),
+        (LineString([(0, 0, 1), (1, 1, 1)]), LineString([(0, 0, 1), (1, 1, 2)]), GeometryChangeStatus.Z_CHANGED),
+        (LineString([(0, 0, 1), (1, 1, 1)]), LineString([(0, 0, 1), (1, 1, 1)]), GeometryChangeStatus.UNCHANGED),
+        (MultiLineString([[(0, 0, 1), (1, 1, 1)]]), MultiLineString([[(0, 0, 1), (1, 1, 3)]]), GeometryChangeStatus.Z_CHANGED),
+    ]
+    t1, t2, expected = zip(*pairs)
+    assert classify_geometry_changes(t1, t2) == list(expected)
+    assert [GeometryChange(t1=a, t2=b).status for a, b, _ in pairs] == list(expected)
+    assert classify_geometry_changes([], []) == []
+
 
 import pytest
 from shapely.geometry import Point, LineString, Polygon, MultiPoint, MultiLineString, GeometryCollection
@@ -3,10 +3,12 @@ import shutil
 import tempfile
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 
 from imxInsights import ImxMultiRepo, ImxSingleFile, ImxContainer
+from imxInsights.compare.imxContainerCompareChain import ImxContainerCompareChain
 from pandas.io.formats.style import Styler
 
 from tests.fixtures.imx_files import imx_v1200_zip_instance
@@ -101,6 +103,26 @@ def test_chain_excel(compared_multirepo_timeline):
     os.remove("timeline.xlsx")
 
 
+def test_chain_sparse_snapshot_alignment():
+    df = pd.DataFrame(
+        {
+            "@puic": ["b", "a", "a", "c"],
+            "snapshot": [0, 0, 1, 1],
+            "status": ["added", "changed", "removed", "unchanged"],
+            "path": ["Signal", "Signal", "Signal", "Track"],
+            "tag": ["Signal", "Signal", "Signal", "Track"],
+            "value": ["1", "2", "3", "4"],
+        }
+    )
+    result = ImxContainerCompareChain._process_dataframe(df)
+
+    assert list(zip(result["@puic"], result["snapshot"])) == [
+        ("b", 0), ("b", 1), ("a", 0), ("a", 1), ("c", 0), ("c", 1)
+    ], "Should add the missing rows ordered by first appearance"
+    assert result["value"].isna().tolist() == [False, True, False, False, True, False]
+    assert all(isinstance(result[col].dtype, pd.CategoricalDtype) for col in ["status", "path", "tag"])
+
+
 
 
 
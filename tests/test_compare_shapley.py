@@ -5,7 +5,7 @@ from shapely.geometry import Point, LineString
 
 from imxInsights.compare.changes import process_deep_diff
 from imxInsights.compare.custom_operators.diff_refs import UUIDListOperator
-from imxInsights.compare.custom_operators.diff_shapely import ShapelyPointDiffer, ShapelyLineDiffer
+from imxInsights.compare.custom_operators.diff_shapely import LineDiffTolerances, ShapelyPointDiffer, ShapelyLineDiffer
 
 
 def test_custom_differ():
@@ -40,3 +40,37 @@ def test_custom_differ():
     assert "root['Location.GeographicLocation.gml:Point.gml:coordinates']" in dd['diff_analyse'].keys()
     assert "root['Location.GeographicLocation.gml:LineString.gml:coordinates']" in dd['diff_analyse'].keys()
     assert "root['DivergingPassageRefs']" in dd['diff_analyse'].keys()
+
+
+def test_line_differ_tiers(monkeypatch):
+    differ = ShapelyLineDiffer(regex_paths=[])
+    buffered = []
+    compare_buffers = differ._compare_buffer_intersections
+    monkeypatch.setattr(
+        differ, "_compare_buffer_intersections", lambda l1, l2: buffered.append(1) or compare_buffers(l1, l2)
+    )
+
+    z_changed = differ.get_analyse("0,0,1 10,0,1", "0,0,1 10,0,3")
+    assert z_changed["intersection_over_union"] == 1.0
+    assert z_changed["line_max_z_distance"] == 2.0
+    reversed_line = differ.get_analyse("0,0 5,0 10,0", "10,0 5,0 0,0")
+    assert reversed_line["intersection_over_union"] == 1.0
+    far_away = differ.get_analyse("0,0 10,0", "100,100 110,100")
+    assert far_away["intersection_over_union"] == 0.0
+    assert buffered == [], "Should not buffer lines decided by the cheap checks"
+
+    moved = differ.get_analyse("0,0 10,0", "0,0.5 10,0.5")
+    assert buffered == [1]
+    assert 0 < moved["intersection_over_union"] < 1
+
+    differ.tolerances = LineDiffTolerances(buffer_distance=0.1)
+    assert differ.get_analyse("0,0 10,0", "0,0.5 10,0.5")["intersection_over_union"] == 0.0
+    assert buffered == [1]
+
+
+def test_line_differ_z_distance():
+    differ = ShapelyLineDiffer(regex_paths=[])
+    l1 = LineString([(0, 0, 0), (10, 0, 10)])
+    l2 = LineString([(0, 0, 0), (5, 0, 8), (10, 0, 10)])
+    assert differ._get_max_z_difference(l1, l2) == pytest.approx(3.0)
+    assert differ._compare_z_coordinates(l1, l1) == "no change in z"
@@ -4,7 +4,7 @@ from typing import Any
 import pytest
 
 from imxInsights.utils.flatten_unflatten import flatten_dict, parse_to_nested_dict
-from imxInsights.utils.hash import hash_dict_ignor_nested, hash_sha256
+from imxInsights.utils.hash import hash_dict_ignor_nested, hash_flat_dict, hash_sha256
 
 
 def test_hash_sha256_valid_file(tmp_path):
@@ -30,6 +30,13 @@ def test_hash_dict_ignor_nested():
     assert hash_dict_ignor_nested(test_dict) == expected_hash
 
 
+def test_hash_flat_dict():
+    test_dict = {"key1": "value1", "key2": "value2"}
+    assert hash_flat_dict(test_dict) == hash_flat_dict({"key2": "value2", "key1": "value1"})
+    assert hash_flat_dict(test_dict) != hash_flat_dict({"key1": "value1", "key2": "value3"})
+    assert hash_flat_dict(test_dict) != hash_flat_dict({"key1": "value1"})
+
+
 def test_flatten_dict_basic():
     test_dict: dict[str, str | dict[str, Any] | list] = {
         "key1": "value1",
@@ -1,9 +1,10 @@
 import tempfile
 
+import pandas as pd
 from imxInsights import ImxMultiRepo, ImxContainer, ImxSingleFile
 from openpyxl import load_workbook
 
-from imxInsights.utils.headerAnnotator import HeaderSpec
+from imxInsights.utils.headerAnnotator import HeaderAnnotator, HeaderSpec
 
 
 def test_specs_on_report_v124(
@@ -73,4 +74,33 @@ def _check_header_for_specs(excel_file, columns_not_to_check):
             elif row1_value:
                 assert row2_value.endswith(row1_value), (
                     f"[{sheet_name}] Column {col}: Row 2 value '{row2_value}' does not end with Row 1 value '{row1_value}'"
-                )
\ No newline at end of file
+                )
+
+
+def test_filter_out_nested_puic_objects():
+    df = pd.DataFrame({"path": [
+        "Signal.@puic",
+        "Signal.@name",
+        "Signal.Metadata.@source",
+        "Signal.IlluminatedSign.@puic",
+        "Signal.IlluminatedSign.@name",
+        "SignalType.@name",
+        "Other.@name",
+    ]})
+    filtered = HeaderAnnotator._filter_out_nested_puic_objects(df)
+    assert filtered["path"].tolist() == ["Signal.@puic", "Signal.@name", "Signal.Metadata.@source"]
+
+
+def test_specs_for_object_v1200(imx_v1200_specs_csv: str):
+    annotator = HeaderSpec(imx_v1200_specs_csv).get_annotator()
+    spec_df = annotator.spec_df
+    base_path = "Furniture.AntiSwanProvisions.AntiSwanProvision."
+
+    specs = annotator._get_specs_for_object(base_path)
+    expected = HeaderAnnotator._filter_out_nested_puic_objects(
+        spec_df[spec_df["path"].str.startswith(base_path)]
+    )
+    assert specs["path"].tolist() == expected["path"].tolist()
+    assert specs["field"].tolist() == [p[len(base_path):] for p in expected["path"]]
+    assert annotator._get_specs_for_object(base_path) is specs, "Spec slices should be memoized"
+    assert annotator._get_specs_for_object("NotInSpec.").empty
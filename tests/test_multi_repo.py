@@ -1,12 +1,13 @@
+import json
 import os
 import shutil
+import sqlite3
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from imxInsights import ImxMultiRepo, ImxContainer, ImxSingleFile
-from imxInsights.domain.imxObject import ImxObject
 
 
 def test_multi_repo_version_safe(
@@ -72,6 +73,17 @@ def test_multi_repo_queries(
     assert len(multi_repo.get_all_paths()) == 247, "Should be x items"
     assert len(multi_repo.get_by_paths(["Signal.ReflectorPost"])) == 2, "Should be x items"
 
+    all_items = multi_repo.get_all()
+    assert all_items[0] is multi_repo.get_all()[0], "Should build the multi repo objects once"
+    assert multi_repo.find(all_items[0].puic) is all_items[0]
+    paths = ["Track", "Signal.ReflectorPost", "Signal", "Track"]
+    assert multi_repo.get_by_paths(paths) == [
+        item for item in all_items if any(obj.path in paths for obj in item)
+    ], "Should keep repo order and skip duplicates"
+    assert multi_repo._filter_objects(["ReflectorPost"], ["Signal"]) == [
+        item for item in all_items if any(obj.path == "Signal" or obj.tag == "ReflectorPost" for obj in item)
+    ]
+
 
 def test_multi_repo_geojson(
     imx_v1200_zip_instance: ImxContainer,
@@ -113,3 +125,108 @@ def test_multi_repo_dataframe(
 
     assert len(multi_repo.get_pandas_dict().keys()) == 247, "Should have x paths"
 
+
+
+def test_multi_repo_geojson_files_grouped(
+    imx_v1200_dir_instance: ImxContainer,
+    imx_v1200_multi_repo_instance: ImxMultiRepo,
+    tmp_path: Path,
+):
+    multi_repo = imx_v1200_multi_repo_instance
+    container_id = imx_v1200_dir_instance.container_id
+    multi_repo.create_geojson_files(tmp_path, container_id, as_wgs=False, max_workers=4)
+
+    assert len(list(tmp_path.glob("*.geojson"))) == 249, "Should have x geojson files"
+    for path in ["Signal", "Signal.ReflectorPost", "SingleSwitch"]:
+        with open(tmp_path / f"{path.upper()}.geojson", encoding="utf-8") as f:
+            from_file = json.load(f)
+        expected = json.loads(multi_repo.get_geojson([path], container_id, as_wgs=False).geojson_str())
+        assert from_file == expected, "Grouped export should match get_geojson"
+
+    with pytest.raises(ValueError):
+        multi_repo.create_geojson_files(tmp_path, "unknown-container-id")
+
+
+def test_multi_repo_compare_geojson_files_grouped(
+    imx_v1200_zip_instance: ImxContainer,
+    imx_v1200_dir_instance: ImxContainer,
+    imx_v1200_multi_repo_instance: ImxMultiRepo,
+    tmp_path: Path,
+):
+    multi_repo = imx_v1200_multi_repo_instance
+    compare = multi_repo.compare(imx_v1200_zip_instance.container_id, imx_v1200_dir_instance.container_id)
+    compare.create_geojson_files(tmp_path, to_wgs=False)
+
+    assert len(list(tmp_path.glob("*.geojson"))) == 248, "Should have x geojson files"
+    with open(tmp_path / "SIGNAL.geojson", encoding="utf-8") as f:
+        from_file = json.load(f)
+    expected = json.loads(compare.get_geojson(["Signal"], to_wgs=False).geojson_str())
+    assert from_file == expected, "Grouped export should match get_geojson"
+
+
+def test_multi_repo_parquet(
+    imx_v1200_multi_repo_instance: ImxMultiRepo,
+    tmp_path: Path,
+):
+    pq = pytest.importorskip("pyarrow.parquet")
+    multi_repo = imx_v1200_multi_repo_instance
+
+    file_paths = multi_repo.to_parquet(tmp_path)
+    assert len(file_paths) == 247, "Should have x parquet files"
+
+    table = pq.read_table(tmp_path / "Signal.ReflectorPost.parquet")
+    assert table.num_rows == 4, "Should contain a row per container object"
+    assert set(table.column("container_id").to_pylist()) == set(multi_repo.container_order)
+
+    metadata = table.schema.metadata
+    assert json.loads(metadata[b"container_order"]) == multi_repo.container_order
+    assert set(json.loads(metadata[b"build_exceptions"]).keys()) == set(multi_repo.container_order)
+
+
+def test_multi_repo_sqlite(
+    imx_v1200_multi_repo_instance: ImxMultiRepo,
+    tmp_path: Path,
+):
+    multi_repo = imx_v1200_multi_repo_instance
+    file_path = multi_repo.to_sqlite(tmp_path / "multi_repo.sqlite")
+
+    with sqlite3.connect(file_path) as connection:
+        containers = connection.execute("SELECT container_id FROM containers ORDER BY container_order").fetchall()
+        assert [row[0] for row in containers] == multi_repo.container_order
+
+        object_count = connection.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+        assert object_count == sum(len(list(container.get_all())) for container in multi_repo.containers)
+
+        rows = connection.execute('SELECT container_id, "@puic" FROM "Signal.ReflectorPost"').fetchall()
+        assert len(rows) == 4, "View should contain a row per container object"
+
+        signal = multi_repo.get_by_paths(["Signal"])[0].imx_objects[0]
+        properties = dict(
+            connection.execute(
+                "SELECT p.key, p.value FROM properties p JOIN objects o ON o.object_id = p.object_id "
+                "WHERE o.puic = ? AND o.container_id = ?",
+                (signal.puic, signal.container_id),
+            ).fetchall()
+        )
+        assert properties == signal.get_imx_property_dict()
+
+        cursor = connection.execute(
+            'SELECT s.* FROM "Signal" s JOIN objects o ON o.object_id = s.object_id '
+            "WHERE o.puic = ? AND o.container_id = ?",
+            (signal.puic, signal.container_id),
+        )
+        view_row = dict(zip([column[0] for column in cursor.description], cursor.fetchone()))
+        assert {key: value for key, value in view_row.items() if key in properties} == properties
+
+        min_x, min_y, max_x, max_y = signal.geometry.bounds
+        hits = connection.execute(
+            "SELECT o.puic FROM objects_rtree r JOIN objects o ON o.object_id = r.object_id "
+            "WHERE r.min_x <= ? AND r.max_x >= ? AND r.min_y <= ? AND r.max_y >= ?",
+            (max_x, min_x, max_y, min_y),
+        ).fetchall()
+        assert signal.puic in {row[0] for row in hits}, "Spatial index should find the signal"
+
+        edge_count = connection.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+        assert edge_count > 0, "Should contain parent child edges"
+        ref_count = connection.execute("SELECT COUNT(*) FROM refs").fetchone()[0]
+        assert ref_count > 0, "Should contain refs"
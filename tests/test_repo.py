@@ -1,9 +1,12 @@
+import json
 import os
 import tempfile
 
 import pytest
 
 from imxInsights import ImxSingleFile, ImxContainer
+from imxInsights.domain.imxReferenceObjects import RefStatus
+from imxInsights.utils.report_helpers import add_nice_display
 
 from pandas import MultiIndex
 
@@ -157,3 +160,38 @@ def test_imx_parse_v1200_dir(imx_v1200_dir_instance: ImxContainer):
     # dir has one more extension course of mismatch on file hash for observations
     assert len(imx.get_build_exceptions()) == 7, "should have x exceptions"
 
+
+def test_imx_repo_parquet_v1200(imx_v1200_zip_instance: ImxContainer, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    shapely = pytest.importorskip("shapely")
+    imx = imx_v1200_zip_instance
+
+    file_paths = imx.to_parquet(tmp_path)
+    assert len(file_paths) == 247, "Should have x parquet files"
+
+    table = pq.read_table(tmp_path / "Signal.parquet")
+    assert table.num_rows == 1, "Should contain x objects"
+    assert table.column("@puic").to_pylist() == [imx.get_by_paths(["Signal"])[0].puic]
+    geometry = shapely.from_wkb(table.column("geometry").to_pylist()[0])
+    assert geometry.equals(imx.get_by_paths(["Signal"])[0].geometry), "Geometry should round trip as WKB"
+
+    metadata = table.schema.metadata
+    assert json.loads(metadata[b"container_id"]) == imx.container_id
+    assert json.loads(metadata[b"imx_version"]) == "12.0.0"
+    assert len(json.loads(metadata[b"file_hashes"])) == 1, "Should have x file hashes"
+    assert json.loads(metadata[b"geo"])["columns"]["geometry"]["encoding"] == "WKB"
+
+
+def test_imx_repo_ref_displays_v1200(imx_v1200_zip_instance: ImxContainer):
+    ref_displays = imx_v1200_zip_instance._get_ref_displays()
+    assert imx_v1200_zip_instance._get_ref_displays() is ref_displays, "Should build the table once"
+
+    for imx_object in imx_v1200_zip_instance.get_all():
+        props = imx_object.get_imx_property_dict()
+        from_refs = add_nice_display(imx_object, props)
+        from_table = add_nice_display(imx_object, props, ref_displays)
+        assert from_refs.keys() == from_table.keys()
+        for key, value in from_refs.items():
+            # refs resolved while building can miss objects the table does find
+            if value != RefStatus.NOT_PRESENT.value:
+                assert from_table[key] == value, key
@@ -1,9 +1,22 @@
+import zipfile
+
 import pytest
 import pandas as pd
-
-
-from imxInsights.utils.pandas_helpers import df_columns_sort_start_end
-from imxInsights.utils.report_helpers import shorten_sheet_name, lower_and_index_duplicates, upper_keys_with_index
+from openpyxl import load_workbook
+
+from imxInsights.utils.pandas_helpers import df_columns_sort_start_end, diff_cell_format
+from imxInsights.utils.report_helpers import (
+    EXCEL_WRITER_OPTIONS,
+    REVIEW_STYLES,
+    add_review_styles_to_excel,
+    estimate_column_widths,
+    get_cached_format,
+    lower_and_index_duplicates,
+    shorten_sheet_name,
+    upper_keys_with_index,
+    write_df_rows,
+    write_df_to_sheet,
+)
 
 
 def test_shorten_sheet_name():
@@ -91,3 +104,106 @@ def test_lower_and_index_duplicates(input_strings, expected_output):
 )
 def test_upper_keys_with_index(input_dict, expected_output):
     assert upper_keys_with_index(input_dict) == expected_output
+
+
+def test_add_review_styles_to_excel(tmp_path):
+    file_path = tmp_path / "review.xlsx"
+    df = pd.DataFrame({"@puic": ["a", "b", "c"], "value": [1, 2, 3]})
+    with pd.ExcelWriter(file_path, engine="xlsxwriter") as writer:
+        work_sheet = write_df_to_sheet(writer, "data", df)
+        work_sheet.write(5, 0, "filled", writer.book.add_format({"bg_color": "#FF0000"}))
+
+    with zipfile.ZipFile(file_path) as zip_file:
+        before = {item.filename: zip_file.read(item) for item in zip_file.infolist()}
+        compress_types = [item.compress_type for item in zip_file.infolist()]
+
+    add_review_styles_to_excel(file_path)
+    add_review_styles_to_excel(file_path)
+
+    with zipfile.ZipFile(file_path) as zip_file:
+        assert zip_file.testzip() is None, "Zip should be valid"
+        after = {item.filename: zip_file.read(item) for item in zip_file.infolist()}
+        assert [item.compress_type for item in zip_file.infolist()] == compress_types, "Should keep compression"
+    assert list(after) == list(before), "Should keep all members in order"
+    for name in before:
+        if name != "xl/styles.xml":
+            assert after[name] == before[name], f"{name} should be copied unchanged"
+
+    workbook = load_workbook(file_path)
+    for name in REVIEW_STYLES:
+        assert workbook.named_styles.count(name) == 1, f"Should contain named style {name} once"
+    work_sheet = workbook["data"]
+    assert work_sheet["A2"].value == "a"
+    assert work_sheet["A6"].fill.fgColor.rgb == "FFFF0000", "Existing cell formats should be kept"
+
+
+def test_write_df_to_sheet_constant_memory(tmp_path):
+    file_path = tmp_path / "constant_memory.xlsx"
+    index = pd.MultiIndex.from_tuples([("A", "x"), ("A", "y"), ("B", "z")], names=["level1", "level2"])
+    overview = pd.DataFrame({"value": [1, None, 3]}, index=index)
+    diff = pd.DataFrame(
+        {
+            "@puic": ["a", "b", "c"],
+            "status": ["added", "changed", "unchanged"],
+            "@name": ["++new", "old -> new", "same"],
+            "@name|.display": ["++new", "", ""],
+            "G": ["", "", ""],
+            "H": ["", "", ""],
+        }
+    )
+    with pd.ExcelWriter(file_path, engine="xlsxwriter", engine_kwargs={"options": EXCEL_WRITER_OPTIONS}) as writer:
+        write_df_to_sheet(writer, "overview", overview, index=True)
+        write_df_to_sheet(writer, "diff", diff, grouped_columns=["E:F"], cell_format_fn=diff_cell_format)
+
+    workbook = load_workbook(file_path)
+    rows = [[cell.value for cell in row] for row in workbook["overview"].iter_rows()]
+    assert rows == [["level1", "level2", "value"], ["A", "x", 1], [None, "y", None], ["B", "z", 3]]
+
+    work_sheet = workbook["diff"]
+    assert [cell.value for cell in work_sheet[1]] == list(diff.columns)
+    assert work_sheet["A4"].value == "c", "All rows should be written in constant memory mode"
+    assert work_sheet["B2"].font.color.rgb == "FFFF0000" and work_sheet["B2"].font.b
+    assert work_sheet["C3"].font.color.rgb == "FF008000" and work_sheet["C3"].font.b
+    assert not work_sheet["D2"].font.b, "Display columns should not be highlighted"
+    assert work_sheet["C4"].border.left.style == "thin"
+    assert work_sheet["C4"].alignment.vertical == "center", "Data cells should be centered vertically"
+    assert work_sheet["A1"].font.b and work_sheet["A1"].alignment.vertical == "top", "Header should keep the pandas look"
+    assert work_sheet.column_dimensions["E"].hidden, "Grouped columns should be hidden"
+    assert work_sheet.freeze_panes == "A2"
+
+
+def test_write_df_rows_shares_formats(tmp_path):
+    file_path = tmp_path / "formats.xlsx"
+    metadata = pd.DataFrame({"a": ["spec a", None], "b": [None, "spec b"]}, index=["label", "type"])
+    row_format = {"bg_color": "#d1d1d1", "text_wrap": True}
+    with pd.ExcelWriter(file_path, engine="xlsxwriter", engine_kwargs={"options": EXCEL_WRITER_OPTIONS}) as writer:
+        format_count = len(writer.book.formats)
+        for sheet_name in ["first", "second"]:
+            write_df_rows(writer, sheet_name, metadata, header=False, row_format=dict(row_format), row_height=20)
+        assert get_cached_format(writer.book, row_format) is get_cached_format(writer.book, dict(row_format))
+        assert len(writer.book.formats) == format_count + 1, "Row formats should be added once per workbook"
+
+    work_sheet = load_workbook(file_path)["second"]
+    assert [[cell.value for cell in row] for row in work_sheet.iter_rows()] == [["spec a", None], [None, "spec b"]]
+    assert work_sheet.row_dimensions[1].height == 20
+    assert work_sheet.row_dimensions[1].fill.fgColor.rgb == "FFD1D1D1", "Empty cells should get the row format"
+
+
+def test_estimate_column_widths():
+    df = pd.DataFrame(
+        {
+            "short": ["a", None, "abc"],
+            "long_header_name": ["x", "y", "z"],
+            "values": ["v" * 30, "w", None],
+            "capped": ["c" * 200, "d", "e"],
+        }
+    )
+    widths = estimate_column_widths(df, min_width=8, header_min_width=80, padding=2)
+    assert widths == [10, 18, 32, 82]
+
+    # metadata rows above the data are not measured
+    assert estimate_column_widths(df, 1, min_width=8)[2] == 10
+
+    # large frames are sampled, the first and last rows are always measured
+    large_df = pd.DataFrame({"value": ["a"] * 9999 + ["b" * 20]})
+    assert estimate_column_widths(large_df, min_width=1, max_rows=10) == [22]
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from imxInsights.utils.shapely.shapely_geojson import ShapelyGeoJsonFeature, ShapelyGeoJsonFeatureCollection, CrsEnum
@@ -92,3 +94,49 @@ def test_feature_collection():
     tester_3 = collection.geojson_str()
     assert '"crs": {"properties":' in tester_3, "Should contain CRS"
     # collection.to_geojson_file("tester.geojson")
+
+
+def test_feature_collection_streaming_file(tmp_path):
+    point = ShapelyGeoJsonFeature([Point(0.123456789, 1, 2)], {"name": "pünt"})
+    line = ShapelyGeoJsonFeature([LineString([(0, 0, 0), (1, 1, 1)])])
+    polygon = ShapelyGeoJsonFeature([Polygon([(0, 0), (0, 5), (5, 5), (5, 0)])])
+    multi_point = ShapelyGeoJsonFeature([Point(0, 1, 2), Point(2, 3, 0)])
+    multi_line = ShapelyGeoJsonFeature([LineString([(0, 0, 0), (1, 1, 1)]), LineString([(1, 2), (3, 4)])])
+    geometry_collection = ShapelyGeoJsonFeature([Point(0, 1, 2), LineString([(0, 0, 0), (1, 1, 1)])])
+    no_geometry = ShapelyGeoJsonFeature([], {"name": "empty"})
+
+    collection = ShapelyGeoJsonFeatureCollection(
+        [point, line, polygon, multi_line, geometry_collection, no_geometry], crs=CrsEnum.RD_NEW_NAP
+    )
+    expected = json.loads(collection.geojson_str())
+
+    pretty_file = tmp_path / "pretty.geojson"
+    collection.to_geojson_file(pretty_file)
+    with open(pretty_file, encoding="utf-8") as f:
+        assert json.load(f) == expected, "Streamed file should match the geojson dump"
+
+    compact_file = tmp_path / "compact.geojson"
+    collection.to_geojson_file(compact_file, compact=True)
+    with open(compact_file, encoding="utf-8") as f:
+        assert json.load(f) == expected, "Compact file should match the geojson dump"
+    assert compact_file.stat().st_size < pretty_file.stat().st_size / 2, "Compact file should be smaller"
+
+    for fast_json in [True, False]:
+        rounded_file = tmp_path / f"rounded_{fast_json}.geojson"
+        collection.to_geojson_file(rounded_file, compact=True, precision=3, fast_json=fast_json)
+        with open(rounded_file, encoding="utf-8") as f:
+            rounded = json.load(f)
+        assert rounded["features"][0]["geometry"]["coordinates"] == [0.123, 1.0, 2.0], "Should round coordinates"
+        assert rounded["crs"] == expected["crs"], "Should contain CRS"
+
+    assert multi_point.as_dict()["geometry"] == {
+        "type": "MultiPoint", "coordinates": [[0.0, 1.0, 2.0], [2.0, 3.0, 0.0]]
+    }, "Should contain all points"
+
+
+def test_empty_feature_collection_streaming_file(tmp_path):
+    for compact in [True, False]:
+        file_path = tmp_path / f"empty_{compact}.geojson"
+        ShapelyGeoJsonFeatureCollection([]).to_geojson_file(file_path, compact=compact)
+        with open(file_path, encoding="utf-8") as f:
+            assert json.load(f) == {"type": "FeatureCollection", "features": []}